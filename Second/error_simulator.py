@@ -1,5 +1,7 @@
 import random
 
+import numpy as np
+
 
 class ErrorSimulator:
     @staticmethod
@@ -16,3 +18,39 @@ class ErrorSimulator:
         bits_list[position] = '0' if bits_list[position] == '1' else '1'
         
         return ''.join(bits_list), position + 1  # возвращаем 1-based позицию
+
+    @staticmethod
+    def make_block_errors(blocks, errors_per_block, rng=None):
+        """Вносит в каждый блок (строку матрицы) заданное число ошибок в различных позициях"""
+        rng = np.random.default_rng() if rng is None else rng
+        blocks = np.array(blocks, dtype=np.uint8)
+        count, length = blocks.shape
+
+        errors_per_block = np.broadcast_to(errors_per_block, (count,))
+        if errors_per_block.max(initial=0) > length:
+            raise ValueError(f"Число ошибок больше длины блока {length}")
+
+        # Случайная перестановка позиций в каждой строке, берём первые e позиций
+        order = rng.random((count, length)).argsort(axis=1)
+        mask = np.arange(length) < errors_per_block[:, np.newaxis]
+        rows = np.broadcast_to(np.arange(count)[:, np.newaxis], (count, length))
+        blocks[rows[mask], order[mask]] ^= 1
+
+        return blocks
+
+    @staticmethod
+    def make_bursts(stream, burst_count, burst_length, rng=None):
+        """Вносит в битовый поток burst_count пакетов ошибок длиной burst_length"""
+        rng = np.random.default_rng() if rng is None else rng
+        stream = np.array(stream, dtype=np.uint8)
+
+        if burst_length > stream.size:
+            raise ValueError(f"Длина пакета {burst_length} больше длины потока {stream.size}")
+
+        starts = rng.integers(0, stream.size - burst_length + 1, size=burst_count)
+        positions = (starts[:, np.newaxis] + np.arange(burst_length)).ravel()
+
+        # Пересекающиеся пакеты не должны отменять друг друга
+        stream[np.unique(positions)] ^= 1
+
+        return stream, starts
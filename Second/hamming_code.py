@@ -1,83 +1,115 @@
+from functools import lru_cache
+
 import numpy as np
 
 
+# Результат обработки блока
+CLEAN = 0  # ошибок нет
+CORRECTED = 1  # одиночная ошибка исправлена
+UNCORRECTABLE = 2  # обнаружена двойная ошибка (только SECDED)
+
+STATUS_NAMES = {
+    CLEAN: 'clean',
+    CORRECTED: 'corrected',
+    UNCORRECTABLE: 'uncorrectable',
+}
+
+
+@lru_cache(maxsize=None)
+def _code_tables(r, l, extended):
+    """
+    Таблицы кода для пары (r, l), вычисляются один раз на процесс.
+    Возвращает: (H, позиции информационных битов, позиция -> бит синдрома,
+    синдром -> индекс исправляемого бита, синдром -> статус)
+    """
+    n = 2**r - 1
+    positions = np.arange(1, n + 1)
+
+    # H: позиция pos участвует в проверочном бите 2^i
+    parity_matrix = np.array([(positions >> i) & 1 for i in range(r)], dtype=np.uint8)
+
+    # Первые l позиций, не являющихся степенью двойки
+    data_positions = np.flatnonzero(positions & (positions - 1))[:l]
+
+    # Вес бита позиции в синдроме: синдром равен номеру позиции (1-based)
+    weights = 1 << np.arange(r)
+
+    # В SECDED к синдрому добавляется старший бит - общая чётность
+    size = 2 ** (r + 1) if extended else 2**r
+    flip = np.full(size, -1, dtype=np.intp)
+    status = np.full(size, CORRECTED, dtype=np.uint8)
+    status[0] = CLEAN
+
+    for key in range(1, size):
+        syndrome = key & n
+        if not extended:
+            flip[key] = syndrome - 1
+        elif key >> r:
+            # Нечётное число ошибок: одиночная, при нулевом синдроме
+            # ошибка в самом бите общей чётности
+            flip[key] = syndrome - 1 if syndrome else n
+        else:
+            # Чётность сошлась, а синдром нет - две ошибки
+            status[key] = UNCORRECTABLE
+
+    for table in (parity_matrix, data_positions, flip, status):
+        table.setflags(write=False)
+
+    return parity_matrix, data_positions, weights, flip, status
+
+
 class HammingCode:
-    def __init__(self, r, l):
+    def __init__(self, r, l, extended=False):
         self.l = l # изначальная длинна слова
         self.r = r # количество проверочных битов
         self.n = 2**r - 1  # общая длина кодового слова
         self.k = self.n - r  # количество информационных битов
-        self.parity_matrix = self._generate_parity_matrix()
-    
-    # H
-    def _generate_parity_matrix(self):
-        matrix = []
-        for i in range(self.r):
-            row = []
-            for pos in range(1, self.n + 1):
-                # Проверка на участие позиции pos в проверочном бите 2^i
-                if pos & (1 << i):
-                    row.append(1)
-                else:
-                    row.append(0)
-            matrix.append(row)
-        return np.array(matrix)
+        self.extended = extended  # SECDED: добавочный бит общей чётности
+        self.length = self.n + 1 if extended else self.n  # длина передаваемого блока
+        (self.parity_matrix, self._data_positions, self._weights,
+         self._flip_table, self._status_table) = _code_tables(r, l, extended)
     
     def get_parity_positions(self):
-        return [2**i for i in range(self.r)]
+        positions = [2**i for i in range(self.r)]
+        if self.extended:
+            positions.append(self.length)
+        return positions
     
     def print_table(self):
         print(f"  П-и: {' '.join(f'{i+1:2d}' for i in range(self.n))}")
         for i, row in enumerate(self.parity_matrix):
             print(f"   r{i+1}: {' '.join(f'{bit:2d}' for bit in row)}")
     
+    @staticmethod
+    def _to_array(bits):
+        return np.frombuffer(bits.encode('ascii'), dtype=np.uint8) - ord('0')
+
+    @staticmethod
+    def _to_string(array):
+        return (np.asarray(array, dtype=np.uint8) + ord('0')).tobytes().decode('ascii')
+
     def encode(self, data_bits):
-        code_word = [0] * self.n
-        data_idx = 0
-        
-        # Размещаем информационные биты
-        for pos in range(1, self.n + 1):
-            if pos & (pos - 1) != 0:  # не степень двойки
-                if data_idx < len(data_bits):
-                    code_word[pos - 1] = int(data_bits[data_idx])
-                    data_idx += 1
-        
-        # Вычисляем проверочные биты
-        for i in range(self.r):
-            parity_pos = (1 << i) - 1  # 2^i - 1 (позиция в массиве)
-            parity = 0
-            
-            # Суммируем биты, контролируемые этим проверочным битом
-            for pos in range(self.n):
-                if self.parity_matrix[i][pos] == 1 and pos != parity_pos:
-                    parity ^= code_word[pos]
-            
-            code_word[parity_pos] = parity
-        
-        return ''.join(str(b) for b in code_word)
+        data = self._to_array(data_bits[:len(self._data_positions)])
+        padded = np.zeros(len(self._data_positions), dtype=np.uint8)
+        padded[:len(data)] = data
+        return self._to_string(self.encode_blocks(padded[np.newaxis, :])[0])
     
     def calculate_syndrome(self, received_bits):
-        syndrome = 0
-        received = [int(b) for b in received_bits]
-        
-        for i in range(self.r):
-            parity = 0
-            for pos in range(self.n):
-                if self.parity_matrix[i][pos] == 1:
-                    parity ^= received[pos]
-            syndrome |= (parity << i)
+        return int(self._syndromes(self._to_array(received_bits)[np.newaxis, :])[0])
         
-        return syndrome
+    def get_status(self, syndrome):
+        """Статус блока по синдрому: CLEAN, CORRECTED или UNCORRECTABLE"""
+        return int(self._status_table[syndrome])
     
     def correct_error(self, received_bits, syndrome):
-        if syndrome == 0:
+        error_pos = self._flip_table[syndrome]  # синдром указывает на позицию (1-based)
+
+        # Нулевой синдром или двойная ошибка - блок не трогаем
+        if error_pos < 0 or error_pos >= len(received_bits):
             return received_bits
         
         received_list = list(received_bits)
-        error_pos = syndrome - 1  # синдром указывает на позицию (1-based)
-        
-        if 0 <= error_pos < len(received_list):
-            received_list[error_pos] = '0' if received_list[error_pos] == '1' else '1'
+        received_list[error_pos] = '0' if received_list[error_pos] == '1' else '1'
         
         return ''.join(received_list)
     
@@ -88,4 +120,47 @@ class HammingCode:
             if pos & (pos - 1) != 0:  # не степень двойки
                 data_bits.append(code_word[pos - 1])
 
-        return ''.join([bit for i, bit in enumerate(data_bits) if i < self.l])
\ No newline at end of file
+        return ''.join([bit for i, bit in enumerate(data_bits) if i < self.l])
+
+    # Пакетная обработка: блоки - строки матрицы из 0/1
+
+    def encode_blocks(self, data):
+        """Кодирует матрицу (m, l) информационных битов в матрицу (m, length)"""
+        data = np.asarray(data, dtype=np.uint8)
+        blocks = np.zeros((data.shape[0], self.length), dtype=np.uint8)
+        blocks[:, self._data_positions] = data[:, :len(self._data_positions)]
+
+        # Проверочные позиции пока нулевые, поэтому H * c даёт сами проверочные биты
+        parity = (blocks[:, :self.n].astype(np.intp) @ self.parity_matrix.T) & 1
+        blocks[:, self._weights - 1] = parity
+
+        if self.extended:
+            blocks[:, self.n] = blocks[:, :self.n].sum(axis=1) & 1
+
+        return blocks
+
+    def _syndromes(self, blocks):
+        bits = (blocks[:, :self.n].astype(np.intp) @ self.parity_matrix.T) & 1
+        syndromes = bits @ self._weights
+        if self.extended:
+            overall = blocks.sum(axis=1, dtype=np.intp) & 1
+            syndromes |= overall << self.r
+        return syndromes
+
+    def decode_blocks(self, blocks):
+        """
+        Исправляет и декодирует матрицу (m, length) принятых блоков
+        Возвращает: (матрица (m, l) информационных битов, статусы блоков, отчёт)
+        """
+        blocks = np.array(blocks, dtype=np.uint8)
+        syndromes = self._syndromes(blocks)
+
+        flip = self._flip_table[syndromes]
+        rows = np.flatnonzero(flip >= 0)
+        blocks[rows, flip[rows]] ^= 1
+
+        statuses = self._status_table[syndromes]
+        counts = np.bincount(statuses, minlength=len(STATUS_NAMES))
+        report = {name: int(counts[status]) for status, name in STATUS_NAMES.items()}
+
+        return blocks[:, self._data_positions], statuses, report
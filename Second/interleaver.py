@@ -0,0 +1,46 @@
+import numpy as np
+
+
+class BlockInterleaver:
+    """
+    Блочный перемежитель: depth кодовых слов записываются в таблицу по строкам
+    и передаются по столбцам. Пакет ошибок длиной до depth бит попадает
+    в разные кодовые слова, по одной ошибке в каждое.
+    """
+
+    def __init__(self, depth):
+        if depth < 1:
+            raise ValueError(f"Глубина перемежения должна быть положительной: {depth}")
+        self.depth = depth
+
+    def interleave(self, blocks):
+        """
+        Перемежает матрицу (m, length) кодовых слов в битовый поток.
+        Число блоков дополняется нулевыми словами до кратного depth.
+        """
+        blocks = np.asarray(blocks, dtype=np.uint8)
+        count, length = blocks.shape
+
+        padding = -count % self.depth
+        if padding:
+            blocks = np.vstack([blocks, np.zeros((padding, length), dtype=np.uint8)])
+
+        frames = blocks.reshape(-1, self.depth, length)
+        return frames.transpose(0, 2, 1).ravel()
+
+    def deinterleave(self, stream, length, count=None):
+        """
+        Восстанавливает матрицу кодовых слов длины length из битового потока.
+        count - исходное число блоков (отбрасывает дополнение).
+        """
+        stream = np.asarray(stream, dtype=np.uint8)
+        if stream.size % (self.depth * length):
+            raise ValueError(f"Длина потока {stream.size} не кратна {self.depth}x{length}")
+
+        frames = stream.reshape(-1, length, self.depth)
+        blocks = frames.transpose(0, 2, 1).reshape(-1, length)
+        return blocks if count is None else blocks[:count]
+
+    def latency(self, length):
+        """Задержка в битах: до приёма всего кадра декодировать нельзя"""
+        return self.depth * length
@@ -1,11 +1,19 @@
 import sys
-from hamming_code import HammingCode
+import numpy as np
+from hamming_code import HammingCode, STATUS_NAMES
 from bit_generator import BitGenerator
 from error_simulator import ErrorSimulator
+from interleaver import BlockInterleaver
+
+BATCH_SIZE = 10000
+INTERLEAVER_DEPTH = 16
+BURST_COUNT = 20
 
 
 def main():
     table_size = int(sys.argv[1])
+    # SECDED: python main.py <r> secded
+    extended = len(sys.argv) > 2 and sys.argv[2] == 'secded'
     data_bits = 2**table_size - 1 - table_size
     
     # 1-2.
@@ -13,7 +21,7 @@ def main():
     print(f"\nИзначальная комбинация ({data_bits} бит): {original_bits}")
     
     # 3-4.
-    hamming = HammingCode(table_size, data_bits)
+    hamming = HammingCode(table_size, data_bits, extended=extended)
     print(f"\nПроверочная таблица ({table_size}x{2**table_size - 1}):")
     hamming.print_table()
     
@@ -32,7 +40,7 @@ def main():
     
     # 7-8.
     syndrome = hamming.calculate_syndrome(corrupted)
-    print(f"\nСиндром ошибки: {syndrome}")
+    print(f"\nСиндром ошибки: {syndrome} ({STATUS_NAMES[hamming.get_status(syndrome)]})")
     
     corrected = hamming.correct_error(corrupted, syndrome)
     print(f"\nИсправленная комбинация: {corrected}")
@@ -47,6 +55,29 @@ def main():
     else:
         print("Данные не совпадают!")
 
+    # 10. Пакетное декодирование: 0, 1 или 2 ошибки в каждом блоке
+    rng = np.random.default_rng()
+    data = rng.integers(0, 2, size=(BATCH_SIZE, data_bits), dtype=np.uint8)
+    blocks = hamming.encode_blocks(data)
+    received = ErrorSimulator.make_block_errors(blocks, rng.integers(0, 3, size=BATCH_SIZE), rng)
+
+    decoded_blocks, _, report = hamming.decode_blocks(received)
+    restored = np.all(decoded_blocks == data, axis=1).sum()
+    print(f"\nПакет из {BATCH_SIZE} блоков: {report}")
+    print(f"Восстановлено без искажений: {restored}")
+
+    # 11. Пакеты ошибок длиной INTERLEAVER_DEPTH с перемежением и без
+    for depth in (1, INTERLEAVER_DEPTH):
+        interleaver = BlockInterleaver(depth)
+        stream = interleaver.interleave(blocks)
+        received_stream, _ = ErrorSimulator.make_bursts(stream, BURST_COUNT, INTERLEAVER_DEPTH, rng)
+        received = interleaver.deinterleave(received_stream, hamming.length, BATCH_SIZE)
+
+        decoded_blocks, _, report = hamming.decode_blocks(received)
+        restored = np.all(decoded_blocks == data, axis=1).sum()
+        print(f"\nГлубина перемежения {depth} (задержка {interleaver.latency(hamming.length)} бит): {report}")
+        print(f"Восстановлено без искажений: {restored}")
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,119 @@
+import random
+from math import gcd, prod
+from typing import List, Optional
+
+# Простые до SMALL_PRIME_LIMIT для пробного деления
+SMALL_PRIME_LIMIT = 1000
+
+
+def primes_below(limit: int) -> List[int]:
+    is_prime = bytearray(b'\x01') * limit
+    is_prime[0:2] = b'\x00\x00'
+    for i in range(2, int(limit ** 0.5) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return [i for i in range(limit) if is_prime[i]]
+
+
+SMALL_PRIMES = primes_below(SMALL_PRIME_LIMIT)
+SMALL_PRIME_SET = frozenset(SMALL_PRIMES)
+
+# Произведение всех малых простых: один gcd заменяет 168 делений
+PRIMORIAL = prod(SMALL_PRIMES)
+
+# Детерминированные наборы оснований Миллера-Рабина: (граница n, основания)
+# Для n < границы проверка по всем основаниям набора точна
+DETERMINISTIC_BASES = [
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (1 << 64, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+]
+
+# Число случайных оснований для n >= 2^64 (вероятность ошибки < 4^-rounds)
+DEFAULT_ROUNDS = 20
+
+_rng = random.Random()
+
+
+def trial_division_check(n: int) -> Optional[bool]:
+    """
+    Пробное деление на малые простые.
+    Возвращает True/False, если ответ известен, иначе None.
+    """
+    if n < 2:
+        return False
+    if n < SMALL_PRIME_LIMIT:
+        return n in SMALL_PRIME_SET
+    if gcd(n, PRIMORIAL) != 1:
+        return False
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True  # нет делителей до sqrt(n)
+    return None
+
+
+def decompose(n: int):
+    """Находит s и d такие, что n - 1 = 2^s * d, где d нечетно"""
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    return d >> s, s
+
+
+def strong_probable_prime(n: int, a: int, d: int, s: int) -> bool:
+    """Сильный тест на псевдопростоту по основанию a"""
+    x = pow(a, d, n)
+    n_minus_1 = n - 1
+
+    if x == 1 or x == n_minus_1:
+        return True
+
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n_minus_1:
+            return True
+        if x == 1:
+            return False
+
+    return False
+
+
+def deterministic_bases(n: int) -> Optional[tuple]:
+    """Набор оснований, достаточный для точной проверки n, или None при n >= 2^64"""
+    for bound, bases in DETERMINISTIC_BASES:
+        if n < bound:
+            return bases
+    return None
+
+
+def is_prime(n: int, rounds: int = DEFAULT_ROUNDS, rng: Optional[random.Random] = None) -> bool:
+    """
+    Проверка на простоту:
+    1. пробное деление через gcd с праймориалом малых простых;
+    2. детерминированный Миллер-Рабин для n < 2^64;
+    3. основание 2 и rounds случайных оснований для больших n.
+    """
+    known = trial_division_check(n)
+    if known is not None:
+        return known
+
+    d, s = decompose(n)
+
+    bases = deterministic_bases(n)
+    if bases is not None:
+        return all(strong_probable_prime(n, a, d, s) for a in bases)
+
+    if not strong_probable_prime(n, 2, d, s):
+        return False
+
+    rng = _rng if rng is None else rng
+    for _ in range(rounds):
+        a = rng.randrange(3, n - 1)
+        if not strong_probable_prime(n, a, d, s):
+            return False
+
+    return True
@@ -0,0 +1,326 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, List
+
+from rsa import EXPONENTIATION_METHODS, RSA, BackendUnavailable, ModularExponentiation, get_backend
+
+KEY_SIZES = (512, 1024, 2048)
+REPEATS = 5
+
+# Сравнение с библиотекой: размеры модуля, число замеров генерации ключей
+# (она на порядки дольше остальных операций) и файл отчёта
+SUITE_KEY_SIZES = (512, 1024, 2048, 3072, 4096)
+KEYGEN_REPEATS = 3
+SUITE_PATH = './pr11-12/rsa_benchmark.json'
+PERCENTILES = (50, 90, 99)
+
+# Нагрузка блочного режима: число сообщений и размер каждого в байтах
+MESSAGE_COUNT = 64
+MESSAGE_SIZE = 4096
+
+
+def median_ms(func: Callable, repeats: int = REPEATS) -> float:
+    """Медиана времени вызова func в мс (после одного прогревочного вызова)"""
+    return statistics.median(sample_ns(func, repeats)) / 1e6
+
+
+def sample_ns(func: Callable, repeats: int = REPEATS) -> List[int]:
+    """Замеры времени вызова func в нс (после одного прогревочного вызова)"""
+    func()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    return samples
+
+
+def latency_stats(samples_ns: List[int]) -> dict:
+    """Операций в секунду и перцентили задержки PERCENTILES в мс"""
+    samples_ms = sorted(sample / 1e6 for sample in samples_ns)
+    if len(samples_ms) > 1:
+        cuts = statistics.quantiles(samples_ms, n=100, method='inclusive')
+        percentiles = {f'p{p}_ms': cuts[p - 1] for p in PERCENTILES}
+    else:
+        percentiles = {f'p{p}_ms': samples_ms[0] for p in PERCENTILES}
+
+    mean_ms = statistics.fmean(samples_ms)
+    return {
+        'ops_per_sec': 1e3 / mean_ms if mean_ms else float('inf'),
+        'mean_ms': mean_ms,
+        **percentiles,
+        'min_ms': samples_ms[0],
+        'max_ms': samples_ms[-1],
+        'samples': len(samples_ms),
+    }
+
+
+def benchmark_crt(key_sizes: Iterable[int] = KEY_SIZES, repeats: int = REPEATS) -> list:
+    """Сравнение обычного дешифрования и дешифрования по КТО для разных размеров модуля"""
+    rows = []
+    message = b"CRT benchmark"
+
+    for key_bits in key_sizes:
+        keypair = RSA.generate_keys(key_bits // 2)
+        ciphertext = RSA.encrypt(message, keypair.e, keypair.n)
+        assert RSA.decrypt_crt(ciphertext, keypair) == message
+
+        plain = median_ms(lambda: RSA.decrypt(ciphertext, keypair.d, keypair.n), repeats)
+        crt = median_ms(lambda: RSA.decrypt_crt(ciphertext, keypair), repeats)
+        rows.append({'key_bits': key_bits, 'decrypt_ms': plain, 'decrypt_crt_ms': crt, 'speedup': plain / crt})
+
+    print(f"\n{'Модуль':>8} {'C^D mod N, мс':>15} {'КТО, мс':>10} {'Ускорение':>10}")
+    for row in rows:
+        print(f"{row['key_bits']:>8} {row['decrypt_ms']:>15.2f} {row['decrypt_crt_ms']:>10.2f} {row['speedup']:>9.2f}x")
+
+    return rows
+
+
+def benchmark_exponentiation(key_sizes: Iterable[int] = KEY_SIZES, repeats: int = REPEATS) -> list:
+    """
+    Сравнение методов возведения в степень на операции C^D mod N:
+    двоичный (mod_pow), скользящее окно, окно с умножением Монтгомери и встроенный pow
+    """
+    rows = []
+    message = b"pow benchmark"
+
+    for key_bits in key_sizes:
+        keypair = RSA.generate_keys(key_bits // 2)
+        ciphertext = RSA.encrypt(message, keypair.e, keypair.n)
+
+        row = {'key_bits': key_bits}
+        for method in EXPONENTIATION_METHODS:
+            mod_pow = ModularExponentiation.select(method)
+            assert mod_pow(ciphertext, keypair.d, keypair.n) == pow(ciphertext, keypair.d, keypair.n)
+            row[f'{method}_ms'] = median_ms(lambda: mod_pow(ciphertext, keypair.d, keypair.n), repeats)
+        rows.append(row)
+
+    print(f"\n{'Модуль':>8}" + ''.join(f"{method + ', мс':>16}" for method in EXPONENTIATION_METHODS))
+    for row in rows:
+        print(f"{row['key_bits']:>8}" + ''.join(f"{row[f'{method}_ms']:>16.2f}" for method in EXPONENTIATION_METHODS))
+
+    return rows
+
+
+def benchmark_keygen(key_sizes: Iterable[int] = KEY_SIZES, repeats: int = REPEATS) -> list:
+    """Поиск p и q последовательно и параллельно в os.cpu_count() процессах"""
+    rows = []
+
+    for key_bits in key_sizes:
+        bits = key_bits // 2
+        serial = median_ms(lambda: RSA.generate_primes(bits), repeats)
+        parallel = median_ms(lambda: RSA.generate_primes_parallel(bits), repeats)
+        rows.append({'key_bits': key_bits, 'serial_ms': serial, 'parallel_ms': parallel, 'speedup': serial / parallel})
+
+    print(f"\nПроцессов: {os.cpu_count()}")
+    print(f"{'Модуль':>8} {'Последовательно, мс':>20} {'Параллельно, мс':>16} {'Ускорение':>10}")
+    for row in rows:
+        print(f"{row['key_bits']:>8} {row['serial_ms']:>20.1f} {row['parallel_ms']:>16.1f} {row['speedup']:>9.2f}x")
+
+    return rows
+
+
+def benchmark_blocks(key_sizes: Iterable[int] = KEY_SIZES, repeats: int = REPEATS) -> list:
+    """
+    Пропускная способность блочного режима: MESSAGE_COUNT сообщений
+    по MESSAGE_SIZE байт в одном процессе и в пуле (encrypt_many / decrypt_many)
+    """
+    rows = []
+    messages = [os.urandom(MESSAGE_SIZE) for _ in range(MESSAGE_COUNT)]
+    megabytes = MESSAGE_COUNT * MESSAGE_SIZE / 2**20
+
+    for key_bits in key_sizes:
+        keypair = RSA.generate_keys(key_bits // 2)
+        ciphertexts = [RSA.encrypt_blocks(message, keypair.e, keypair.n) for message in messages]
+        assert RSA.decrypt_many(ciphertexts, keypair) == messages
+
+        timings = {
+            'encrypt': median_ms(lambda: [RSA.encrypt_blocks(m, keypair.e, keypair.n) for m in messages], repeats),
+            'encrypt_pool': median_ms(lambda: RSA.encrypt_many(messages, keypair.e, keypair.n), repeats),
+            'decrypt': median_ms(lambda: [RSA.decrypt_blocks(c, keypair) for c in ciphertexts], repeats),
+            'decrypt_pool': median_ms(lambda: RSA.decrypt_many(ciphertexts, keypair), repeats),
+        }
+        rows.append({'key_bits': key_bits, **{f'{name}_mb_s': megabytes / (ms / 1e3) for name, ms in timings.items()}})
+
+    columns = ('encrypt', 'encrypt_pool', 'decrypt', 'decrypt_pool')
+    print(f"\n{MESSAGE_COUNT} сообщений по {MESSAGE_SIZE} байт, процессов: {os.cpu_count()}, МБ/с")
+    print(f"{'Модуль':>8}" + ''.join(f"{name:>14}" for name in columns))
+    for row in rows:
+        print(f"{row['key_bits']:>8}" + ''.join(f"{row[f'{name}_mb_s']:>14.3f}" for name in columns))
+
+    return rows
+
+
+def _suite_custom(key_bits: int, repeats: int, message: bytes) -> List[dict]:
+    bits = key_bits // 2
+    rows = [
+        ('keygen', 'serial', sample_ns(lambda: RSA.keypair_from_primes(*RSA.generate_primes(bits)), KEYGEN_REPEATS)),
+        ('keygen', 'parallel', sample_ns(lambda: RSA.keypair_from_primes(*RSA.generate_primes_parallel(bits)),
+                                         KEYGEN_REPEATS)),
+    ]
+
+    keypair = RSA.keypair_from_primes(*RSA.generate_primes(bits))
+    ciphertext = RSA.encrypt(message, keypair.e, keypair.n)
+
+    # binary - исходный алгоритм; crt - дешифрование по КТО; montgomery - учебный
+    # вариант для сравнения, на Python он медленнее встроенного %
+    for method in EXPONENTIATION_METHODS:
+        assert RSA.decrypt_crt(ciphertext, keypair, method) == message
+        rows += [
+            ('encrypt', method, sample_ns(lambda: RSA.encrypt(message, keypair.e, keypair.n, method), repeats)),
+            ('decrypt', method, sample_ns(lambda: RSA.decrypt(ciphertext, keypair.d, keypair.n, method), repeats)),
+            ('decrypt', f'crt+{method}', sample_ns(lambda: RSA.decrypt_crt(ciphertext, keypair, method), repeats)),
+        ]
+
+    return [
+        {'backend': 'custom', 'operation': operation, 'variant': variant, 'key_bits': key_bits,
+         **latency_stats(samples)}
+        for operation, variant, samples in rows
+    ]
+
+
+def _suite_library(key_bits: int, repeats: int, message: bytes) -> List[dict]:
+    crypto = get_backend('cryptography')
+    rsa_padding, hashes = crypto.rsa_padding, crypto.hashes
+    oaep = rsa_padding.OAEP(mgf=rsa_padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+    generate = lambda: crypto.rsa.generate_private_key(public_exponent=65537, key_size=key_bits)
+
+    keygen = sample_ns(generate, KEYGEN_REPEATS)
+    private_key = generate()
+    public_key = private_key.public_key()
+    ciphertext = public_key.encrypt(message, oaep)
+
+    rows = [
+        ('keygen', keygen),
+        ('encrypt', sample_ns(lambda: public_key.encrypt(message, oaep), repeats)),
+        ('decrypt', sample_ns(lambda: private_key.decrypt(ciphertext, oaep), repeats)),
+    ]
+    return [
+        {'backend': 'cryptography', 'operation': operation, 'variant': 'oaep-sha256', 'key_bits': key_bits,
+         **latency_stats(samples)}
+        for operation, samples in rows
+    ]
+
+
+def benchmark_suite(
+    key_sizes: Iterable[int] = SUITE_KEY_SIZES,
+    repeats: int = REPEATS,
+    output: str = SUITE_PATH
+) -> list:
+    """
+    Генерация ключей, шифрование и дешифрование самописным RSA (все методы
+    возведения в степень, с КТО и без, последовательный и параллельный поиск
+    простых) и библиотекой cryptography (RSA-OAEP). Отчёт - JSON в output.
+    """
+    message = b"RSA benchmark suite"
+    records = []
+    skipped = []
+
+    for key_bits in key_sizes:
+        records += _suite_custom(key_bits, repeats, message)
+
+        try:
+            records += _suite_library(key_bits, repeats, message)
+        except (BackendUnavailable, ValueError) as e:
+            # Библиотека не установлена или не создаёт ключи короче 1024 бит
+            skipped.append({'backend': 'cryptography', 'key_bits': key_bits, 'reason': str(e)})
+
+    try:
+        library_version = get_backend('cryptography').version
+    except BackendUnavailable:
+        library_version = None
+
+    report = {
+        'machine': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': sys.version,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'cryptography': library_version,
+        },
+        'params': {'key_sizes': list(key_sizes), 'repeats': repeats, 'keygen_repeats': KEYGEN_REPEATS},
+        'records': records,
+        'skipped': skipped,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n{'Модуль':>8} {'Реализация':>14} {'Операция':>9} {'Вариант':>16} {'оп/с':>10} {'p50, мс':>10} {'p99, мс':>10}")
+    for row in records:
+        print(f"{row['key_bits']:>8} {row['backend']:>14} {row['operation']:>9} {row['variant']:>16} "
+              f"{row['ops_per_sec']:>10.1f} {row['p50_ms']:>10.2f} {row['p99_ms']:>10.2f}")
+    for row in skipped:
+        print(f"{row['key_bits']:>8} {row['backend']:>14}: пропущено - {row['reason']}")
+    print(f"\nОтчёт: {output}")
+
+    return records
+
+
+def _import_ms(statement: str, repeats: int) -> float:
+    # Отдельный интерпретатор на каждый замер: кэш модулей не переживает процесс.
+    # -B: запись байткода отключена, замеры не создают __pycache__ в каталогах проекта
+    command = [sys.executable, '-B', '-c', statement]
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    return median_ms(lambda: subprocess.run(command, cwd=cwd, check=True), repeats)
+
+
+def benchmark_import(key_sizes: Iterable[int] = (), repeats: int = REPEATS) -> dict:
+    """
+    Время запуска интерпретатора с импортом rsa: только самописные примитивы
+    и с загрузкой бэкенда cryptography (прежнее поведение при импорте).
+    Интерпретатор запускается с -B (байткод не записывается на диск).
+    key_sizes не используется.
+    """
+    row = {
+        'python_ms': _import_ms('pass', repeats),
+        'import_rsa_ms': _import_ms('import rsa', repeats),
+        'import_rsa_backend_ms': _import_ms("import rsa; rsa.backend_available('cryptography')", repeats),
+    }
+
+    print(f"\n{'Запуск':<40} {'мс':>8}")
+    print(f"{'python -c pass':<40} {row['python_ms']:>8.1f}")
+    print(f"{'import rsa':<40} {row['import_rsa_ms']:>8.1f}")
+    print(f"{'import rsa + бэкенд cryptography':<40} {row['import_rsa_backend_ms']:>8.1f}")
+
+    return row
+
+
+BENCHMARKS = {
+    'crt': benchmark_crt,
+    'pow': benchmark_exponentiation,
+    'keygen': benchmark_keygen,
+    'blocks': benchmark_blocks,
+    'suite': benchmark_suite,
+    'import': benchmark_import,
+}
+
+# Набор по умолчанию; suite с ключами до 4096 бит идёт долго и запускается явно
+DEFAULT_BENCHMARKS = ('crt', 'pow', 'keygen', 'blocks', 'import')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Бенчмарки самописного RSA")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help="размеры модуля в битах (по умолчанию свои у каждого бенчмарка)")
+    parser.add_argument('--repeats', type=int, default=REPEATS)
+    parser.add_argument('benchmarks', nargs='*', metavar='benchmark',
+                        help=f"какие бенчмарки запускать: {', '.join(BENCHMARKS)} "
+                             f"(по умолчанию {', '.join(DEFAULT_BENCHMARKS)})")
+    args = parser.parse_args()
+
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"неизвестные бенчмарки: {', '.join(sorted(unknown))}")
+
+    for name in args.benchmarks or DEFAULT_BENCHMARKS:
+        if args.sizes:
+            BENCHMARKS[name](args.sizes, args.repeats)
+        else:
+            BENCHMARKS[name](repeats=args.repeats)
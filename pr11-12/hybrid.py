@@ -0,0 +1,176 @@
+import os
+import struct
+from types import SimpleNamespace
+from typing import BinaryIO
+
+from rsa import RSA, BackendUnavailable, RSAKeypair, get_backend
+
+# Гибридное шифрование: случайный ключ AES-256 шифруется RSA, данные -
+# AES-GCM блоками по chunk_size байт, каждый со своим тегом аутентификации.
+#
+# Формат: заголовок HEADER (MAGIC, схема обёртки ключа, chunk_size,
+# длина обёрнутого ключа), обёрнутый ключ, префикс nonce; затем блоки:
+# CHUNK (признак последнего блока, длина шифротекста) и шифротекст с тегом.
+# Nonce блока - префикс и номер блока; номер и признак последнего блока
+# входят в связанные данные, поэтому перестановка, удаление и обрезка
+# блоков обнаруживаются.
+MAGIC = b'RSAHYB01'
+HEADER = struct.Struct('<8sBII')
+CHUNK = struct.Struct('<BI')
+CHUNK_AAD = struct.Struct('<QB')
+NONCE_PREFIX_BYTES = 8
+KEY_BYTES = 32
+TAG_BYTES = 16
+
+CHUNK_SIZE = 1 << 16
+
+# Схемы обёртки ключа
+WRAP_CUSTOM = 1
+WRAP_LIBRARY = 2
+
+
+def _cryptography() -> SimpleNamespace:
+    try:
+        return get_backend('cryptography')
+    except BackendUnavailable as e:
+        raise RuntimeError("Для гибридного шифрования нужна библиотека cryptography (AES-GCM)") from e
+
+
+class CustomKeyWrap:
+    """Обёртка ключа самописным RSA (блочный режим RSA.encrypt_blocks)"""
+
+    scheme = WRAP_CUSTOM
+
+    def __init__(self, keypair: RSAKeypair, method: str = 'binary'):
+        self.keypair = keypair
+        self.method = method
+
+    def wrap(self, key: bytes) -> bytes:
+        return RSA.encrypt_blocks(key, self.keypair.e, self.keypair.n, self.method)
+
+    def unwrap(self, wrapped: bytes) -> bytes:
+        if self.keypair.d is None:
+            raise ValueError("Для снятия обёртки нужен закрытый ключ")
+        return RSA.decrypt_blocks(wrapped, self.keypair, self.method)
+
+
+class LibraryKeyWrap:
+    """
+    Обёртка ключа RSA-OAEP (SHA-256) из библиотеки cryptography.
+    Для шифрования достаточно public_key, для расшифрования нужен private_key.
+    """
+
+    scheme = WRAP_LIBRARY
+
+    def __init__(self, private_key=None, public_key=None):
+        self.crypto = _cryptography()
+        self.private_key = private_key
+        self.public_key = public_key or private_key.public_key()
+
+    def _padding(self):
+        rsa_padding, hashes = self.crypto.rsa_padding, self.crypto.hashes
+        return rsa_padding.OAEP(
+            mgf=rsa_padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
+
+    def wrap(self, key: bytes) -> bytes:
+        return self.public_key.encrypt(key, self._padding())
+
+    def unwrap(self, wrapped: bytes) -> bytes:
+        if self.private_key is None:
+            raise ValueError("Для снятия обёртки нужен закрытый ключ")
+        return self.private_key.decrypt(wrapped, self._padding())
+
+
+def encrypt_stream(source: BinaryIO, destination: BinaryIO, key_wrap, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Шифрует поток source в destination; key_wrap - CustomKeyWrap или LibraryKeyWrap.
+    Память - O(chunk_size) при любом размере данных. Возвращает число байт открытого текста.
+    """
+    crypto = _cryptography()
+    key = os.urandom(KEY_BYTES)
+    wrapped = key_wrap.wrap(key)
+    nonce_prefix = os.urandom(NONCE_PREFIX_BYTES)
+
+    header = HEADER.pack(MAGIC, key_wrap.scheme, chunk_size, len(wrapped)) + wrapped + nonce_prefix
+    destination.write(header)
+
+    aead = crypto.AESGCM(key)
+    total = 0
+    index = 0
+    current = source.read(chunk_size)
+
+    while True:
+        # Следующий блок читается заранее, чтобы пометить последний
+        following = source.read(chunk_size)
+        final = not following
+
+        nonce = nonce_prefix + index.to_bytes(12 - NONCE_PREFIX_BYTES, 'big')
+        ciphertext = aead.encrypt(nonce, current, header + CHUNK_AAD.pack(index, final))
+        destination.write(CHUNK.pack(final, len(ciphertext)))
+        destination.write(ciphertext)
+
+        total += len(current)
+        if final:
+            return total
+        current = following
+        index += 1
+
+
+def _read_exact(source: BinaryIO, size: int) -> bytes:
+    data = source.read(size)
+    if len(data) != size:
+        raise ValueError("Шифротекст обрезан")
+    return data
+
+
+def decrypt_stream(source: BinaryIO, destination: BinaryIO, key_wrap) -> int:
+    """
+    Расшифровывает результат encrypt_stream. Каждый блок проверяется до записи;
+    при ошибке аутентификации или обрезке - ValueError.
+    Возвращает число байт открытого текста.
+    """
+    crypto = _cryptography()
+    fixed = _read_exact(source, HEADER.size)
+    magic, scheme, chunk_size, wrapped_size = HEADER.unpack(fixed)
+    if magic != MAGIC:
+        raise ValueError("Не гибридный шифротекст")
+    if scheme != key_wrap.scheme:
+        raise ValueError(f"Ключ обёрнут другой схемой: {scheme}")
+
+    wrapped = _read_exact(source, wrapped_size)
+    nonce_prefix = _read_exact(source, NONCE_PREFIX_BYTES)
+    header = fixed + wrapped + nonce_prefix
+
+    aead = crypto.AESGCM(key_wrap.unwrap(wrapped))
+    total = 0
+    index = 0
+
+    while True:
+        final, size = CHUNK.unpack(_read_exact(source, CHUNK.size))
+        if size > chunk_size + TAG_BYTES:
+            raise ValueError(f"Блок {index} длиннее chunk_size")
+
+        nonce = nonce_prefix + index.to_bytes(12 - NONCE_PREFIX_BYTES, 'big')
+        try:
+            plaintext = aead.decrypt(nonce, _read_exact(source, size), header + CHUNK_AAD.pack(index, final))
+        except crypto.InvalidTag:
+            raise ValueError(f"Блок {index} не прошёл проверку подлинности") from None
+
+        destination.write(plaintext)
+        total += len(plaintext)
+        if final:
+            return total
+        index += 1
+
+
+def encrypt_file(source_path: str, destination_path: str, key_wrap, chunk_size: int = CHUNK_SIZE) -> int:
+    with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+        return encrypt_stream(source, destination, key_wrap, chunk_size)
+
+
+def decrypt_file(source_path: str, destination_path: str, key_wrap) -> int:
+    with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+        return decrypt_stream(source, destination, key_wrap)
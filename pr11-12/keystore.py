@@ -0,0 +1,150 @@
+import hashlib
+import os
+import re
+import struct
+from collections import OrderedDict
+from typing import List
+
+from rsa import RSA, RSAKeypair
+
+# Формат файла ключа: MAGIC, затем поля FIELDS по порядку, каждое -
+# длина в байтах (LENGTH) и число big-endian; длина 0 - поле отсутствует
+MAGIC = b'RSAKEY01'
+LENGTH = struct.Struct('<I')
+FIELDS = ('n', 'e', 'd', 'p', 'q', 'dP', 'dQ', 'qInv')
+KEY_SUFFIX = '.key'
+
+# Число загруженных ключей, хранимых в памяти
+KEY_CACHE_SIZE = 32
+
+_KEY_ID = re.compile(r'[A-Za-z0-9_.-]+')
+
+
+def key_fingerprint(keypair: RSAKeypair) -> str:
+    """Идентификатор ключа по умолчанию: начало SHA-256 открытого ключа (n, e)"""
+    digest = hashlib.sha256()
+    for value in (keypair.n, keypair.e):
+        digest.update(value.to_bytes((value.bit_length() + 7) // 8, 'big'))
+    return digest.hexdigest()[:16]
+
+
+def dump_keypair(keypair: RSAKeypair) -> bytes:
+    """Сериализует пару ключей вместе с параметрами КТО"""
+    values = [getattr(keypair, field) for field in FIELDS]
+
+    parts = [MAGIC]
+    for value in values:
+        data = b'' if value is None else value.to_bytes((value.bit_length() + 7) // 8 or 1, 'big')
+        parts += [LENGTH.pack(len(data)), data]
+    return b''.join(parts)
+
+
+def load_keypair(data: bytes) -> RSAKeypair:
+    """Восстанавливает пару ключей из dump_keypair без пересчёта параметров КТО"""
+    if not data.startswith(MAGIC):
+        raise ValueError("Не файл ключа RSA")
+
+    values = {}
+    offset = len(MAGIC)
+    for field in FIELDS:
+        if offset + LENGTH.size > len(data):
+            raise ValueError(f"Файл ключа обрезан на поле {field}")
+        (size,) = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        if offset + size > len(data):
+            raise ValueError(f"Файл ключа обрезан на поле {field}")
+        values[field] = int.from_bytes(data[offset:offset + size], 'big') if size else None
+        offset += size
+
+    if values['qInv'] is not None:
+        return RSAKeypair.from_crt(*(values[field] for field in FIELDS))
+    return RSAKeypair(values['n'], values['e'], values['d'])
+
+
+class KeyStore:
+    """
+    Хранилище пар ключей RSA в каталоге: по файлу <key_id>.key на ключ.
+    Последние KEY_CACHE_SIZE загруженных ключей держатся в памяти.
+    """
+
+    def __init__(self, directory: str, cache_size: int = KEY_CACHE_SIZE):
+        self.directory = directory
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, RSAKeypair]' = OrderedDict()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key_id: str) -> str:
+        if not _KEY_ID.fullmatch(key_id) or key_id.startswith('.'):
+            raise ValueError(f"Недопустимый идентификатор ключа: {key_id!r}")
+        return os.path.join(self.directory, key_id + KEY_SUFFIX)
+
+    def _remember(self, key_id: str, keypair: RSAKeypair) -> RSAKeypair:
+        self._cache[key_id] = keypair
+        self._cache.move_to_end(key_id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return keypair
+
+    def save(self, keypair: RSAKeypair, key_id: str = None) -> str:
+        """Сохраняет пару ключей (по умолчанию под key_fingerprint), возвращает key_id"""
+        key_id = key_id or key_fingerprint(keypair)
+        path = self._path(key_id)
+        tmp_path = f"{path}.tmp"
+
+        # Закрытый ключ: файл создаётся сразу с правами 0600, не по umask
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            # Остаток прерванного сохранения
+            os.remove(tmp_path)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(dump_keypair(keypair))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._remember(key_id, keypair)
+        return key_id
+
+    def load(self, key_id: str) -> RSAKeypair:
+        """Загружает пару ключей; KeyError, если ключа нет"""
+        keypair = self._cache.get(key_id)
+        if keypair is not None:
+            self._cache.move_to_end(key_id)
+            return keypair
+
+        try:
+            with open(self._path(key_id), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            raise KeyError(key_id) from None
+        return self._remember(key_id, load_keypair(data))
+
+    def load_or_generate(self, key_id: str, bits: int, processes: int = None) -> RSAKeypair:
+        """Загружает ключ key_id, а если его нет - генерирует и сохраняет"""
+        try:
+            return self.load(key_id)
+        except KeyError:
+            keypair = RSA.generate_keys(bits, processes)
+            self.save(keypair, key_id)
+            return keypair
+
+    def delete(self, key_id: str) -> None:
+        self._cache.pop(key_id, None)
+        try:
+            os.remove(self._path(key_id))
+        except FileNotFoundError:
+            raise KeyError(key_id) from None
+
+    def ids(self) -> List[str]:
+        """Идентификаторы сохранённых ключей"""
+        return sorted(
+            name[:-len(KEY_SUFFIX)] for name in os.listdir(self.directory)
+            if name.endswith(KEY_SUFFIX)
+        )
+
+    def __contains__(self, key_id: str) -> bool:
+        return key_id in self._cache or os.path.exists(self._path(key_id))
@@ -1,4 +1,15 @@
-from rsa import RSA, CRYPTOGRAPHY_AVAILABLE, CryptographyDemo
+import io
+import os
+
+import hybrid
+from keystore import KeyStore
+from rsa import RSA, CryptographyDemo
+
+# Каталог сохранённых ключей: повторные запуски не генерируют ключ заново
+KEYSTORE_PATH = './pr11-12/keys'
+
+# Объём данных для демонстрации гибридного шифрования
+HYBRID_PAYLOAD_SIZE = 1 << 20
 
 def main():
     print("="*70)
@@ -9,8 +20,8 @@ def main():
     KEY_BITS = 128  # Для быстрой демонстрации
     
     try:
-        # Генерация ключей
-        keypair = RSA.generate_keys(KEY_BITS)
+        # Ключи из хранилища (генерируются при первом запуске)
+        keypair = KeyStore(KEYSTORE_PATH).load_or_generate(f"demo-{KEY_BITS}", KEY_BITS)
         
         print("\n--- Ключи RSA ---")
         print(f"Размер ключа (N): {keypair.n.bit_length()} бит")
@@ -40,8 +51,14 @@ def main():
         print(f"Расшифрованное сообщение: '{decrypted_text}'")
         print("-"*70)
         
+        # Дешифрование по КТО
+        print("\n--- Расшифрование по КТО (C^dP mod p, C^dQ mod q, рекомбинация Гарнера) ---")
+        decrypted_crt = RSA.decrypt_crt(ciphertext, keypair).decode('utf-8')
+        print(f"Расшифрованное сообщение: '{decrypted_crt}'")
+        print("-"*70)
+        
         # Проверка
-        if plain_text == decrypted_text:
+        if plain_text == decrypted_text == decrypted_crt:
             print("\nПроверка: Шифрование и расшифрование прошли успешно!")
         else:
             print("\nОшибка: Расшифрованное сообщение не соответствует исходному!")
@@ -59,6 +76,21 @@ def main():
     try:
         CryptographyDemo.rsa_library_demo()
         
+        print("\n" + "="*70)
+        print("Гибридное шифрование: ключ AES-256 под RSA, данные - AES-GCM блоками")
+        print("="*70)
+        
+        payload = os.urandom(HYBRID_PAYLOAD_SIZE)
+        key_wrap = hybrid.CustomKeyWrap(keypair)
+        encrypted = io.BytesIO()
+        hybrid.encrypt_stream(io.BytesIO(payload), encrypted, key_wrap)
+        decrypted = io.BytesIO()
+        hybrid.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, key_wrap)
+        
+        print(f"   Данные: {len(payload)} байт, шифротекст: {len(encrypted.getvalue())} байт")
+        print(f"   Блоков по {hybrid.CHUNK_SIZE} байт: {-(-len(payload) // hybrid.CHUNK_SIZE)}")
+        print(f"   Тексты совпадают: {decrypted.getvalue() == payload}")
+        
     except Exception as e:
         print(f"\nОшибка: {e}")
         import traceback
@@ -1,115 +1,152 @@
 import os
+import struct
 import sys
 import time
-from typing import Tuple, List
+from collections import OrderedDict
+from functools import partial
+from itertools import compress
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, Tuple, List, Optional
+
+# Общий пакет common лежит в корне репозитория; скрипты запускаются и напрямую
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from common.primality import is_prime, primes_below
+
+# Поиск простого: нечётные простые для отсева кандидатов, число кандидатов
+# в окне решета и минимальная длина, с которой кандидаты больше этих простых
+SIEVE_PRIMES = primes_below(1 << 14)[1:]
+SIEVE_WINDOW = 4096
+INCREMENTAL_MIN_BITS = 16
+
+# XorShift*: маска 64-битного слова и множитель выхода
+MASK64 = 0xFFFFFFFFFFFFFFFF
+XORSHIFT_MULTIPLIER = 2685821657736338717
+
+# Открытая экспонента (традиционно 65537)
+PUBLIC_EXPONENT = 65537
+
+# Блочный режим: длина сообщения перед данными, сообщений на задачу пула
+LENGTH_PREFIX_BYTES = 8
+MESSAGES_PER_TASK = 4
+
+# Ширина окна скользящего возведения в степень по длине экспоненты:
+# (максимальная длина в битах, ширина), для более длинных - MAX_WINDOW
+WINDOW_SIZES = ((24, 1), (80, 3), (240, 4), (672, 5))
+MAX_WINDOW = 6
+
+# Число контекстов Монтгомери в кэше (у ключа RSA модули n, p и q постоянны)
+MONTGOMERY_CACHE_SIZE = 128
 
 class XorShiftStarPRNG:
     """Самописный генератор псевдослучайных чисел (XorShift*)"""
     
     def __init__(self, seed: int = None):
         if seed is None:
-            seed = int(time.time() * 1000000) & 0xFFFFFFFFFFFFFFFF
+            seed = int(time.time() * 1000000) & MASK64
         if seed == 0:
             seed = 1  # Состояние не должно быть нулем
-        self.state = seed & 0xFFFFFFFFFFFFFFFF
+        self.state = seed & MASK64
     
     def next_xorshift_star(self) -> int:
         """Генерирует следующее 64-битное число"""
+        return self.next_words(1)[0]
+    
+    def next_words(self, count: int) -> List[int]:
+        """count следующих 64-битных чисел (то же, что count вызовов next_xorshift_star)"""
         x = self.state
-        x ^= (x >> 12) & 0xFFFFFFFFFFFFFFFF
-        x ^= (x << 25) & 0xFFFFFFFFFFFFFFFF
-        x ^= (x >> 27) & 0xFFFFFFFFFFFFFFFF
+        words = []
+        for _ in range(count):
+            x ^= x >> 12
+            x ^= (x << 25) & MASK64
+            x ^= x >> 27
+            words.append((x * XORSHIFT_MULTIPLIER) & MASK64)
         self.state = x
-        return (x * 2685821657736338717) & 0xFFFFFFFFFFFFFFFF
+        return words
+    
+    def read_bytes(self, length: int) -> bytes:
+        """length случайных байт: все 8 байт каждого выхода, младший первым"""
+        words = self.next_words(-(-length // 8))
+        return struct.pack(f'<{len(words)}Q', *words)[:length]
+    
+    def fill(self, buffer) -> None:
+        """Заполняет случайными байтами записываемый буфер (bytearray, memoryview, массив)"""
+        view = memoryview(buffer).cast('B')
+        view[:] = self.read_bytes(len(view))
     
     def read_big_int(self, bits: int) -> int:
-        """Генерирует случайное большое число заданной длины в битах"""
-        result = 0
-        num_bytes = (bits + 7) // 8  # Округляем до следующего байта
+        """
+        Генерирует случайное большое число ровно из bits бит (старший бит установлен).
+        Одно 64-битное слово генератора на 8 байт, сборка через int.from_bytes.
+        """
+        if bits <= 0:
+            return 0
         
-        for i in range(num_bytes):
-            r = self.next_xorshift_star()
-            byte_val = r & 0xFF
-            
-            # Сдвигаем результат влево на 8 бит и добавляем новый байт
-            result = (result << 8) | byte_val
+        num_bytes = (bits + 7) // 8  # Округляем до следующего байта
+        result = int.from_bytes(self.read_bytes(num_bytes), 'big') >> (8 * num_bytes - bits)
         
         # Устанавливаем старший бит для требуемой длины
-        if bits > 0:
-            result |= (1 << (bits - 1))
-        
-        return result
+        return result | (1 << (bits - 1))
 
 
 class PrimeGenerator:
-    """Генератор простых чисел с самописным тестом Миллера-Рабина"""
+    """Генератор простых чисел (проверка простоты - common.primality)"""
     
     @staticmethod
-    def miller_rabin_test(n: int, d: int, s: int, a: int) -> bool:
+    def is_probable_prime(n: int) -> bool:
         """
-        Тест Миллера-Рабина для проверки простоты числа
-        n-1 = 2^s * d
+        Проверка числа на простоту: пробное деление на малые простые,
+        затем Миллер-Рабин (детерминированный для n < 2^64)
         """
-        x = pow(a, d, n)
-        
-        n_minus_1 = n - 1
-        
-        if x == 1 or x == n_minus_1:
-            return True
-        
-        for _ in range(s):
-            x = pow(x, 2, n)
-            if x == n_minus_1:
-                return True
-            if x == 1:
-                return False
-        
-        return False
+        return is_prime(n)
     
     @staticmethod
-    def is_probable_prime(n: int) -> bool:
-        """Проверка числа на простоту с использованием теста Миллера-Рабина"""
-
-        if n < 2:
-            return False
-        if n in (2, 3):
-            return True
-        if n % 2 == 0:
-            return False
-        
-        # Находим s и d такие, что n - 1 = 2^s * d, где d нечетно
-        n_minus_1 = n - 1
-        d = n_minus_1
-        s = 0
-        
-        while d % 2 == 0:
-            d //= 2
-            s += 1
-        
-        # Детерминированные основания для надежности
-        bases = [2, 3, 5, 7, 11]
+    def generate_probable_prime(prng: XorShiftStarPRNG, bits: int, stop=None) -> Optional[int]:
+        """
+        Генерирует простое число заданной битовой длины.
+        От случайной нечётной точки кандидаты перебираются с шагом 2;
+        остатки по малым простым обновляются окнами, и кратные им
+        кандидаты вычёркиваются решетом без проверки Миллера-Рабина.
+        stop - событие (multiprocessing.Event) для прерывания поиска
+        из другого процесса; при его установке возвращается None.
+        """
+        if bits < INCREMENTAL_MIN_BITS:
+            while stop is None or not stop.is_set():
+                # Генерируем случайного кандидата и убеждаемся, что число нечетно
+                p = prng.read_big_int(bits) | 1
+                if PrimeGenerator.is_probable_prime(p):
+                    return p
+            return None
         
-        for a in bases:
-            if a >= n:
-                continue
-            if not PrimeGenerator.miller_rabin_test(n, d, s, a):
-                return False
+        limit = 1 << bits
+        primes = SIEVE_PRIMES
         
-        return True
-    
-    @staticmethod
-    def generate_probable_prime(prng: XorShiftStarPRNG, bits: int) -> int:
-        """Генерирует простое число заданной битовой длины"""
         while True:
-            # Генерируем случайного кандидата
-            p = prng.read_big_int(bits)
-            
-            # Убеждаемся, что число нечетно
-            p |= 1
+            base = prng.read_big_int(bits) | 1
+            residues = [base % s for s in primes]
             
-            # Проверяем на простоту
-            if PrimeGenerator.is_probable_prime(p):
-                return p
+            while base < limit:
+                # window[k] - кандидат base + 2k
+                window = bytearray(b'\x01') * SIEVE_WINDOW
+                for s, r in zip(primes, residues):
+                    # base + 2k = 0 (mod s)  <=>  k = -r * 2^-1 (mod s)
+                    k = (-r * ((s + 1) // 2)) % s
+                    window[k::s] = bytes(len(range(k, SIEVE_WINDOW, s)))
+                
+                for k in compress(range(SIEVE_WINDOW), window):
+                    candidate = base + 2 * k
+                    if candidate >= limit:
+                        break
+                    if stop is not None and stop.is_set():
+                        return None
+                    if PrimeGenerator.is_probable_prime(candidate):
+                        return candidate
+                
+                # Сдвиг окна: остатки обновляются, а не пересчитываются
+                base += 2 * SIEVE_WINDOW
+                residues = [(r + 2 * SIEVE_WINDOW) % s for s, r in zip(primes, residues)]
 
 
 class ExtendedGCD:
@@ -157,6 +194,65 @@ class ExtendedGCD:
         return x % m
 
 
+class MontgomeryContext:
+    """
+    Арифметика Монтгомери по нечётному модулю n: числа хранятся как x*R mod n,
+    R = 2^k > n, и деление на n при умножении заменяется сдвигом на k бит.
+    Реализация учебная: в Python редукция из нескольких операций над большими
+    целыми медленнее встроенного %, поэтому ускорения она не даёт.
+    """
+    
+    _cache: 'OrderedDict[int, MontgomeryContext]' = OrderedDict()
+    
+    def __init__(self, modulus: int):
+        if modulus < 3 or modulus % 2 == 0:
+            raise ValueError(f"Модуль Монтгомери должен быть нечётным и больше 2: {modulus}")
+        
+        self.modulus = modulus
+        self.r_bits = modulus.bit_length()
+        self.mask = (1 << self.r_bits) - 1
+        # n' = -n^-1 mod R
+        self.n_prime = (-ExtendedGCD.modular_inverse(modulus, 1 << self.r_bits)) & self.mask
+        # R^2 mod n - для перевода в форму Монтгомери; R mod n - единица в ней
+        self.r2 = (1 << (2 * self.r_bits)) % modulus
+        self.one = (1 << self.r_bits) % modulus
+    
+    @classmethod
+    def for_modulus(cls, modulus: int) -> 'MontgomeryContext':
+        """Контекст из кэша (последние MONTGOMERY_CACHE_SIZE модулей) или новый"""
+        context = cls._cache.get(modulus)
+        if context is None:
+            context = cls._cache[modulus] = cls(modulus)
+            if len(cls._cache) > MONTGOMERY_CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(modulus)
+        return context
+    
+    def reduce(self, t: int) -> int:
+        """Редукция Монтгомери: t * R^-1 mod n для 0 <= t < n*R"""
+        m = ((t & self.mask) * self.n_prime) & self.mask
+        t = (t + m * self.modulus) >> self.r_bits
+        return t - self.modulus if t >= self.modulus else t
+    
+    def multiply(self, a: int, b: int) -> int:
+        """Произведение чисел в форме Монтгомери"""
+        return self.reduce(a * b)
+    
+    def to_montgomery(self, x: int) -> int:
+        return self.reduce((x % self.modulus) * self.r2)
+    
+    def from_montgomery(self, x: int) -> int:
+        return self.reduce(x)
+    
+    def pow(self, base: int, exponent: int) -> int:
+        """base^exponent mod n скользящим окном в форме Монтгомери"""
+        x = ModularExponentiation.sliding_window(
+            self.to_montgomery(base), exponent, self.one, self.multiply
+        )
+        return self.from_montgomery(x)
+
+
 class ModularExponentiation:
     """Модульное возведение в степень"""
     
@@ -181,15 +277,130 @@ class ModularExponentiation:
             exponent >>= 1
         
         return result
+    
+    @staticmethod
+    def window_size(exponent_bits: int) -> int:
+        """Ширина окна, минимизирующая число умножений для экспоненты такой длины"""
+        for max_bits, width in WINDOW_SIZES:
+            if exponent_bits <= max_bits:
+                return width
+        return MAX_WINDOW
+    
+    @staticmethod
+    def sliding_window(base: int, exponent: int, one: int, multiply: Callable[[int, int], int]) -> int:
+        """
+        Возведение в степень скользящим окном слева направо.
+        Таблица нечётных степеней base^1, base^3, ..., base^(2^w - 1);
+        каждое окно - w возведений в квадрат и одно умножение на значение из таблицы.
+        one и multiply задают единицу и умножение (обычное по модулю или Монтгомери).
+        """
+        if exponent == 0:
+            return one
+        
+        bits = bin(exponent)[2:]
+        width = ModularExponentiation.window_size(len(bits))
+        
+        # table[i] = base^(2i + 1)
+        table = [base]
+        square = multiply(base, base)
+        for _ in range((1 << (width - 1)) - 1):
+            table.append(multiply(table[-1], square))
+        
+        result = None
+        i = 0
+        while i < len(bits):
+            if bits[i] == '0':
+                result = multiply(result, result)
+                i += 1
+                continue
+            
+            # Окно длиной не больше width, заканчивающееся единичным битом
+            j = min(i + width, len(bits))
+            while bits[j - 1] == '0':
+                j -= 1
+            
+            value = table[int(bits[i:j], 2) >> 1]
+            if result is None:
+                result = value  # первое окно: квадраты единицы не нужны
+            else:
+                for _ in range(j - i):
+                    result = multiply(result, result)
+                result = multiply(result, value)
+            i = j
+        
+        return result
+    
+    @staticmethod
+    def mod_pow_window(base: int, exponent: int, modulus: int) -> int:
+        """Модульное возведение в степень скользящим окном"""
+        if modulus == 1:
+            return 0
+        return ModularExponentiation.sliding_window(
+            base % modulus, exponent, 1, lambda a, b: (a * b) % modulus
+        )
+    
+    @staticmethod
+    def mod_pow_montgomery(base: int, exponent: int, modulus: int) -> int:
+        """
+        Модульное возведение в степень скользящим окном с умножением Монтгомери.
+        Для чётного модуля форма Монтгомери неприменима - обычное окно.
+        Учебный вариант для сравнения, а не ускорение: редукция на Python
+        дороже встроенного % над большими целыми, поэтому метод медленнее
+        mod_pow_window, а выигрыш перед mod_pow даёт только само окно.
+        """
+        if modulus % 2 == 0 or modulus < 3:
+            return ModularExponentiation.mod_pow_window(base, exponent, modulus)
+        return MontgomeryContext.for_modulus(modulus).pow(base, exponent)
+    
+    @staticmethod
+    def select(method: str) -> Callable[[int, int, int], int]:
+        """Функция возведения в степень по имени метода (см. EXPONENTIATION_METHODS)"""
+        try:
+            return EXPONENTIATION_METHODS[method]
+        except KeyError:
+            raise ValueError(
+                f"Неизвестный метод возведения в степень: {method}, "
+                f"доступны: {', '.join(EXPONENTIATION_METHODS)}"
+            ) from None
+
+
+EXPONENTIATION_METHODS = {
+    'binary': ModularExponentiation.mod_pow,
+    'window': ModularExponentiation.mod_pow_window,
+    'montgomery': ModularExponentiation.mod_pow_montgomery,
+    'builtin': pow,
+}
 
 
 class RSAKeypair:
     """Пара ключей RSA"""
     
-    def __init__(self, n: int, e: int, d: int):
+    def __init__(self, n: int, e: int, d: int, p: int = None, q: int = None):
         self.n = n  # Модуль (n = p * q)
         self.e = e  # Открытая экспонента
         self.d = d  # Закрытая экспонента
+        
+        # Параметры КТО для ускоренного дешифрования (если известны p и q)
+        self.p = p
+        self.q = q
+        if p is not None and q is not None:
+            self.dP = d % (p - 1)  # d mod (p-1)
+            self.dQ = d % (q - 1)  # d mod (q-1)
+            self.qInv = ExtendedGCD.modular_inverse(q, p)  # q^-1 mod p
+        else:
+            self.dP = self.dQ = self.qInv = None
+    
+    @classmethod
+    def from_crt(cls, n: int, e: int, d: int, p: int, q: int, dP: int, dQ: int, qInv: int) -> 'RSAKeypair':
+        """Пара ключей с готовыми параметрами КТО (без их пересчёта)"""
+        keypair = cls(n, e, d)
+        keypair.p, keypair.q = p, q
+        keypair.dP, keypair.dQ, keypair.qInv = dP, dQ, qInv
+        return keypair
+    
+    @property
+    def has_crt(self) -> bool:
+        return self.qInv is not None
 
 
 class RSA:
@@ -206,36 +417,104 @@ class RSA:
         return p, q
     
     @staticmethod
-    def generate_keys(bits: int) -> RSAKeypair:
-        """Генерирует пару ключей RSA"""
-        print(f"Генерация простых чисел ({bits} бит)...")
-        
-        # 1. Сгенерировать два простых числа (p и q)
-        p, q = RSA.generate_primes(bits)
-        
-        print(f"✓ p сгенерировано")
-        print(f"✓ q сгенерировано")
+    def generate_primes_parallel(bits: int, processes: int = None, seed: int = None) -> Tuple[int, int]:
+        """
+        Генерирует p и q одновременно в processes процессах, у каждого свой
+        XorShiftStarPRNG. Берутся первые два найденных различных простых,
+        пригодных для PUBLIC_EXPONENT; остальные процессы прерываются.
+        """
+        # Пулы процессов импортируются по требованию: на импорт модуля
+        # multiprocessing и concurrent.futures тратят десятки мс
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        
+        processes = max(processes or os.cpu_count(), 2)
+        prng = XorShiftStarPRNG(seed)
+        context = multiprocessing.get_context()
+        stop = context.Event()
+        primes = []
+        
+        with ProcessPoolExecutor(processes, mp_context=context,
+                                 initializer=_init_prime_worker, initargs=(stop,)) as pool:
+            # Зёрна процессов - последовательные выходы общего генератора
+            pending = {
+                pool.submit(_prime_worker, prng.next_xorshift_star(), bits)
+                for _ in range(processes)
+            }
+            
+            while len(primes) < 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    p = future.result()
+                    if len(primes) < 2 and p not in primes and (p - 1) % PUBLIC_EXPONENT != 0:
+                        primes.append(p)
+                    elif len(primes) < 2:
+                        # Непригодное простое: процесс начинает поиск заново
+                        pending.add(pool.submit(_prime_worker, prng.next_xorshift_star(), bits))
+            
+            stop.set()
+            for future in pending:
+                future.cancel()
         
-        # 2. Вычислить модуль n = p * q
+        return primes[0], primes[1]
+    
+    @staticmethod
+    def keypair_from_primes(p: int, q: int, e: int = PUBLIC_EXPONENT) -> RSAKeypair:
+        """Вычисляет ключи RSA по простым p и q"""
+        # Модуль n = p * q
         n = p * q
         
-        # 3. Вычислить функцию Эйлера phi(n) = (p-1)(q-1)
+        # Функция Эйлера phi(n) = (p-1)(q-1)
         phi_n = (p - 1) * (q - 1)
         
-        # 4. Выбрать открытую экспоненту e (традиционно 65537)
-        e = 65537
-        
-        # 5. Вычислить закрытую экспоненту d (d = e^-1 mod phi(n))
+        # Закрытая экспонента d (d = e^-1 mod phi(n))
         d = ExtendedGCD.modular_inverse(e, phi_n)
         
         if d is None:
             raise ValueError("Обратная экспонента d не найдена")
         
-        return RSAKeypair(n, e, d)
+        return RSAKeypair(n, e, d, p, q)
     
     @staticmethod
-    def encrypt(plaintext: bytes, pub_key: int, n: int) -> int:
-        """Шифрует сообщение: M^E mod N"""
+    def generate_keys(bits: int, processes: int = None) -> RSAKeypair:
+        """
+        Генерирует пару ключей RSA.
+        processes - искать p и q параллельно в стольких процессах
+        (по умолчанию последовательно в текущем).
+        """
+        print(f"Генерация простых чисел ({bits} бит)...")
+        
+        # 1. Сгенерировать два простых числа (p и q)
+        if processes:
+            p, q = RSA.generate_primes_parallel(bits, processes)
+        else:
+            p, q = RSA.generate_primes(bits)
+        
+        print(f"✓ p сгенерировано")
+        print(f"✓ q сгенерировано")
+        
+        # 2. Вычислить n = p * q, phi(n) и закрытую экспоненту d = e^-1 mod phi(n)
+        return RSA.keypair_from_primes(p, q)
+    
+    @staticmethod
+    def generate_keys_batch(bits: int, count: int, processes: int = None, seed: int = None) -> List[RSAKeypair]:
+        """
+        Генерирует count пар ключей в пуле процессов: каждая пара
+        ищется целиком в одном процессе со своим XorShiftStarPRNG.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        prng = XorShiftStarPRNG(seed)
+        seeds = [prng.next_xorshift_star() for _ in range(count)]
+        with ProcessPoolExecutor(processes or os.cpu_count()) as pool:
+            return list(pool.map(_keypair_worker, seeds, [bits] * count))
+    
+    @staticmethod
+    def encrypt(plaintext: bytes, pub_key: int, n: int, method: str = 'binary') -> int:
+        """
+        Шифрует сообщение: M^E mod N
+        method - способ возведения в степень (см. EXPONENTIATION_METHODS)
+        """
         # Преобразуем байты в большое число M
         m = int.from_bytes(plaintext, 'big')
         
@@ -244,34 +523,238 @@ class RSA:
             raise ValueError("Сообщение слишком длинное для этого RSA, M >= N")
         
         # C = M^E mod N (используем самописное возведение в степень)
-        c = ModularExponentiation.mod_pow(m, pub_key, n)
+        c = ModularExponentiation.select(method)(m, pub_key, n)
         
         return c
     
     @staticmethod
-    def decrypt(ciphertext: int, priv_key: int, n: int) -> bytes:
+    def decrypt(ciphertext: int, priv_key: int, n: int, method: str = 'binary') -> bytes:
         """Дешифрует сообщение: C^D mod N"""
         # M = C^D mod N (используем самописное возведение в степень)
-        m = ModularExponentiation.mod_pow(ciphertext, priv_key, n)
+        m = ModularExponentiation.select(method)(ciphertext, priv_key, n)
+        
+        return RSA._int_to_bytes(m)
+    
+    @staticmethod
+    def decrypt_crt(ciphertext: int, keypair: RSAKeypair, method: str = 'binary') -> bytes:
+        """
+        Дешифрует сообщение по Китайской теореме об остатках:
+        две экспоненты половинной длины по модулям p и q и рекомбинация Гарнера
+        """
+        return RSA._int_to_bytes(RSA._decrypt_int(ciphertext, keypair, method))
+    
+    @staticmethod
+    def _decrypt_int(ciphertext: int, keypair: RSAKeypair, method: str = 'binary') -> int:
+        mod_pow = ModularExponentiation.select(method)
+        if not keypair.has_crt:
+            return mod_pow(ciphertext, keypair.d, keypair.n)
+        
+        p, q = keypair.p, keypair.q
+        
+        # m1 = C^dP mod p, m2 = C^dQ mod q
+        m1 = mod_pow(ciphertext, keypair.dP, p)
+        m2 = mod_pow(ciphertext, keypair.dQ, q)
+        
+        # Гарнер: h = qInv * (m1 - m2) mod p, M = m2 + h * q
+        h = (keypair.qInv * (m1 - m2)) % p
+        return m2 + h * q
+    
+    # Блочный режим: сообщение произвольной длины с префиксом длины
+    # LENGTH_PREFIX_BYTES дополняется нулями до целого числа блоков
+    # открытого текста; каждый шифруется отдельно и записывается
+    # блоком фиксированной ширины
+    
+    @staticmethod
+    def block_sizes(n: int) -> Tuple[int, int]:
+        """
+        Размеры блоков в байтах для модуля n: (открытый текст, шифротекст).
+        Блок открытого текста на байт короче модуля, поэтому M < N.
+        """
+        cipher_bytes = (n.bit_length() + 7) // 8
+        plain_bytes = (n.bit_length() - 1) // 8
+        if plain_bytes < 1:
+            raise ValueError(f"Модуль слишком мал для блочного режима: {n.bit_length()} бит")
+        return plain_bytes, cipher_bytes
+    
+    @staticmethod
+    def encrypt_blocks(plaintext: bytes, pub_key: int, n: int, method: str = 'binary') -> bytes:
+        """
+        Шифрует сообщение произвольной длины блоками, возвращает блоки шифротекста подряд.
+        Схема детерминирована (RSA без дополнения): одинаковые сообщения дают
+        одинаковый шифротекст, поэтому она не семантически стойкая и годится
+        только для случайных данных - например, обёртки ключа в hybrid.
+        """
+        plain_bytes, cipher_bytes = RSA.block_sizes(n)
+        mod_pow = ModularExponentiation.select(method)
+        
+        framed = len(plaintext).to_bytes(LENGTH_PREFIX_BYTES, 'big') + plaintext
+        framed += bytes(-len(framed) % plain_bytes)
+        view = memoryview(framed)
         
+        return b''.join(
+            mod_pow(int.from_bytes(view[i:i + plain_bytes], 'big'), pub_key, n).to_bytes(cipher_bytes, 'big')
+            for i in range(0, len(framed), plain_bytes)
+        )
+    
+    @staticmethod
+    def decrypt_blocks(ciphertext: bytes, keypair: RSAKeypair, method: str = 'binary') -> bytes:
+        """
+        Дешифрует результат encrypt_blocks (по КТО, если известны p и q).
+        Блоки восстанавливаются с фиксированной шириной - ведущие нули не теряются.
+        Изменённый шифротекст или чужой ключ дают ValueError.
+        """
+        plain_bytes, cipher_bytes = RSA.block_sizes(keypair.n)
+        if len(ciphertext) % cipher_bytes:
+            raise ValueError(f"Длина шифротекста не кратна размеру блока {cipher_bytes}")
+        view = memoryview(ciphertext)
+        limit = 1 << (8 * plain_bytes)
+        
+        blocks = []
+        for i in range(0, len(ciphertext), cipher_bytes):
+            c = int.from_bytes(view[i:i + cipher_bytes], 'big')
+            # Блок шифротекста меньше n, блок открытого текста - plain_bytes байт
+            m = RSA._decrypt_int(c, keypair, method) if c < keypair.n else None
+            if m is None or m >= limit:
+                raise ValueError(f"Повреждённый шифротекст или неверный ключ: блок {i // cipher_bytes}")
+            blocks.append(m.to_bytes(plain_bytes, 'big'))
+        framed = b''.join(blocks)
+        
+        length = int.from_bytes(framed[:LENGTH_PREFIX_BYTES], 'big')
+        if len(framed) < LENGTH_PREFIX_BYTES or length > len(framed) - LENGTH_PREFIX_BYTES:
+            raise ValueError("Повреждённый шифротекст: неверная длина сообщения")
+        return framed[LENGTH_PREFIX_BYTES:LENGTH_PREFIX_BYTES + length]
+    
+    @staticmethod
+    def encrypt_many(
+        messages: Iterable[bytes],
+        pub_key: int,
+        n: int,
+        processes: int = None,
+        method: str = 'binary'
+    ) -> List[bytes]:
+        """Шифрует сообщения блочным режимом в пуле процессов, порядок сохраняется"""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(processes or os.cpu_count()) as pool:
+            return list(pool.map(partial(RSA.encrypt_blocks, pub_key=pub_key, n=n, method=method),
+                                 messages, chunksize=MESSAGES_PER_TASK))
+    
+    @staticmethod
+    def decrypt_many(
+        ciphertexts: Iterable[bytes],
+        keypair: RSAKeypair,
+        processes: int = None,
+        method: str = 'binary'
+    ) -> List[bytes]:
+        """Дешифрует результаты encrypt_blocks в пуле процессов, порядок сохраняется"""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(processes or os.cpu_count()) as pool:
+            return list(pool.map(partial(RSA.decrypt_blocks, keypair=keypair, method=method),
+                                 ciphertexts, chunksize=MESSAGES_PER_TASK))
+    
+    @staticmethod
+    def _int_to_bytes(m: int) -> bytes:
         # Преобразуем большое число M обратно в байты
         num_bytes = (m.bit_length() + 7) // 8
         return m.to_bytes(num_bytes, 'big')
 
 
+# Процессы параллельной генерации ключей
+
+_stop_event = None
+
+
+def _init_prime_worker(stop) -> None:
+    global _stop_event
+    _stop_event = stop
+
+
+def _prime_worker(seed: int, bits: int) -> Optional[int]:
+    return PrimeGenerator.generate_probable_prime(XorShiftStarPRNG(seed), bits, _stop_event)
+
+
+def _keypair_worker(seed: int, bits: int) -> RSAKeypair:
+    prng = XorShiftStarPRNG(seed)
+    while True:
+        p = PrimeGenerator.generate_probable_prime(prng, bits)
+        q = PrimeGenerator.generate_probable_prime(prng, bits)
+        if p != q and (p - 1) % PUBLIC_EXPONENT and (q - 1) % PUBLIC_EXPONENT:
+            return RSA.keypair_from_primes(p, q)
+
+
 # ==================== ПРАКТИКА 12: ИСПОЛЬЗОВАНИЕ БИБЛИОТЕКИ CRYPTOGRAPHY ====================
 
-try:
-    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-    from cryptography.hazmat.primitives import hashes, padding
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+# Внешние бэкенды загружаются при первом обращении, а не при импорте модуля:
+# процессам, которым нужны только самописные примитивы, библиотека не нужна
+
+class BackendUnavailable(ImportError):
+    """Бэкенд не установлен"""
+
+
+_BACKEND_LOADERS: Dict[str, Callable[[], SimpleNamespace]] = {}
+_backends: Dict[str, SimpleNamespace] = {}
+_backend_errors: Dict[str, str] = {}
+
+
+def register_backend(name: str, loader: Callable[[], SimpleNamespace]) -> None:
+    """Регистрирует бэкенд: loader импортирует его и возвращает нужные объекты"""
+    _BACKEND_LOADERS[name] = loader
+    _backends.pop(name, None)
+    _backend_errors.pop(name, None)
+
+
+def get_backend(name: str) -> SimpleNamespace:
+    """Бэкенд по имени; при первом обращении вызывается его загрузчик"""
+    if name in _backends:
+        return _backends[name]
+    if name not in _BACKEND_LOADERS:
+        raise ValueError(f"Неизвестный бэкенд: {name}, доступны: {', '.join(_BACKEND_LOADERS)}")
+    
+    if name not in _backend_errors:
+        try:
+            _backends[name] = _BACKEND_LOADERS[name]()
+            return _backends[name]
+        except ImportError as e:
+            _backend_errors[name] = str(e)
+    raise BackendUnavailable(f"Бэкенд {name} недоступен: {_backend_errors[name]}")
+
+
+def backend_available(name: str) -> bool:
+    try:
+        get_backend(name)
+        return True
+    except BackendUnavailable:
+        return False
+
+
+def _load_cryptography() -> SimpleNamespace:
+    import cryptography
+    from cryptography.exceptions import InvalidTag
     from cryptography.hazmat.backends import default_backend
-    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.asymmetric import rsa, padding as rsa_padding
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     
-    CRYPTOGRAPHY_AVAILABLE = True
-except ImportError:
-    CRYPTOGRAPHY_AVAILABLE = False
+    return SimpleNamespace(
+        version=cryptography.__version__,
+        rsa=rsa,
+        rsa_padding=rsa_padding,
+        hashes=hashes,
+        default_backend=default_backend,
+        AESGCM=AESGCM,
+        InvalidTag=InvalidTag,
+    )
+
+
+register_backend('cryptography', _load_cryptography)
+
+
+def __getattr__(name: str):
+    # CRYPTOGRAPHY_AVAILABLE вычисляется (и библиотека импортируется) при первом обращении
+    if name == 'CRYPTOGRAPHY_AVAILABLE':
+        return backend_available('cryptography')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class CryptographyDemo:
@@ -280,6 +763,9 @@ class CryptographyDemo:
     @staticmethod
     def rsa_library_demo():
         """Демонстрация RSA"""
+        crypto = get_backend('cryptography')
+        rsa, rsa_padding, hashes = crypto.rsa, crypto.rsa_padding, crypto.hashes
+        
         print("\n" + "="*70)
         print("RSA Шифрование")
         print("="*70)
@@ -288,7 +774,7 @@ class CryptographyDemo:
         private_key = rsa.generate_private_key(
             public_exponent=65537,
             key_size=2048,
-            backend=default_backend()
+            backend=crypto.default_backend()
         )
         public_key = private_key.public_key()
         
@@ -0,0 +1,162 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Произведение двух вычетов по модулю < 2^32 помещается в uint64
+MAX_BATCH_VALUE = 1 << 32
+
+# Основания, дающие точный ответ Миллера-Рабина для n < 2^32
+DETERMINISTIC_BASES_32 = (2, 7, 61)
+
+# Предварительный отсев делением на малые нечётные простые
+SCREEN_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61)
+
+
+def _as_candidates(numbers) -> np.ndarray:
+    n = np.asarray(numbers, dtype=np.int64)
+    if n.size and (n.min() < 0 or n.max() >= MAX_BATCH_VALUE):
+        raise ValueError("Пакетные тесты поддерживают числа от 0 до 2^32 - 1")
+    return n.astype(np.uint64)
+
+
+def powmod(base: np.ndarray, exponent: np.ndarray, modulus: np.ndarray) -> np.ndarray:
+    """Поэлементное base^exponent mod modulus (двоичное возведение, модули < 2^32)"""
+    result = np.ones_like(modulus) % modulus
+    base = base % modulus
+    exponent = exponent.copy()
+
+    while exponent.any():
+        odd = (exponent & 1).astype(bool)
+        result = np.where(odd, result * base % modulus, result)
+        base = base * base % modulus
+        exponent >>= np.uint64(1)
+
+    return result
+
+
+def _trailing_zeros(x: np.ndarray) -> np.ndarray:
+    lowbit = x & (~x + np.uint64(1))
+    return np.log2(lowbit.astype(np.float64)).astype(np.uint64)
+
+
+def jacobi(a: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Поэлементный символ Якоби (a/n) для нечётных n > 0"""
+    a = a % n
+    n = n.copy()
+    result = np.ones(a.shape, dtype=np.int8)
+    index = np.flatnonzero(a)
+
+    while index.size:
+        A, N = a[index], n[index]
+
+        # Выносим все множители 2 сразу: (2/n) = -1 при n = 3, 5 (mod 8)
+        zeros = _trailing_zeros(A)
+        A >>= zeros
+        r = N % 8
+        flip = (zeros & np.uint64(1)).astype(bool) & ((r == 3) | (r == 5))
+
+        # Квадратичный закон взаимности
+        flip ^= (A % 4 == 3) & (N % 4 == 3)
+        result[index[flip]] *= -1
+
+        a[index], n[index] = N % A, A
+        index = index[a[index] != 0]
+
+    return np.where(n == 1, result, 0).astype(np.int8)
+
+
+def _screen(n: np.ndarray):
+    """
+    Числа < 4, чётные и кратные малым простым решаются без тестов.
+    Возвращает: (маска решённых, ответ для них)
+    """
+    n32 = n.astype(np.uint32)
+    decided = (n32 < 4) | (n32 % 2 == 0)
+    answer = (n32 == 2) | (n32 == 3)
+
+    for p in SCREEN_PRIMES:
+        divisible = n32 % p == 0
+        decided |= divisible
+        answer |= n32 == p
+
+    return decided, answer
+
+
+def _random_bases(n: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    # Основания из [2, n - 2]; после отсева n > 4
+    return rng.integers(2, n.astype(np.int64) - 1).astype(np.uint64)
+
+
+def miller_rabin_batch(
+    numbers: Sequence[int],
+    k: int = 20,
+    rng: Optional[np.random.Generator] = None,
+    bases: Optional[Sequence[int]] = None
+) -> np.ndarray:
+    """
+    Тест Рабина-Миллера для массива чисел < 2^32.
+    k случайных оснований на число; bases - фиксированные основания
+    (DETERMINISTIC_BASES_32 дают точный ответ).
+    После каждого раунда массив сжимается до ещё не отсеянных чисел.
+    """
+    n = _as_candidates(numbers)
+    decided, result = _screen(n)
+    rng = np.random.default_rng() if rng is None else rng
+
+    # Индексы и значения кандидатов; n - 1 = 2^s * d
+    index = np.flatnonzero(~decided)
+    m = n[index]
+    n_minus_1 = m - np.uint64(1)
+    s = _trailing_zeros(n_minus_1)
+    d = n_minus_1 >> s
+
+    rounds = bases if bases is not None else range(k)
+    for base in rounds:
+        if not index.size:
+            break
+
+        a = _random_bases(m, rng) if bases is None else np.uint64(base) % m
+        x = powmod(a, d, m)
+        # Основание, кратное n, не свидетельствует ни о чём
+        passed = (a == 0) | (x == 1) | (x == n_minus_1)
+
+        for r in range(1, int(s.max(initial=1))):
+            x = x * x % m
+            passed |= (x == n_minus_1) & (np.uint64(r) < s)
+
+        index, m, n_minus_1, s, d = index[passed], m[passed], n_minus_1[passed], s[passed], d[passed]
+
+    result[index] = True
+    return result
+
+
+def solovay_strassen_batch(
+    numbers: Sequence[int],
+    k: int = 20,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Тест Соловея-Штрассена для массива чисел < 2^32, k случайных оснований на число.
+    После каждого раунда массив сжимается до ещё не отсеянных чисел.
+    """
+    n = _as_candidates(numbers)
+    decided, result = _screen(n)
+    rng = np.random.default_rng() if rng is None else rng
+
+    index = np.flatnonzero(~decided)
+    m = n[index]
+
+    for _ in range(k):
+        if not index.size:
+            break
+
+        a = _random_bases(m, rng)
+        J = jacobi(a, m)
+        # Символ Якоби по модулю n: -1 соответствует n - 1
+        J_mod = np.where(J < 0, m - np.uint64(1), J.astype(np.uint64))
+        passed = (J != 0) & (powmod(a, (m - np.uint64(1)) >> np.uint64(1), m) == J_mod)
+
+        index, m = index[passed], m[passed]
+
+    result[index] = True
+    return result
@@ -0,0 +1,124 @@
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+WARMUP_RUNS = 1
+REPEATS = 5
+
+
+def summarize(samples_ns: List[int]) -> dict:
+    """Медиана и межквартильный размах замеров, в мс"""
+    samples_ms = [s / 1e6 for s in samples_ns]
+    if len(samples_ms) > 1:
+        q1, median, q3 = statistics.quantiles(samples_ms, n=4, method='inclusive')
+    else:
+        q1 = median = q3 = samples_ms[0]
+
+    return {
+        'median_ms': median,
+        'q1_ms': q1,
+        'q3_ms': q3,
+        'iqr_ms': q3 - q1,
+        'min_ms': min(samples_ms),
+        'samples_ns': list(samples_ns),
+    }
+
+
+def measure_memory(func: Callable, *args) -> float:
+    """
+    Пиковая память одного вызова в КБ.
+    Отдельный прогон: tracemalloc замедляет выделения и искажает время.
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure(
+    func: Callable,
+    *args,
+    repeats: int = REPEATS,
+    warmup: int = WARMUP_RUNS,
+    memory: bool = True
+) -> dict:
+    """
+    Замер func(*args): warmup прогревочных вызовов, repeats замеров
+    perf_counter_ns, затем отдельный проход для памяти.
+    Возвращает сводку summarize, результаты замеренных вызовов и память в КБ.
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    samples = []
+    results = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        result = func(*args)
+        samples.append(time.perf_counter_ns() - start)
+        results.append(result)
+
+    summary = summarize(samples)
+    summary['results'] = results
+    summary['memory_kb'] = measure_memory(func, *args) if memory else None
+    return summary
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine_metadata() -> dict:
+    """Сведения о машине и окружении для сравнения запусков между коммитами"""
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': _git_commit(),
+        'python': sys.version,
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(path: str, records: List[dict], **params) -> None:
+    """Сохраняет записи замеров в JSON вместе с параметрами и метаданными машины"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(
+            {'machine': machine_metadata(), 'params': params, 'records': records},
+            f, ensure_ascii=False, indent=2
+        )
+
+
+def save_csv(path: str, records: List[dict]) -> None:
+    """Сохраняет записи замеров в CSV (без сырых замеров samples_ns)"""
+    fields = []
+    for record in records:
+        for field in record:
+            if field != 'samples_ns' and field not in fields:
+                fields.append(field)
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
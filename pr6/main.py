@@ -1,26 +1,25 @@
 import random
 import math
-import time
-import tracemalloc
-from typing import List, Tuple
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib.patches import Rectangle
+import os
+import sys
+import argparse
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+# Общий пакет common лежит в корне репозитория; скрипт запускается и напрямую
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from sieve import segmented_sieve
+from benchmark import REPEATS, measure, save_csv, save_results, summarize
+from result_store import ResultStore, code_version
+from common.primality import decompose, strong_probable_prime
 
 def sieve_of_eratosthenes(limit: int) -> List[int]:
-    """Решето Эратосфена"""
-    if limit < 2:
-        return []
-    
-    is_prime = [True] * (limit + 1)
-    is_prime[0] = is_prime[1] = False
-    
-    for i in range(2, int(math.sqrt(limit)) + 1):
-        if is_prime[i]:
-            for j in range(i * i, limit + 1, i):
-                is_prime[j] = False
-    
-    return [i for i in range(limit + 1) if is_prime[i]]
+    """Решето Эратосфена (сегментированное, см. sieve.py)"""
+    return list(segmented_sieve(limit))
 
 def gcd(a: int, b: int) -> int:
     """НОД"""
@@ -100,7 +99,11 @@ def lehmann_test(p: int, t: int = 20) -> bool:
     return one_count > 0 and minus_one_count > 0
 
 def miller_rabin_test(p: int, k: int = 20) -> bool:
-    """Тест Рабина-Миллера"""
+    """
+    Тест Рабина-Миллера: k случайных оснований при любом p.
+    Без детерминированных оснований common.primality.is_prime - иначе
+    при p < 2^64 число итераций k в замерах ни на что бы не влияло.
+    """
     if p < 2:
         return False
     if p == 2 or p == 3:
@@ -108,31 +111,70 @@ def miller_rabin_test(p: int, k: int = 20) -> bool:
     if p % 2 == 0:
         return False
     
-    b, m = 0, p - 1
-    while m % 2 == 0:
-        b += 1
-        m //= 2
-    
-    for _ in range(k):
-        a = random.randint(2, p - 2)
-        z = pow(a, m, p)
-        
-        if z == 1 or z == p - 1:
-            continue
-        
-        is_composite = True
-        for j in range(1, b):
-            z = pow(z, 2, p)
-            if z == p - 1:
-                is_composite = False
-                break
-            if z == 1:
-                return False
-        
-        if is_composite:
+    d, s = decompose(p)
+    return all(strong_probable_prime(p, random.randint(2, p - 2), d, s) for _ in range(k))
+
+def strong_lucas_test(n: int, D: int, P: int, Q: int) -> bool:
+    """Сильный тест Люка с параметрами (P, Q), D = P^2 - 4Q"""
+    # n + 1 = 2^s * d, где d нечетно
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def halve(x):
+        # Деление на 2 по нечётному модулю n
+        return (x + n if x % 2 else x) // 2 % n
+
+    # U_1, V_1, Q^1; проход по битам d от старшего
+    U, V, Qk = 1, P % n, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = halve(P * U + V), halve(D * U + P * V)
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+
+    return False
+
+def baillie_psw_test(p: int) -> bool:
+    """Тест Бейли-Померанса-Селфриджа-Вагстаффа: сильный тест по основанию 2 и сильный тест Люка"""
+    if p < 2:
+        return False
+    if p in (2, 3, 5, 7):
+        return True
+    if p % 2 == 0:
+        return False
+
+    d, s = decompose(p)
+    if not strong_probable_prime(p, 2, d, s):
+        return False
+
+    # Для точного квадрата подходящего D не существует
+    if math.isqrt(p) ** 2 == p:
+        return False
+
+    # Метод Селфриджа: первое D из 5, -7, 9, -11, ... с (D/p) = -1
+    D = 5
+    while True:
+        J = jacobi_symbol(D, p)
+        if J == -1:
+            break
+        if J == 0 and abs(D) != p:
             return False
-    
-    return True
+        D = -D - 2 if D > 0 else -D + 2
+
+    return strong_lucas_test(p, D, 1, (1 - D) // 4)
 
 def trial_division(n: int) -> bool:
     """Пробное деление"""
@@ -149,48 +191,68 @@ def trial_division(n: int) -> bool:
     return True
 
 def benchmark_test(test_func, numbers: List[int], iterations: int = 10) -> dict:
-    """Бенчмарк теста"""
-    tracemalloc.start()
-    start_time = time.time()
-    
-    results = []
-    for n in numbers:
-        try:
-            results.append(test_func(n, iterations))
-        except TypeError:
-            results.append(test_func(n))
-    
-    end_time = time.time()
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    
+    """Бенчмарк теста: медиана и IQR времени, память замеряется отдельным проходом"""
+    args = (iterations,) if len(inspect.signature(test_func).parameters) > 1 else ()
+
+    summary = measure(lambda: [test_func(n, *args) for n in numbers])
+
     return {
-        'results': results,
-        'time': (end_time - start_time) * 1000,
-        'memory': peak / 1024
+        'results': summary['results'][-1],
+        'time': summary['median_ms'],
+        'time_iqr': summary['iqr_ms'],
+        'memory': summary['memory_kb']
     }
 
+# Таблица простых для оценки точности и её минимальная граница
+ORACLE_PATH = './pr6/prime_oracle.bin'
+ORACLE_MIN_LIMIT = 10**6
+
+# Форматы вывода compare_algorithms
+OUTPUT_FORMATS = ('plot', 'png', 'csv', 'json')
+
+# Тесты без параметра числа итераций
+DETERMINISTIC_TESTS = {'Пробное деление', 'Бейли-PSW'}
+
+# Пакетные тесты: принимают всю выборку сразу (числа < 2^32)
+BATCH_TESTS = {'Соловей-Штрассен (NumPy)', 'Рабин-Миллер (NumPy)'}
+
 def compare_algorithms(
     base_test_count: int = 100,
     base_max_number: int = 1000,
     base_iterations: int = 10,
-    num_runs_per_setting: int = 3  # усреднение по нескольким запускам для стабильности
+    num_runs_per_setting: int = 3,  # число замеров на ячейку, время - медиана
+    processes: Optional[int] = None,  # число процессов для параллельного прогона ячеек
+    seed: Optional[int] = None,  # зерно для воспроизводимых выборок и тестов
+    results_path: str = './pr6/prime_tests_benchmark.json',
+    store_path: Optional[str] = './pr6/prime_tests_results.sqlite',  # None - без кэша
+    output: str = 'plot'  # plot, png (без окна), csv или json (без графиков)
 ):
     """Сравнение алгоритмов с построением зависимостей от test_count, max_number, iterations."""
-    
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Неизвестный формат вывода: {output}")
+
+    # NumPy и matplotlib загружаются только при использовании
+    from batch import miller_rabin_batch, solovay_strassen_batch
+
     tests = [
         ('Соловей-Штрассен', solovay_strassen_test),
         ('Леманн', lehmann_test),
         ('Рабин-Миллер', miller_rabin_test),
-        ('Пробное деление', trial_division)
+        ('Пробное деление', trial_division),
+        ('Бейли-PSW', baillie_psw_test),
+        ('Соловей-Штрассен (NumPy)', solovay_strassen_batch),
+        ('Рабин-Миллер (NumPy)', miller_rabin_batch)
     ]
     
+    records = []
+    store = ResultStore(store_path) if store_path else None
+
     # === 1. Зависимость от test_count ===
     test_counts = [100, 250, 500, 750, 1000]
     acc_tc, time_tc, mem_tc = run_parameter_sweep(
         'test_count', test_counts,
         base_test_count, base_max_number, base_iterations,
-        tests, num_runs_per_setting
+        tests, num_runs_per_setting, processes, seed, records, store
     )
 
     # === 2. Зависимость от max_number ===
@@ -198,7 +260,7 @@ def compare_algorithms(
     acc_mn, time_mn, mem_mn = run_parameter_sweep(
         'max_number', max_numbers,
         base_test_count, base_max_number, base_iterations,
-        tests, num_runs_per_setting
+        tests, num_runs_per_setting, processes, seed, records, store
     )
 
     # === 3. Зависимость от iterations (только для вероятностных) ===
@@ -206,26 +268,93 @@ def compare_algorithms(
     acc_it, time_it, mem_it = run_parameter_sweep(
         'iterations', iterations_vals,
         base_test_count, base_max_number, base_iterations,
-        tests, num_runs_per_setting
+        tests, num_runs_per_setting, processes, seed, records, store
     )
 
+    if store is not None:
+        store.close()
+
+    save_results(
+        results_path, records,
+        base_test_count=base_test_count, base_max_number=base_max_number,
+        base_iterations=base_iterations, num_runs_per_setting=num_runs_per_setting, seed=seed
+    )
+    print(f"\nРезультаты замеров сохранены: {results_path}")
+
+    if output == 'csv':
+        csv_path = os.path.splitext(results_path)[0] + '.csv'
+        save_csv(csv_path, records)
+        print(f"Таблица замеров сохранена: {csv_path}")
+
+    if output not in ('plot', 'png'):
+        return
+
     # === Построение графиков ===
-    plot_parameter_dependencies(
+    import plots
+    if output == 'png':
+        plots.use_headless_backend()
+
+    plots.plot_parameter_dependencies(
         test_counts, acc_tc, time_tc, mem_tc,
         max_numbers, acc_mn, time_mn, mem_mn,
         iterations_vals, acc_it, time_it, mem_it,
-        [t[0] for t in tests]
+        [t[0] for t in tests],
+        show=output == 'plot'
     )
 
-def run_parameter_sweep(param_name, param_values, base_tc, base_mn, base_it, tests, runs):
-    """Выполняет серию бенчмарков, варьируя один параметр."""
+def run_benchmark_cell(name, func, test_numbers, iterations, label, seed=None, repeats=REPEATS):
+    """
+    Замер теста по выборке в текущем процессе: repeats прогонов после прогрева,
+    память - отдельным проходом. Возвращает сводку benchmark.measure.
+    """
+    # Переинициализация генератора: процессы пула не должны делить состояние random
+    random.seed(seed)
+    args = () if name in DETERMINISTIC_TESTS else (iterations,)
+
+    if name in BATCH_TESTS:
+        import numpy as np
+        numbers = np.array(test_numbers, dtype=np.uint64)
+        rng = np.random.default_rng(random.getrandbits(64))
+        run = lambda: func(numbers, iterations, rng).tolist()
+    else:
+        run = lambda: [func(n, *args) for n in test_numbers]
+
+    try:
+        return measure(run, repeats=repeats)
+    except Exception as e:
+        print(f"Ошибка в {name} при {label}: {e}")
+        summary = summarize([0])
+        summary.update(results=[[False] * len(test_numbers)], memory_kb=0.0)
+        return summary
+
+def run_parameter_sweep(param_name, param_values, base_tc, base_mn, base_it, tests, runs,
+                        processes=None, seed=None, records=None, store=None,
+                        oracle_path=ORACLE_PATH):
+    """
+    Выполняет серию бенчмарков, варьируя один параметр.
+    runs - число замеров на ячейку (значение, алгоритм); время - медиана замеров.
+    При processes > 1 ячейки выполняются в пуле процессов.
+    Если передан список records, в него добавляются подробные записи замеров.
+    Если передано хранилище store и задан seed, уже посчитанные ячейки
+    берутся из него, а новые в него записываются.
+    Точность оценивается по таблице простых из oracle_path (строится при необходимости).
+    """
     accuracy_results = {name: [] for name, _ in tests}
     time_results = {name: [] for name, _ in tests}
     memory_results = {name: [] for name, _ in tests}
 
+    # Без seed выборки невоспроизводимы, кэшировать нечего
+    if seed is None:
+        store = None
+    versions = {name: code_version(func) for name, func in tests} if store is not None else {}
+
+    # Подготовка ячеек
+    entries = []
+    cells = []
+    scheduled = set()
     for val in param_values:
         print(f"\nТестируем {param_name} = {val}...")
-        
+
         # Настройка параметров
         if param_name == 'test_count':
             tc, mn, it = val, base_mn, base_it
@@ -236,212 +365,89 @@ def run_parameter_sweep(param_name, param_values, base_tc, base_mn, base_it, tes
         else:
             raise ValueError("Неизвестный параметр")
 
-        # Генерация выборки
-        test_numbers = [random.randint(2, mn) for _ in range(tc)]
-        actual_primes = set(sieve_of_eratosthenes(mn))
+        # Генерация выборки: зависит только от (seed, tc, mn), поэтому
+        # общая точка разных серий считается один раз
+        sample_seed = None if seed is None else f"{seed}/{tc}/{mn}"
+        rng = random.Random(sample_seed)
+        test_numbers = [rng.randint(2, mn) for _ in range(tc)]
 
-        # Усреднение по нескольким запускам
         for name, func in tests:
-            acc_sum, time_sum, mem_sum = 0, 0, 0
-            for _ in range(runs):
-                tracemalloc.start()
-                start = time.time()
-                try:
-                    if name == 'Пробное деление':
-                        predictions = [func(n) for n in test_numbers]
-                    else:
-                        predictions = [func(n, it) for n in test_numbers]
-                except Exception as e:
-                    print(f"Ошибка в {name} при {param_name}={val}: {e}")
-                    predictions = [False] * len(test_numbers)
-                end = time.time()
-                current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
-
-                # Точность
-                correct = sum(1 for n, pred in zip(test_numbers, predictions) if pred == (n in actual_primes))
-                acc = correct / len(test_numbers) * 100
-
-                acc_sum += acc
-                time_sum += (end - start) * 1000
-                mem_sum += peak / 1024
-
-            accuracy_results[name].append(acc_sum / runs)
-            time_results[name].append(time_sum / runs)
-            memory_results[name].append(mem_sum / runs)
+            # Для детерминированных тестов число итераций не влияет на результат
+            key_it = 0 if name in DETERMINISTIC_TESTS else it
+            key = (name, tc, mn, key_it, str(seed), runs, versions.get(name))
+            record = store.get(key) if store is not None else None
+            entries.append((name, val, tc, mn, it, test_numbers, key, record))
 
-    return accuracy_results, time_results, memory_results
+            # Одинаковые ячейки (при заданном seed) считаются один раз
+            if record is None and (seed is None or key not in scheduled):
+                scheduled.add(key)
+                cell_seed = None if sample_seed is None else f"{sample_seed}/{key_it}/{name}"
+                cells.append((name, func, test_numbers, it, f"{param_name}={val}", cell_seed, runs))
 
-def plot_parameter_dependencies(
-    test_counts, acc_tc, time_tc, mem_tc,
-    max_numbers, acc_mn, time_mn, mem_mn,
-    iterations, acc_it, time_it, mem_it,
-    names
-):
-    colors = ["#f83636", "#1dce61", "#090cc5", "#AD108B"]
-    
-    fig, axes = plt.subplots(3, 3, figsize=(18, 15))
-    params = [
-        ('Размер выборки', test_counts, acc_tc, time_tc, mem_tc),
-        ('Макс. число', max_numbers, acc_mn, time_mn, mem_mn),
-        ('Итерации', iterations, acc_it, time_it, mem_it)
-    ]
-    
-    for col, (title, x_vals, acc, tm, mem) in enumerate(params):
-        # Точность
-        ax = axes[0, col]
-        for i, name in enumerate(names):
-            ax.plot(x_vals, acc[name], 'o-', label=name, color=colors[i], linewidth=2)
-        ax.set_title(f'Точность vs {title}', fontweight='bold')
-        ax.set_xlabel(title)
-        ax.set_ylabel('Точность (%)')
-        ax.grid(True, alpha=0.3)
-        if col == 2:
-            ax.legend(fontsize=9)
-
-        # Время
-        ax = axes[1, col]
-        for i, name in enumerate(names):
-            ax.plot(x_vals, tm[name], 's--', label=name, color=colors[i], linewidth=2)
-        ax.set_title(f'Время vs {title}', fontweight='bold')
-        ax.set_xlabel(title)
-        ax.set_ylabel('Время (мс)')
-        ax.grid(True, alpha=0.3)
-
-        # Память
-        ax = axes[2, col]
-        for i, name in enumerate(names):
-            ax.plot(x_vals, mem[name], 'd-.', label=name, color=colors[i], linewidth=2)
-        ax.set_title(f'Память vs {title}', fontweight='bold')
-        ax.set_xlabel(title)
-        ax.set_ylabel('Память (КБ)')
-        ax.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.savefig('./pr6/prime_tests_parameter_dependency.png', dpi=150, bbox_inches='tight')
-    print("\nГрафик зависимостей сохранён: prime_tests_parameter_dependency.png")
-    plt.show()
-
-def plot_results(results, primes_256, test_numbers, actual_primes):
-    """Построение графиков"""
-    
-    fig = plt.figure(figsize=(16, 12))
-    
-    names = [r['name'] for r in results]
-    accuracies = [r['accuracy'] for r in results]
-    times = [r['time'] for r in results]
-    memories = [r['memory'] for r in results]
-    
-    colors = ["#f83636", "#1dce61", "#090cc5", "#AD108B"]
-    
-    ax1 = plt.subplot(3, 3, 1)
-    bars = ax1.barh(names, accuracies, color=colors)
-    ax1.set_xlabel('Точность (%)', fontsize=11, fontweight='bold')
-    ax1.set_title('Точность алгоритмов', fontsize=13, fontweight='bold', pad=15)
-    ax1.set_xlim(0, 105)
-    for i, (bar, acc) in enumerate(zip(bars, accuracies)):
-        ax1.text(acc + 1, i, f'{acc:.1f}%', va='center', fontweight='bold')
-    ax1.grid(axis='x', alpha=0.3)
-    
-    ax2 = plt.subplot(3, 3, 2)
-    bars = ax2.bar(names, times, color=colors)
-    ax2.set_ylabel('Время (мс)', fontsize=11, fontweight='bold')
-    ax2.set_title('Время выполнения', fontsize=13, fontweight='bold', pad=15)
-    ax2.tick_params(axis='x', rotation=45)
-    for bar, t in zip(bars, times):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{t:.1f}', ha='center', va='bottom', fontweight='bold')
-    ax2.grid(axis='y', alpha=0.3)
-    
-    ax3 = plt.subplot(3, 3, 3)
-    bars = ax3.bar(names, memories, color=colors)
-    ax3.set_ylabel('Память (КБ)', fontsize=11, fontweight='bold')
-    ax3.set_title('Использование памяти', fontsize=13, fontweight='bold', pad=15)
-    ax3.tick_params(axis='x', rotation=45)
-    for bar, m in zip(bars, memories):
-        height = bar.get_height()
-        ax3.text(bar.get_x() + bar.get_width()/2., height,
-                f'{m:.1f}', ha='center', va='bottom', fontweight='bold')
-    ax3.grid(axis='y', alpha=0.3)
-    
-    ax4 = plt.subplot(3, 3, 4)
-    x = np.arange(len(accuracies))
-    ax4.plot(x, accuracies, 'o-', color='#4f46e5', linewidth=2, markersize=8)
-    ax4.set_xticks(x)
-    ax4.set_xticklabels(names, rotation=45, ha='right')
-    ax4.set_ylabel('Точность (%)', fontsize=11, fontweight='bold')
-    ax4.set_title('Сравнение точности', fontsize=13, fontweight='bold', pad=15)
-    ax4.grid(True, alpha=0.3)
-    ax4.set_ylim(min(accuracies) - 5, 105)
-    
-    ax5 = plt.subplot(3, 3, 5)
-    normalized_times = [t / max(times) * 100 for t in times]
-    x = np.arange(len(names))
-    width = 0.6
-    bars = ax5.bar(x, normalized_times, width, color=colors)
-    ax5.set_ylabel('Относительное время (%)', fontsize=11, fontweight='bold')
-    ax5.set_title('Относительная скорость', fontsize=13, fontweight='bold', pad=15)
-    ax5.set_xticks(x)
-    ax5.set_xticklabels(names, rotation=45, ha='right')
-    ax5.grid(axis='y', alpha=0.3)
-    
-    ax6 = plt.subplot(3, 3, 6)
-    confusion_data = []
-    for r in results:
-        tp = sum(1 for i, n in enumerate(test_numbers) 
-                if r['predictions'][i] and n in actual_primes)
-        fp = sum(1 for i, n in enumerate(test_numbers) 
-                if r['predictions'][i] and n not in actual_primes)
-        fn = sum(1 for i, n in enumerate(test_numbers) 
-                if not r['predictions'][i] and n in actual_primes)
-        tn = sum(1 for i, n in enumerate(test_numbers) 
-                if not r['predictions'][i] and n not in actual_primes)
-        confusion_data.append([tp, fp, fn, tn])
-    
-    categories = ['TP', 'FP', 'FN', 'TN']
-    x = np.arange(len(categories))
-    width = 0.2
-    for i, (r, data) in enumerate(zip(results, confusion_data)):
-        ax6.bar(x + i * width, data, width, label=r['name'], color=colors[i])
-    ax6.set_ylabel('Количество', fontsize=11, fontweight='bold')
-    ax6.set_title('Матрица ошибок', fontsize=13, fontweight='bold', pad=15)
-    ax6.set_xticks(x + width * 1.5)
-    ax6.set_xticklabels(categories)
-    ax6.legend(fontsize=8)
-    ax6.grid(axis='y', alpha=0.3)
-    
-    
-    ax9 = plt.subplot(3, 3, 7)
-    prime_counts = [len([n for n in test_numbers if n in actual_primes])]
-    composite_counts = [len(test_numbers) - prime_counts[0]]
-    x = ['Простые', 'Составные']
-    bars = ax9.bar(x, [prime_counts[0], composite_counts[0]], 
-                   color=['#10b981', '#ef4444'])
-    ax9.set_ylabel('Количество', fontsize=11, fontweight='bold')
-    ax9.set_title('Распределение в выборке', fontsize=13, fontweight='bold', pad=15)
-    for bar in bars:
-        height = bar.get_height()
-        ax9.text(bar.get_x() + bar.get_width()/2., height,
-                f'{int(height)}', ha='center', va='bottom', fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('prime_tests_analysis.png', dpi=150, bbox_inches='tight')
-    print("\nГрафик сохранен: prime_tests_analysis.png")
-    plt.show()
-    
-    print(f"\nПростые числа < 256 ({len(primes_256)} чисел):")
-    for i in range(0, len(primes_256), 15):
-        print("  " + " ".join(f"{p:3d}" for p in primes_256[i:i+15]))
-    
-    print("\nСводка результатов:")
-    for r in results:
-        print(f"\n{r['name']}:")
-        print(f"  Точность: {r['accuracy']:.2f}%")
-        print(f"  Время: {r['time']:.2f} мс")
-        print(f"  Память: {r['memory']:.2f} КБ")
+    if store is not None:
+        cached = sum(1 for entry in entries if entry[-1] is not None)
+        print(f"\nИз хранилища: {cached} ячеек, к расчёту: {len(cells)}")
+
+    # Прогон недостающих ячеек
+    if processes and processes > 1 and len(cells) > 1:
+        with ProcessPoolExecutor(processes) as pool:
+            futures = [pool.submit(run_benchmark_cell, *cell) for cell in cells]
+            measurements = iter([future.result() for future in futures])
+    else:
+        measurements = (run_benchmark_cell(*cell) for cell in cells)
+
+    # Таблица простых для оценки точности, общая для всех серий и запусков
+    from oracle import PrimeOracle
+    limit = max((entry[3] for entry in entries if entry[-1] is None), default=0)
+    oracle = PrimeOracle.ensure(oracle_path, max(limit, ORACLE_MIN_LIMIT)) if cells else None
+
+    # Порядок замеров совпадает с порядком ячеек
+    computed = {}
+    for name, val, tc, mn, it, test_numbers, key, record in entries:
+        if record is None and seed is not None:
+            record = computed.get(key)
+
+        if record is None:
+            summary = next(measurements)
+
+            # Точность, усреднённая по замерам
+            acc_sum = 0
+            for predictions in summary['results']:
+                correct = sum(1 for n, pred in zip(test_numbers, predictions) if pred == (n in oracle))
+                acc_sum += correct / len(test_numbers) * 100
+
+            record = {field: value for field, value in summary.items() if field != 'results'}
+            record.update(
+                algorithm=name, test_count=tc, max_number=mn, iterations=it,
+                accuracy=acc_sum / len(summary['results'])
+            )
+            computed[key] = record
+            if store is not None:
+                store.put(key, record)
+
+        accuracy_results[name].append(record['accuracy'])
+        time_results[name].append(record['median_ms'])
+        memory_results[name].append(record['memory_kb'])
+
+        # Запись из кэша могла быть посчитана для другой ячейки (например, с другим
+        # числом итераций у детерминированного теста) - параметры берутся текущие
+        if records is not None:
+            records.append(dict(record, test_count=tc, max_number=mn, iterations=it,
+                                param=param_name, value=val))
+
+    if oracle is not None:
+        oracle.close()
+
+    return accuracy_results, time_results, memory_results
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение тестов простоты")
+    parser.add_argument('--output', choices=OUTPUT_FORMATS, default='plot',
+                        help="plot - графики с окном, png - только файлы, csv/json - только числа")
+    parser.add_argument('--processes', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
     print("Программа тестирования простых чисел")
     print("Анализ зависимостей от параметров\n")
     
@@ -449,7 +455,10 @@ if __name__ == "__main__":
         base_test_count=100,
         base_max_number=1000,
         base_iterations=10,
-        num_runs_per_setting=3
+        num_runs_per_setting=3,
+        processes=args.processes,
+        seed=args.seed,
+        output=args.output
     )
     
     print("\nАнализ завершён!")
\ No newline at end of file
@@ -0,0 +1,141 @@
+import math
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from sieve import SEGMENT_SIZE, _segment_bounds, _sieve_segment, small_primes
+
+# Формат файла: заголовок, битовая карта нечётных чисел (бит i - число 2i + 1,
+# младший бит байта первый), затем префиксные суммы простых по блокам
+MAGIC = b'PRIMEBM1'
+HEADER = struct.Struct('<8sQQQ')  # magic, limit, байт в блоке, длина карты
+BLOCK_BYTES = 512
+PREFIX_CHUNK_BLOCKS = 4096  # блоков на проход при подсчёте префиксов
+
+# Число единичных битов для каждого значения байта
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint64)
+
+
+class PrimeOracle:
+    """
+    Таблица простых до limit в виде битовой карты на диске, открытой через mmap.
+    is_prime и prime_pi работают за O(1) и не строят множеств в памяти.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.limit, self.block_bytes, self.bitmap_bytes = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: не файл таблицы простых")
+
+        self._bitmap = HEADER.size
+        blocks = self.bitmap_bytes // self.block_bytes + 1
+        self._prefix = np.frombuffer(self._map, dtype='<u8', count=blocks,
+                                     offset=HEADER.size + self.bitmap_bytes)
+
+    @classmethod
+    def build(cls, path: str, limit: int, segment_size: int = SEGMENT_SIZE) -> 'PrimeOracle':
+        """Строит таблицу сегментированным решетом и открывает её"""
+        bitmap_bytes = ((limit + 1) // 2 + 7) // 8
+        base_primes = small_primes(math.isqrt(limit))
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, 'w+b') as f:
+            f.write(HEADER.pack(MAGIC, limit, BLOCK_BYTES, bitmap_bytes))
+
+            # Байтовые флаги сегментов упаковываются по 8; число 1 не простое
+            pending = bytearray(b'\x00')
+            for low, high in _segment_bounds(limit, segment_size):
+                pending += _sieve_segment(low, high, base_primes)
+                aligned = len(pending) // 8 * 8
+                f.write(np.packbits(np.frombuffer(pending, dtype=np.uint8, count=aligned),
+                                    bitorder='little').tobytes())
+                del pending[:aligned]
+            if pending:
+                f.write(np.packbits(np.frombuffer(pending, dtype=np.uint8),
+                                    bitorder='little').tobytes())
+
+            # Префиксные суммы: prefix[b] - число нечётных простых в блоках до b
+            f.flush()
+            blocks = bitmap_bytes // BLOCK_BYTES
+            prefix = np.zeros(blocks + 1, dtype='<u8')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as written:
+                step = PREFIX_CHUNK_BLOCKS
+                for first in range(0, blocks, step):
+                    count = min(step, blocks - first)
+                    chunk = np.frombuffer(written, dtype=np.uint8, count=count * BLOCK_BYTES,
+                                          offset=HEADER.size + first * BLOCK_BYTES)
+                    sums = _POPCOUNT[chunk].reshape(count, BLOCK_BYTES).sum(axis=1)
+                    prefix[first + 1:first + count + 1] = prefix[first] + np.cumsum(sums)
+                    del chunk
+            f.write(prefix.tobytes())
+
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    @classmethod
+    def ensure(cls, path: str, limit: int) -> 'PrimeOracle':
+        """Открывает таблицу, перестраивая её, если файла нет или он покрывает меньше limit"""
+        if os.path.exists(path):
+            oracle = cls(path)
+            if oracle.limit >= limit:
+                return oracle
+            oracle.close()
+        return cls.build(path, limit)
+
+    def _check(self, n: int) -> None:
+        if n > self.limit:
+            raise ValueError(f"{n} больше границы таблицы {self.limit}")
+
+    def is_prime(self, n: int) -> bool:
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        self._check(n)
+        i = n >> 1
+        return bool(self._map[self._bitmap + (i >> 3)] >> (i & 7) & 1)
+
+    __contains__ = is_prime
+
+    def prime_pi(self, n: int) -> int:
+        """Число простых, не превосходящих n"""
+        if n < 2:
+            return 0
+        self._check(n)
+
+        # Биты 0 .. bits-1 соответствуют нечётным числам до n
+        bits = (n + 1) // 2
+        full, rest = divmod(bits, 8)
+        block = full // self.block_bytes
+
+        start = self._bitmap + block * self.block_bytes
+        count = int(self._prefix[block])
+        count += int.from_bytes(self._map[start:self._bitmap + full], 'little').bit_count()
+        if rest:
+            count += (self._map[self._bitmap + full] & ((1 << rest) - 1)).bit_count()
+
+        return count + 1  # простое 2
+
+    def prime_count(self, start: int, stop: int) -> int:
+        """Число простых в полуинтервале [start, stop)"""
+        if stop <= start:
+            return 0
+        return self.prime_pi(stop - 1) - self.prime_pi(start - 1)
+
+    def close(self) -> None:
+        self._prefix = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,180 @@
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.patches import Rectangle
+
+def use_headless_backend():
+    """Неинтерактивный бэкенд: графики только сохраняются в файлы"""
+    matplotlib.use('Agg')
+
+def plot_parameter_dependencies(
+    test_counts, acc_tc, time_tc, mem_tc,
+    max_numbers, acc_mn, time_mn, mem_mn,
+    iterations, acc_it, time_it, mem_it,
+    names,
+    show: bool = True
+):
+    colors = ["#f83636", "#1dce61", "#090cc5", "#AD108B", "#F5A300", "#17BECF", "#7F7F7F"]
+    
+    fig, axes = plt.subplots(3, 3, figsize=(18, 15))
+    params = [
+        ('Размер выборки', test_counts, acc_tc, time_tc, mem_tc),
+        ('Макс. число', max_numbers, acc_mn, time_mn, mem_mn),
+        ('Итерации', iterations, acc_it, time_it, mem_it)
+    ]
+    
+    for col, (title, x_vals, acc, tm, mem) in enumerate(params):
+        # Точность
+        ax = axes[0, col]
+        for i, name in enumerate(names):
+            ax.plot(x_vals, acc[name], 'o-', label=name, color=colors[i], linewidth=2)
+        ax.set_title(f'Точность vs {title}', fontweight='bold')
+        ax.set_xlabel(title)
+        ax.set_ylabel('Точность (%)')
+        ax.grid(True, alpha=0.3)
+        if col == 2:
+            ax.legend(fontsize=9)
+
+        # Время
+        ax = axes[1, col]
+        for i, name in enumerate(names):
+            ax.plot(x_vals, tm[name], 's--', label=name, color=colors[i], linewidth=2)
+        ax.set_title(f'Время vs {title}', fontweight='bold')
+        ax.set_xlabel(title)
+        ax.set_ylabel('Время (мс)')
+        ax.grid(True, alpha=0.3)
+
+        # Память
+        ax = axes[2, col]
+        for i, name in enumerate(names):
+            ax.plot(x_vals, mem[name], 'd-.', label=name, color=colors[i], linewidth=2)
+        ax.set_title(f'Память vs {title}', fontweight='bold')
+        ax.set_xlabel(title)
+        ax.set_ylabel('Память (КБ)')
+        ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig('./pr6/prime_tests_parameter_dependency.png', dpi=150, bbox_inches='tight')
+    print("\nГрафик зависимостей сохранён: prime_tests_parameter_dependency.png")
+    if show:
+        plt.show()
+
+def plot_results(results, primes_256, test_numbers, actual_primes, show: bool = True):
+    """Построение графиков"""
+    
+    fig = plt.figure(figsize=(16, 12))
+    
+    names = [r['name'] for r in results]
+    accuracies = [r['accuracy'] for r in results]
+    times = [r['time'] for r in results]
+    memories = [r['memory'] for r in results]
+    
+    colors = ["#f83636", "#1dce61", "#090cc5", "#AD108B", "#F5A300", "#17BECF", "#7F7F7F"]
+    
+    ax1 = plt.subplot(3, 3, 1)
+    bars = ax1.barh(names, accuracies, color=colors)
+    ax1.set_xlabel('Точность (%)', fontsize=11, fontweight='bold')
+    ax1.set_title('Точность алгоритмов', fontsize=13, fontweight='bold', pad=15)
+    ax1.set_xlim(0, 105)
+    for i, (bar, acc) in enumerate(zip(bars, accuracies)):
+        ax1.text(acc + 1, i, f'{acc:.1f}%', va='center', fontweight='bold')
+    ax1.grid(axis='x', alpha=0.3)
+    
+    ax2 = plt.subplot(3, 3, 2)
+    bars = ax2.bar(names, times, color=colors)
+    ax2.set_ylabel('Время (мс)', fontsize=11, fontweight='bold')
+    ax2.set_title('Время выполнения', fontsize=13, fontweight='bold', pad=15)
+    ax2.tick_params(axis='x', rotation=45)
+    for bar, t in zip(bars, times):
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                f'{t:.1f}', ha='center', va='bottom', fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+    
+    ax3 = plt.subplot(3, 3, 3)
+    bars = ax3.bar(names, memories, color=colors)
+    ax3.set_ylabel('Память (КБ)', fontsize=11, fontweight='bold')
+    ax3.set_title('Использование памяти', fontsize=13, fontweight='bold', pad=15)
+    ax3.tick_params(axis='x', rotation=45)
+    for bar, m in zip(bars, memories):
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{m:.1f}', ha='center', va='bottom', fontweight='bold')
+    ax3.grid(axis='y', alpha=0.3)
+    
+    ax4 = plt.subplot(3, 3, 4)
+    x = np.arange(len(accuracies))
+    ax4.plot(x, accuracies, 'o-', color='#4f46e5', linewidth=2, markersize=8)
+    ax4.set_xticks(x)
+    ax4.set_xticklabels(names, rotation=45, ha='right')
+    ax4.set_ylabel('Точность (%)', fontsize=11, fontweight='bold')
+    ax4.set_title('Сравнение точности', fontsize=13, fontweight='bold', pad=15)
+    ax4.grid(True, alpha=0.3)
+    ax4.set_ylim(min(accuracies) - 5, 105)
+    
+    ax5 = plt.subplot(3, 3, 5)
+    normalized_times = [t / max(times) * 100 for t in times]
+    x = np.arange(len(names))
+    width = 0.6
+    bars = ax5.bar(x, normalized_times, width, color=colors)
+    ax5.set_ylabel('Относительное время (%)', fontsize=11, fontweight='bold')
+    ax5.set_title('Относительная скорость', fontsize=13, fontweight='bold', pad=15)
+    ax5.set_xticks(x)
+    ax5.set_xticklabels(names, rotation=45, ha='right')
+    ax5.grid(axis='y', alpha=0.3)
+    
+    ax6 = plt.subplot(3, 3, 6)
+    confusion_data = []
+    for r in results:
+        tp = sum(1 for i, n in enumerate(test_numbers) 
+                if r['predictions'][i] and n in actual_primes)
+        fp = sum(1 for i, n in enumerate(test_numbers) 
+                if r['predictions'][i] and n not in actual_primes)
+        fn = sum(1 for i, n in enumerate(test_numbers) 
+                if not r['predictions'][i] and n in actual_primes)
+        tn = sum(1 for i, n in enumerate(test_numbers) 
+                if not r['predictions'][i] and n not in actual_primes)
+        confusion_data.append([tp, fp, fn, tn])
+    
+    categories = ['TP', 'FP', 'FN', 'TN']
+    x = np.arange(len(categories))
+    width = 0.2
+    for i, (r, data) in enumerate(zip(results, confusion_data)):
+        ax6.bar(x + i * width, data, width, label=r['name'], color=colors[i])
+    ax6.set_ylabel('Количество', fontsize=11, fontweight='bold')
+    ax6.set_title('Матрица ошибок', fontsize=13, fontweight='bold', pad=15)
+    ax6.set_xticks(x + width * (len(results) - 1) / 2)
+    ax6.set_xticklabels(categories)
+    ax6.legend(fontsize=8)
+    ax6.grid(axis='y', alpha=0.3)
+    
+    
+    ax9 = plt.subplot(3, 3, 7)
+    prime_counts = [len([n for n in test_numbers if n in actual_primes])]
+    composite_counts = [len(test_numbers) - prime_counts[0]]
+    x = ['Простые', 'Составные']
+    bars = ax9.bar(x, [prime_counts[0], composite_counts[0]], 
+                   color=['#10b981', '#ef4444'])
+    ax9.set_ylabel('Количество', fontsize=11, fontweight='bold')
+    ax9.set_title('Распределение в выборке', fontsize=13, fontweight='bold', pad=15)
+    for bar in bars:
+        height = bar.get_height()
+        ax9.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(height)}', ha='center', va='bottom', fontweight='bold')
+    
+    plt.tight_layout()
+    plt.savefig('prime_tests_analysis.png', dpi=150, bbox_inches='tight')
+    print("\nГрафик сохранен: prime_tests_analysis.png")
+    if show:
+        plt.show()
+    
+    print(f"\nПростые числа < 256 ({len(primes_256)} чисел):")
+    for i in range(0, len(primes_256), 15):
+        print("  " + " ".join(f"{p:3d}" for p in primes_256[i:i+15]))
+    
+    print("\nСводка результатов:")
+    for r in results:
+        print(f"\n{r['name']}:")
+        print(f"  Точность: {r['accuracy']:.2f}%")
+        print(f"  Время: {r['time']:.2f} мс")
+        print(f"  Память: {r['memory']:.2f} КБ")
@@ -0,0 +1,83 @@
+import hashlib
+import inspect
+import json
+import sqlite3
+from typing import Callable, Optional
+
+
+def code_version(func: Callable) -> str:
+    """
+    Хэш исходного кода функции и всех глобальных функций, которые она вызывает
+    (транзитивно). Правка алгоритма инвалидирует только его собственные результаты.
+    """
+    digest = hashlib.sha256()
+    seen = set()
+    stack = [func]
+
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        try:
+            digest.update(inspect.getsource(current).encode('utf-8'))
+        except (OSError, TypeError):
+            digest.update(getattr(current, '__qualname__', repr(current)).encode('utf-8'))
+            continue
+
+        code = getattr(current, '__code__', None)
+        if code is None:
+            continue
+        # Вложенные функции и лямбды входят в исходник, смотрим их имена тоже
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if inspect.iscode(const):
+                names.update(const.co_names)
+        for name in sorted(names):
+            value = current.__globals__.get(name)
+            if inspect.isfunction(value):
+                stack.append(value)
+
+    return digest.hexdigest()[:16]
+
+
+class ResultStore:
+    """Хранилище результатов ячеек бенчмарка в SQLite"""
+
+    KEY_FIELDS = ('algorithm', 'test_count', 'max_number', 'iterations', 'seed', 'repeats', 'code_version')
+
+    def __init__(self, path: str):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS results ("
+            f"{', '.join(self.KEY_FIELDS)}, record TEXT NOT NULL, "
+            f"PRIMARY KEY ({', '.join(self.KEY_FIELDS)}))"
+        )
+        self.connection.commit()
+
+    def get(self, key: tuple) -> Optional[dict]:
+        where = ' AND '.join(f"{field} = ?" for field in self.KEY_FIELDS)
+        row = self.connection.execute(f"SELECT record FROM results WHERE {where}", key).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def put(self, key: tuple, record: dict) -> None:
+        placeholders = ', '.join('?' * (len(self.KEY_FIELDS) + 1))
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO results VALUES ({placeholders})",
+            (*key, json.dumps(record, ensure_ascii=False))
+        )
+        self.connection.commit()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,5 +1,19 @@
+import os
 import random
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, Sequence, Tuple, Union
+
+import numpy as np
+
+# Число параллельных дорожек LCG при пакетной генерации гаммы
+LANES = 4096
+
+# Размер блока при потоковом шифровании
+CHUNK_SIZE = 1 << 20
+
+# Наименьший диапазон на процесс: меньшие данные шифруются без пула процессов
+PARALLEL_MIN_SIZE = 1 << 20
+
 
 class PseudoRandomGenerator:
     """Генератор псевдослучайных чисел (линейный конгруэнтный метод)"""
@@ -21,32 +35,245 @@ class PseudoRandomGenerator:
         """Генерирует псевдослучайный байт (0-255)"""
         return self.next() % 256
 
+    def jump(self, steps: int) -> Tuple[int, int]:
+        """
+        Коэффициенты (A, C) перехода на steps шагов: x -> (A*x + C) mod m.
+        Композиция аффинных отображений возведением в степень за O(log steps).
+        """
+        A, C = 1, 0  # тождественное отображение
+        a, c = self.a, self.c
+        while steps > 0:
+            if steps & 1:
+                A, C = (a * A) % self.m, (a * C + c) % self.m
+            # Отображение за 2^k шагов: применить (a, c) дважды
+            a, c = (a * a) % self.m, (a * c + c) % self.m
+            steps >>= 1
+        return A, C
+
+    def advance(self, steps: int) -> None:
+        """Пропускает steps чисел последовательности"""
+        A, C = self.jump(steps)
+        self.current = (A * self.current + C) % self.m
+
+    def seek(self, offset: int) -> None:
+        """Переходит к позиции offset от начала последовательности за O(log offset)"""
+        if offset < 0:
+            raise ValueError(f"Отрицательная позиция: {offset}")
+        self.current = self.seed
+        self.advance(offset)
+
+    def next_states(self, length: int) -> np.ndarray:
+        """
+        Следующие length чисел последовательности массивом (uint32 или uint64).
+        Дорожка j порождает числа j, j + L, j + 2L, ...; шаг дорожки -
+        переход на L чисел, полученный через jump.
+        """
+        if length <= 0:
+            return np.empty(0, dtype=np.uint64)
+
+        lanes = min(LANES, length)
+        m = np.uint64(self.m)
+
+        # Начальные состояния дорожек удвоением: блок из k чисел -> 2k чисел
+        states = np.array([(self.a * self.current + self.c) % self.m], dtype=np.uint64)
+        while len(states) < lanes:
+            A, C = self.jump(len(states))
+            states = np.concatenate([states, (np.uint64(A) * states + np.uint64(C)) % m])
+        states = states[:lanes]
+
+        A, C = self.jump(lanes)
+        rows = -(-length // lanes)
+
+        if self.m & (self.m - 1) == 0 and self.m <= 2**32:
+            # m - степень двойки: считаем в uint32 с переполнением и маской
+            dtype, mask = np.uint32, np.uint32(self.m - 1)
+        else:
+            # Произведение A * x < m^2 помещается в uint64 при m <= 2^32
+            dtype, mask = np.uint64, None
+        A, C = dtype(A), dtype(C)
+
+        out = np.empty((rows, lanes), dtype=dtype)
+        out[0] = states
+        for row in range(1, rows):
+            current = out[row]
+            np.multiply(out[row - 1], A, out=current)
+            current += C
+            if mask is None:
+                current %= m
+            else:
+                current &= mask
+
+        self.advance(length)
+        return out.ravel()[:length]
+
+    def next_bytes(self, length: int) -> np.ndarray:
+        """Генерирует length псевдослучайных байтов массивом uint8 (как next_byte)"""
+        return self.next_states(length).astype(np.uint8)
+
 
 class GammaCipher:
     """Шифр гаммирования (XOR-шифрование)"""
     
     def __init__(self, seed: int = 42):
+        self.seed = seed
         self.generator = PseudoRandomGenerator(seed)
     
-    def generate_gamma(self, length: int) -> List[int]:
-        """Генерирует гамму заданной длины"""
-        return [self.generator.next_byte() for _ in range(length)]
+    def generate_gamma(self, length: int) -> np.ndarray:
+        """Генерирует гамму заданной длины (массив uint8)"""
+        return self.generator.next_bytes(length)
     
-    def encrypt(self, plaintext: str) -> Tuple[bytes, List[int]]:
+    def encrypt(self, plaintext: str) -> Tuple[bytes, np.ndarray]:
         """
         Шифрует открытый текст
         Возвращает: (зашифрованные байты, использованная гамма)
         """
-        plaintext_bytes = plaintext.encode('utf-8')
+        plaintext_bytes = np.frombuffer(plaintext.encode('utf-8'), dtype=np.uint8)
         gamma = self.generate_gamma(len(plaintext_bytes))
         
         # XOR каждого байта с соответствующим байтом гаммы
-        ciphertext = bytes(pb ^ g for pb, g in zip(plaintext_bytes, gamma))
+        ciphertext = np.bitwise_xor(plaintext_bytes, gamma).tobytes()
         
         return ciphertext, gamma
     
-    def decrypt(self, ciphertext: bytes, gamma: List[int]) -> str:
+    def decrypt(self, ciphertext: bytes, gamma: Union[np.ndarray, Sequence[int]]) -> str:
         """Дешифрует зашифрованный текст используя гамму"""
         # XOR работает в обе стороны: encrypt = decrypt
-        plaintext_bytes = bytes(cb ^ g for cb, g in zip(ciphertext, gamma))
+        ciphertext_bytes = np.frombuffer(ciphertext, dtype=np.uint8)
+        gamma = np.asarray(gamma, dtype=np.uint8)[:len(ciphertext_bytes)]
+        plaintext_bytes = np.bitwise_xor(ciphertext_bytes[:len(gamma)], gamma).tobytes()
         return plaintext_bytes.decode('utf-8')
+
+    # Потоковый режим: гамма каждый раз порождается заново из seed
+    # и не возвращается, память - O(chunk_size)
+
+    def _generator_at(self, offset: int) -> PseudoRandomGenerator:
+        generator = PseudoRandomGenerator(self.seed)
+        generator.seek(offset)
+        return generator
+
+    def crypt_range(self, data: bytes, offset: int = 0) -> bytes:
+        """
+        Шифрует (дешифрует) фрагмент, начинающийся с байта offset потока.
+        Даёт произвольный доступ: предшествующую гамму генерировать не нужно.
+        """
+        gamma = self._generator_at(offset).next_bytes(len(data))
+        return np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), gamma).tobytes()
+
+    def crypt_stream(
+        self,
+        source: BinaryIO,
+        destination: BinaryIO,
+        chunk_size: int = CHUNK_SIZE,
+        offset: int = 0,
+        length: int = None
+    ) -> int:
+        """
+        Шифрует (или дешифрует - операция та же) поток source в destination
+        блоками по chunk_size байт с переиспользуемым буфером.
+        offset - позиция первого байта source в шифруемом потоке,
+        length - сколько байт обработать (по умолчанию до конца source).
+        Возвращает число обработанных байт.
+        """
+        generator = self._generator_at(offset)
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        total = 0
+
+        while length is None or total < length:
+            limit = chunk_size if length is None else min(chunk_size, length - total)
+            size = source.readinto(view[:limit])
+            if not size:
+                break
+            block = data[:size]
+            np.bitwise_xor(block, generator.next_bytes(size), out=block)
+            destination.write(view[:size])
+            total += size
+
+        return total
+
+    encrypt_stream = decrypt_stream = crypt_stream
+
+    def crypt_chunks(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Шифрует (дешифрует) последовательность блоков байт.
+        Блоки bytearray обрабатываются на месте, остальные копируются.
+        """
+        generator = PseudoRandomGenerator(self.seed)
+
+        for chunk in chunks:
+            gamma = generator.next_bytes(len(chunk))
+            if isinstance(chunk, bytearray):
+                data = np.frombuffer(chunk, dtype=np.uint8)
+                np.bitwise_xor(data, gamma, out=data)
+                yield chunk
+            else:
+                yield np.bitwise_xor(np.frombuffer(chunk, dtype=np.uint8), gamma).tobytes()
+
+    def crypt_file(self, source_path: str, destination_path: str, chunk_size: int = CHUNK_SIZE) -> int:
+        """Шифрует (дешифрует) файл source_path в destination_path"""
+        with open(source_path, 'rb') as source, open(destination_path, 'wb') as destination:
+            return self.crypt_stream(source, destination, chunk_size)
+
+    def crypt_parallel(self, data: bytes, processes: int = None, offset: int = 0) -> bytes:
+        """
+        Шифрует (дешифрует) данные, разбивая их на диапазоны по процессам.
+        На каждый процесс приходится не меньше PARALLEL_MIN_SIZE байт;
+        если хватает одного процесса, пул не запускается.
+        """
+        if not data:
+            return b''
+        processes = min(processes or os.cpu_count(), -(-len(data) // PARALLEL_MIN_SIZE))
+        if processes == 1:
+            return self.crypt_range(data, offset)
+
+        step = -(-len(data) // processes)
+        starts = range(0, len(data), step)
+
+        with ProcessPoolExecutor(processes) as pool:
+            parts = pool.map(_crypt_range, [self.seed] * len(starts),
+                             [data[start:start + step] for start in starts],
+                             [offset + start for start in starts])
+            return b''.join(parts)
+
+    def crypt_file_parallel(
+        self,
+        source_path: str,
+        destination_path: str,
+        processes: int = None,
+        chunk_size: int = CHUNK_SIZE
+    ) -> int:
+        """
+        Шифрует (дешифрует) файл в processes процессах: каждый обрабатывает
+        свой диапазон байт, начиная с перехода генератора к его началу,
+        и пишет результат по тому же смещению в destination_path.
+        Файлы меньше PARALLEL_MIN_SIZE на процесс шифруются без пула (crypt_file).
+        """
+        size = os.path.getsize(source_path)
+        processes = min(processes or os.cpu_count(), -(-size // PARALLEL_MIN_SIZE))
+        if processes <= 1:
+            return self.crypt_file(source_path, destination_path, chunk_size)
+
+        with open(destination_path, 'wb') as destination:
+            destination.truncate(size)
+
+        step = -(-size // processes)
+        ranges = [(start, min(start + step, size)) for start in range(0, size, step)]
+
+        with ProcessPoolExecutor(processes) as pool:
+            futures = [
+                pool.submit(_crypt_file_range, self.seed, source_path, destination_path, start, stop, chunk_size)
+                for start, stop in ranges
+            ]
+            return sum(future.result() for future in futures)
+
+
+def _crypt_range(seed: int, data: bytes, offset: int) -> bytes:
+    return GammaCipher(seed).crypt_range(data, offset)
+
+
+def _crypt_file_range(seed: int, source_path: str, destination_path: str, start: int, stop: int, chunk_size: int) -> int:
+    with open(source_path, 'rb') as source, open(destination_path, 'r+b') as destination:
+        source.seek(start)
+        destination.seek(start)
+        return GammaCipher(seed).crypt_stream(source, destination, chunk_size, offset=start, length=stop - start)
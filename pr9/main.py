@@ -1,3 +1,4 @@
+import sys
 from typing import Tuple
 from gamma import GammaCipher
 
@@ -23,5 +24,15 @@ def main():
     print(f"Дешифрованный текст: {decrypted}")
     print(f"Совпадение: {plaintext == decrypted}")
 
+    # Потоковое шифрование файла: python main.py <файл>
+    if len(sys.argv) > 1:
+        source = sys.argv[1]
+        encrypted, decrypted = f"{source}.enc", f"{source}.dec"
+
+        size = cipher.crypt_file(source, encrypted)
+        cipher.crypt_file(encrypted, decrypted)
+        print(f"\nФайл {source} ({size} байт) зашифрован: {encrypted}")
+        print(f"Расшифрован: {decrypted}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
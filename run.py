@@ -0,0 +1,25 @@
+"""
+Необязательный запуск скриптов практик из корня репозитория:
+
+    python run.py pr6/main.py --output png
+    python run.py pr11-12/main.py
+
+Как и при `python <скрипт>`, каталог скрипта становится первым в sys.path;
+следом добавляется корень репозитория, чтобы скрипты видели общий пакет common.
+Сами скрипты добавляют корень репозитория в sys.path и запускаются напрямую.
+"""
+import runpy
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+
+    script = Path(sys.argv[1]).resolve()
+    sys.argv = sys.argv[1:]
+    sys.path[0] = str(script.parent)
+    sys.path.insert(1, str(ROOT))
+    runpy.run_path(str(script), run_name='__main__')
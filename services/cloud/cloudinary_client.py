@@ -1,10 +1,39 @@
+import re
 import cloudinary
 import cloudinary.api
+import cloudinary.exceptions
 import cloudinary.uploader
+from cloudinary.api_client.execute_request import EXCEPTION_CODES
 from cloudinary.utils import cloudinary_url
 from settings import CLOUDINARY_CLIENT_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET
 from datetime import datetime
 
+# Тайм-аут одного запроса загрузки, с
+UPLOAD_TIMEOUT = 60
+
+# HTTP-коды, после которых загрузку имеет смысл повторить: превышение лимита
+# запросов и ошибки на стороне сервера или шлюза
+TRANSIENT_HTTP_CODES = frozenset({420, 429, 500, 502, 503, 504})
+
+# cloudinary.uploader оборачивает сбои соединения и тайм-ауты (socket, urllib3)
+# и неразобранные ответы шлюза в базовый cloudinary.exceptions.Error
+_WRAPPED_NETWORK_ERROR = re.compile(r'^(Socket error|Unexpected error)')
+_UNPARSED_RESPONSE = re.compile(r'^Error parsing server response \((\d+)\)')
+
+
+class TransientUploadError(cloudinary.exceptions.Error):
+    """Временная ошибка загрузки: сбой соединения, тайм-аут, лимит запросов, 5xx"""
+
+
+# Ошибки, после которых загрузку имеет смысл повторить
+TRANSIENT_ERRORS = (
+    TransientUploadError,
+    cloudinary.exceptions.RateLimited,
+    cloudinary.exceptions.GeneralError,
+    ConnectionError,
+    TimeoutError,
+)
+
 class CloudinaryImaging:
 
     def __init__(self):
@@ -15,14 +44,58 @@ class CloudinaryImaging:
             secure=True,
         )
 
-    def upload_img(self, image_name, img_type, path):
+    @staticmethod
+    def timestamp():
+        return datetime.now().strftime('%d_%m_%Y_%H:%M:%S.%f')
+
+    @staticmethod
+    def make_public_id(image_name, img_type, stamp=None, row=None):
+        """public_id изображения; stamp - время запуска (по умолчанию текущее), row - номер строки манифеста"""
+        stamp = stamp or CloudinaryImaging.timestamp()
+        public_id = f"{image_name}_{img_type}_{stamp}"
+        return public_id if row is None else f"{public_id}_{row}"
+
+    @staticmethod
+    def _is_transient(error):
+        """Относится ли обёрнутая cloudinary ошибка к временным"""
+        message = str(error)
+        if _WRAPPED_NETWORK_ERROR.match(message):
+            return True
+        parsed = _UNPARSED_RESPONSE.match(message)
+        return parsed is not None and int(parsed.group(1)) in TRANSIENT_HTTP_CODES
+
+    def upload(self, image_name, img_type, path, public_id=None, timeout=UPLOAD_TIMEOUT):
+        """
+        Загружает изображение; при ошибке бросает исключение, временные -
+        TransientUploadError (см. TRANSIENT_ERRORS).
+        public_id задаётся один раз на изображение: повтор после тайм-аута
+        перезаписывает (overwrite) ту же загрузку, а не создаёт копию.
+        """
         try:
-            response = cloudinary.uploader.upload(
-                path, 
-                public_id=f"{image_name}_{img_type}_{datetime.now().strftime('%d_%m_%Y_%H:%M:%S.%f')}", 
-                tags=[image_name, img_type]
+            result = cloudinary.uploader.upload(
+                path,
+                public_id=public_id or self.make_public_id(image_name, img_type),
+                overwrite=True,
+                tags=[image_name, img_type],
+                timeout=timeout,
+                return_error=True,
             )
-            return response
+        except cloudinary.exceptions.Error as e:
+            if self._is_transient(e):
+                raise TransientUploadError(str(e)) from e
+            raise
+
+        error = result.get('error')
+        if error:
+            code, message = error.get('http_code'), error.get('message')
+            if code in TRANSIENT_HTTP_CODES:
+                raise TransientUploadError(f"{code}: {message}")
+            raise EXCEPTION_CODES.get(code, cloudinary.exceptions.Error)(message)
+        return result
+
+    def upload_img(self, image_name, img_type, path, public_id=None):
+        try:
+            return self.upload(image_name, img_type, path, public_id)
         except Exception as e:
             print(f"Ошибка при загрузке изображения: {e}")
             return None
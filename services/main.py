@@ -1,23 +1,44 @@
 import csv
 import argparse
-from cloud.cloudinary_client import CloudinaryImaging
+from cloud.cloudinary_client import CloudinaryImaging, TRANSIENT_ERRORS
+from uploader import DEFAULT_CONCURRENCY, UploadEngine, UploadTask
 
-def csv_parse(file_path):
-    name_type = set()
+imaging = CloudinaryImaging()
+
+def read_manifest(file_path):
+    """
+    Строки CSV-манифеста (Path;Name;Type) без заголовка и пустых строк.
+    public_id строки вычисляется здесь один раз (время запуска и номер
+    строки) и не меняется между повторами загрузки.
+    """
+    stamp = CloudinaryImaging.timestamp()
     with open(file_path, newline='', encoding="UTF-8") as csvfile:
         spamreader = csv.reader(csvfile, delimiter=';', quotechar='|')
-        for path, name, _type in spamreader:
+        next(spamreader, None)
+        return [
+            UploadTask(path, name, _type, CloudinaryImaging.make_public_id(name, _type, stamp, row))
+            for row, (path, name, _type) in enumerate(filter(None, spamreader), 1)
+        ]
+
+def csv_parse(file_path, concurrency=DEFAULT_CONCURRENCY):
+    """Загружает изображения манифеста параллельно, возвращает загруженные (имя, тип)"""
+    name_type = set()
+    engine = UploadEngine(imaging.upload, concurrency=concurrency, transient_errors=TRANSIENT_ERRORS)
+    for result in engine.upload_all(read_manifest(file_path)):
+        name, _type, path = result.task.name, result.task.img_type, result.task.path
+        if not result.ok:
+            print(f"error uploading image: {name} {_type} {path} ({result.attempts} attempts): {result.error}")
+        else:
             print(name, _type)
-            name_type.add("asd")
-            if not imaging.upload_img(name, _type, path):
-                print(f"error uploafing image: {name} {_type} {path}")
-            else:
-                name_type.add((name, _type))
+            name_type.add((name, _type))
     return name_type
 
 def main(args):
-    for name, _type in csv_parse(args):
+    for name, _type in csv_parse(args.manifest, args.concurrency):
         print(*((name, _type, url) for url in imaging.get_img_urls(name)), sep="\n")
 
-if __name__ == "Main":
-    main("asd")
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Загрузка изображений из CSV-манифеста в Cloudinary")
+    parser.add_argument('manifest', nargs='?', default='images.csv')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="одновременных загрузок")
+    main(parser.parse_args())
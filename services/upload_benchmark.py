@@ -0,0 +1,104 @@
+import argparse
+import random
+import threading
+import time
+
+from uploader import DEFAULT_CONCURRENCY, UploadEngine, UploadTask
+
+# Параметры локальной заглушки: задержка ответа, с, и доля временных ошибок
+LATENCY = 0.05
+FAILURE_RATE = 0.05
+TASK_COUNT = 200
+
+
+class FakeUploadEndpoint:
+    """
+    Локальная заглушка загрузки в Cloudinary: отвечает через latency секунд,
+    с вероятностью failure_rate бросает ConnectionError (временная ошибка).
+    Потокобезопасна; считает вызовы и одновременные запросы.
+    """
+
+    def __init__(self, latency: float = LATENCY, failure_rate: float = FAILURE_RATE, seed: int = None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, image_name, img_type, path, public_id=None):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            fail = self.rng.random() < self.failure_rate
+        try:
+            time.sleep(self.latency)
+            if fail:
+                raise ConnectionError(f"временная ошибка загрузки {path}")
+            return {'public_id': public_id or f"{image_name}_{img_type}", 'secure_url': f"https://fake/{image_name}/{path}"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def serial_upload(endpoint, tasks):
+    """Прежний цикл csv_parse: по одной загрузке без повторов"""
+    uploaded = []
+    for task in tasks:
+        try:
+            uploaded.append(endpoint(task.name, task.img_type, task.path, task.public_id))
+        except ConnectionError:
+            uploaded.append(None)
+    return uploaded
+
+
+def compare(task_count: int = TASK_COUNT, concurrency: int = DEFAULT_CONCURRENCY,
+            latency: float = LATENCY, failure_rate: float = FAILURE_RATE, seed: int = 42) -> dict:
+    """Пропускная способность последовательного цикла и UploadEngine на заглушке"""
+    tasks = [UploadTask(f"./images/{i}.jpg", f"image{i}", "Icon", f"image{i}_Icon") for i in range(task_count)]
+
+    endpoint = FakeUploadEndpoint(latency, failure_rate, seed)
+    start = time.perf_counter()
+    serial = serial_upload(endpoint, tasks)
+    serial_time = time.perf_counter() - start
+
+    endpoint = FakeUploadEndpoint(latency, failure_rate, seed)
+    engine = UploadEngine(endpoint, concurrency=concurrency, backoff_base=latency, rng=random.Random(seed))
+    start = time.perf_counter()
+    results = engine.upload_all(tasks)
+    engine_time = time.perf_counter() - start
+
+    assert [result.task for result in results] == tasks
+
+    row = {
+        'tasks': task_count,
+        'serial_per_sec': task_count / serial_time,
+        'serial_failed': sum(response is None for response in serial),
+        'engine_per_sec': task_count / engine_time,
+        'engine_failed': sum(not result.ok for result in results),
+        'engine_calls': endpoint.calls,
+        'max_active': endpoint.max_active,
+        'speedup': serial_time / engine_time,
+    }
+
+    print(f"Заглушка: задержка {latency * 1e3:.0f} мс, временных ошибок {failure_rate:.0%}, загрузок {task_count}")
+    print(f"{'Последовательно':<26} {row['serial_per_sec']:>8.1f} загрузок/с, не загружено {row['serial_failed']}")
+    print(f"{f'UploadEngine ({concurrency} потоков)':<26} {row['engine_per_sec']:>8.1f} загрузок/с, "
+          f"не загружено {row['engine_failed']}, запросов {row['engine_calls']}, "
+          f"одновременно до {row['max_active']}")
+    print(f"Ускорение: {row['speedup']:.1f}x")
+
+    return row
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение последовательной и параллельной загрузки на заглушке")
+    parser.add_argument('--tasks', type=int, default=TASK_COUNT)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--latency', type=float, default=LATENCY, help="задержка ответа, с")
+    parser.add_argument('--failure-rate', type=float, default=FAILURE_RATE)
+    args = parser.parse_args()
+
+    compare(args.tasks, args.concurrency, args.latency, args.failure_rate)
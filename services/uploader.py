@@ -0,0 +1,96 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+# Число одновременных загрузок по умолчанию
+DEFAULT_CONCURRENCY = 8
+
+# Повторы: число попыток на изображение и границы задержки между ними, с
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+
+
+class UploadTask(NamedTuple):
+    """
+    Строка манифеста: путь (или URL), имя и тип изображения.
+    public_id задаётся один раз и передаётся при каждой попытке,
+    поэтому повтор не создаёт копию уже загруженного изображения.
+    """
+    path: str
+    name: str
+    img_type: str
+    public_id: Optional[str] = None
+
+
+class UploadResult(NamedTuple):
+    task: UploadTask
+    response: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX,
+                  rng: random.Random = random) -> float:
+    """
+    Задержка перед повтором номер attempt (с 0): экспонента base * 2^attempt,
+    ограниченная cap, со случайным разбросом на всю величину (full jitter),
+    чтобы одновременно упавшие загрузки не повторялись разом.
+    """
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class UploadEngine:
+    """
+    Параллельная загрузка изображений в пуле из concurrency потоков.
+    upload(image_name, img_type, path, public_id) выполняет одну загрузку и при ошибке
+    бросает исключение; ошибки из transient_errors повторяются с задержкой
+    backoff_delay, остальные сразу попадают в результат.
+    """
+
+    def __init__(
+        self,
+        upload: Callable[[str, str, str, Optional[str]], Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_attempts: int = MAX_ATTEMPTS,
+        transient_errors: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError),
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        if concurrency < 1 or max_attempts < 1:
+            raise ValueError(f"concurrency и max_attempts должны быть положительными: {concurrency}, {max_attempts}")
+        self.upload = upload
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.transient_errors = transient_errors
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+
+    def upload_one(self, task: UploadTask) -> UploadResult:
+        """Загружает одно изображение с повторами при временных ошибках"""
+        for attempt in range(self.max_attempts):
+            try:
+                response = self.upload(task.name, task.img_type, task.path, task.public_id)
+                return UploadResult(task, response, None, attempt + 1)
+            except self.transient_errors as e:
+                if attempt + 1 == self.max_attempts:
+                    return UploadResult(task, None, e, attempt + 1)
+                self.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max, self.rng))
+            except Exception as e:
+                return UploadResult(task, None, e, attempt + 1)
+
+    def upload_all(self, tasks: Iterable[UploadTask]) -> List[UploadResult]:
+        """Загружает все изображения; результаты - в порядке tasks"""
+        if self.concurrency == 1:
+            return [self.upload_one(task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return list(pool.map(self.upload_one, tasks))
@@ -0,0 +1,38 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script(relative_path: str, name: str):
+    """
+    Импорт скрипта практики по пути: main.py и benchmark.py есть в нескольких
+    каталогах, и по имени из sys.path нашёлся бы первый попавшийся
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+        module = importlib.util.module_from_spec(spec)
+        # Модуль должен находиться по имени: функции из него передаются в пул процессов
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def pr6_main():
+    return load_script('pr6/main.py', 'pr6_main')
+
+
+@pytest.fixture(scope='session')
+def rsa_keypair():
+    """Пара ключей RSA-1024 из фиксированного зерна (без вывода generate_keys)"""
+    from rsa import RSA, PrimeGenerator, XorShiftStarPRNG
+
+    prng = XorShiftStarPRNG(2024)
+    p = PrimeGenerator.generate_probable_prime(prng, 512)
+    q = PrimeGenerator.generate_probable_prime(prng, 512)
+    return RSA.keypair_from_primes(p, q)
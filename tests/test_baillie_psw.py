@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from common.primality import is_prime
+
+# Числа Кармайкла и сильные псевдопростые по основанию 2 - их отсеивает тест Люка
+CARMICHAEL = [561, 1105, 1729, 2465, 2821, 6601, 8911, 41041, 825265, 321197185]
+BASE2_STRONG_PSEUDOPRIMES = [2047, 3277, 4033, 4681, 8321, 15841, 29341, 42799, 49141, 52633]
+# Сильные псевдопростые Люка (параметры Селфриджа) - их отсеивает основание 2
+STRONG_LUCAS_PSEUDOPRIMES = [5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309, 58519]
+
+
+def test_agrees_with_miller_rabin_on_small_numbers(pr6_main):
+    assert all(pr6_main.baillie_psw_test(n) == is_prime(n) for n in range(100_000))
+
+
+def test_agrees_with_miller_rabin_on_random_64_bit_numbers(pr6_main):
+    rng = random.Random(5)
+    numbers = [rng.getrandbits(64) | 1 for _ in range(2000)]
+    assert [pr6_main.baillie_psw_test(n) for n in numbers] == [is_prime(n) for n in numbers]
+
+
+@pytest.mark.parametrize('n', CARMICHAEL + BASE2_STRONG_PSEUDOPRIMES + STRONG_LUCAS_PSEUDOPRIMES)
+def test_pseudoprimes_are_rejected(pr6_main, n):
+    assert not pr6_main.baillie_psw_test(n)
+
+
+def test_strong_lucas_pseudoprimes_pass_the_lucas_part(pr6_main):
+    # Без проверки по основанию 2 эти числа прошли бы: тест Люка сам по себе их не ловит
+    for n in STRONG_LUCAS_PSEUDOPRIMES:
+        D = 5
+        while pr6_main.jacobi_symbol(D, n) != -1:
+            D = -D - 2 if D > 0 else -D + 2
+        assert pr6_main.strong_lucas_test(n, D, 1, (1 - D) // 4)
+
+
+@pytest.mark.parametrize('n', [2 ** 61 - 1, 2 ** 89 - 1, 2 ** 127 - 1, 2 ** 521 - 1])
+def test_large_primes(pr6_main, n):
+    assert pr6_main.baillie_psw_test(n)
+
+
+def test_squares_are_rejected(pr6_main):
+    assert not any(pr6_main.baillie_psw_test(p * p) for p in (3, 5, 7, 11, 10007, 2 ** 31 - 1))
+
+
+def test_jacobi_symbol(pr6_main):
+    # Критерий Эйлера для простого модуля
+    p = 10007
+    for a in range(1, 200):
+        assert pr6_main.jacobi_symbol(a, p) % p == pow(a, (p - 1) // 2, p)
+    assert pr6_main.jacobi_symbol(5, 15) == 0
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from batch import DETERMINISTIC_BASES_32, jacobi, miller_rabin_batch, powmod, solovay_strassen_batch
+from common.primality import is_prime
+
+SMALL = np.arange(20_000)
+EXPECTED_SMALL = np.array([is_prime(int(n)) for n in SMALL])
+
+
+def random_words(count, seed):
+    rng = random.Random(seed)
+    return np.array([rng.getrandbits(32) | 1 for _ in range(count)], dtype=np.uint64)
+
+
+def test_deterministic_miller_rabin_matches_scalar():
+    np.testing.assert_array_equal(miller_rabin_batch(SMALL, bases=DETERMINISTIC_BASES_32), EXPECTED_SMALL)
+
+    numbers = random_words(3000, 1)
+    expected = [is_prime(int(n)) for n in numbers]
+    np.testing.assert_array_equal(miller_rabin_batch(numbers, bases=DETERMINISTIC_BASES_32), expected)
+
+
+def test_random_bases_match_scalar():
+    rng = np.random.default_rng(2)
+    numbers = random_words(2000, 2)
+    expected = [is_prime(int(n)) for n in numbers]
+
+    np.testing.assert_array_equal(miller_rabin_batch(numbers, 20, rng), expected)
+    np.testing.assert_array_equal(solovay_strassen_batch(numbers, 20, rng), expected)
+    np.testing.assert_array_equal(solovay_strassen_batch(SMALL, 20, rng), EXPECTED_SMALL)
+
+
+def test_largest_word_values():
+    numbers = np.array([2 ** 32 - 5, 2 ** 32 - 1, 2 ** 32 - 17, 4294967291], dtype=np.uint64)
+    expected = [is_prime(int(n)) for n in numbers]
+    np.testing.assert_array_equal(miller_rabin_batch(numbers, bases=DETERMINISTIC_BASES_32), expected)
+
+
+def test_strong_pseudoprimes_to_some_bases():
+    # 3215031751 - сильное псевдопростое по основаниям 2, 3, 5, 7, но не 61
+    assert not miller_rabin_batch([2047, 3215031751], bases=DETERMINISTIC_BASES_32).any()
+    assert miller_rabin_batch([3215031751], bases=(2, 3, 5, 7)).all()
+
+
+def test_powmod_and_jacobi_match_scalar():
+    rng = random.Random(4)
+    modulus = np.array([rng.getrandbits(32) | 1 for _ in range(500)], dtype=np.uint64)
+    base = np.array([rng.getrandbits(32) for _ in range(500)], dtype=np.uint64)
+    exponent = np.array([rng.getrandbits(32) for _ in range(500)], dtype=np.uint64)
+
+    expected = [pow(int(b), int(e), int(m)) for b, e, m in zip(base, exponent, modulus)]
+    np.testing.assert_array_equal(powmod(base, exponent, modulus), expected)
+
+    p = 10007
+    a = np.arange(1, 500, dtype=np.uint64)
+    euler = [1 if pow(int(x), (p - 1) // 2, p) == 1 else -1 for x in a]
+    np.testing.assert_array_equal(jacobi(a, np.full(a.shape, p, dtype=np.uint64)), euler)
+
+
+def test_rejects_out_of_range_values():
+    with pytest.raises(ValueError):
+        miller_rabin_batch([2 ** 32])
+    with pytest.raises(ValueError):
+        solovay_strassen_batch([-1])
@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip('cloudinary')
+pytest.importorskip('dotenv')
+
+import cloudinary.exceptions
+import cloudinary.uploader
+
+from cloud.cloudinary_client import TRANSIENT_ERRORS, UPLOAD_TIMEOUT, CloudinaryImaging, TransientUploadError
+
+
+@pytest.fixture
+def upload_calls(monkeypatch):
+    """Подменяет cloudinary.uploader.upload: отвечает по очереди из responses"""
+    calls = []
+
+    def respond(responses):
+        def upload(path, **options):
+            calls.append(options)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        monkeypatch.setattr(cloudinary.uploader, 'upload', upload)
+        return calls
+
+    return respond
+
+
+@pytest.mark.parametrize('error', [
+    cloudinary.exceptions.Error("Socket error: TimeoutError('timed out')"),
+    cloudinary.exceptions.Error("Unexpected error - ReadTimeoutError('read timed out')"),
+    cloudinary.exceptions.Error("Error parsing server response (502) - b'<html>Bad Gateway</html>'"),
+    cloudinary.exceptions.Error("Error parsing server response (504) - b''"),
+])
+def test_wrapped_network_errors_are_transient(upload_calls, error):
+    upload_calls([error])
+    with pytest.raises(TransientUploadError):
+        CloudinaryImaging().upload('image', 'Icon', './image.jpg', 'image_Icon')
+
+
+@pytest.mark.parametrize('code', [420, 429, 500, 502, 503, 504])
+def test_transient_http_codes(upload_calls, code):
+    upload_calls([{'error': {'http_code': code, 'message': 'try later'}}])
+    with pytest.raises(TRANSIENT_ERRORS):
+        CloudinaryImaging().upload('image', 'Icon', './image.jpg', 'image_Icon')
+
+
+@pytest.mark.parametrize('code, error_type', [
+    (400, cloudinary.exceptions.BadRequest),
+    (401, cloudinary.exceptions.AuthorizationRequired),
+    (404, cloudinary.exceptions.NotFound),
+])
+def test_permanent_http_codes_keep_library_types(upload_calls, code, error_type):
+    upload_calls([{'error': {'http_code': code, 'message': 'no'}}])
+    with pytest.raises(error_type) as info:
+        CloudinaryImaging().upload('image', 'Icon', './image.jpg', 'image_Icon')
+    assert not isinstance(info.value, TRANSIENT_ERRORS)
+
+
+def test_unparsed_client_error_is_permanent(upload_calls):
+    upload_calls([cloudinary.exceptions.Error("Error parsing server response (400) - b''")])
+    with pytest.raises(cloudinary.exceptions.Error) as info:
+        CloudinaryImaging().upload('image', 'Icon', './image.jpg', 'image_Icon')
+    assert not isinstance(info.value, TRANSIENT_ERRORS)
+
+
+def test_upload_is_idempotent(upload_calls):
+    calls = upload_calls([{'public_id': 'image_Icon'}])
+    CloudinaryImaging().upload('image', 'Icon', './image.jpg', 'image_Icon')
+
+    (options,) = calls
+    assert options['public_id'] == 'image_Icon'
+    assert options['overwrite'] is True
+    assert options['timeout'] == UPLOAD_TIMEOUT
+
+
+def test_make_public_id():
+    assert CloudinaryImaging.make_public_id('image', 'Icon', 'stamp') == 'image_Icon_stamp'
+    assert CloudinaryImaging.make_public_id('image', 'Icon', 'stamp', 3) == 'image_Icon_stamp_3'
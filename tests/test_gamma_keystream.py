@@ -0,0 +1,72 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gamma import LANES, GammaCipher, PseudoRandomGenerator
+
+
+def scalar_states(seed, count):
+    generator = PseudoRandomGenerator(seed)
+    return [generator.next() for _ in range(count)]
+
+
+@pytest.mark.parametrize('length', [0, 1, 2, 3, 100, LANES - 1, LANES, LANES + 1, 3 * LANES + 17])
+def test_next_states_match_scalar_generator(length):
+    np.testing.assert_array_equal(PseudoRandomGenerator(7).next_states(length), scalar_states(7, length))
+
+
+def test_next_states_continue_the_sequence():
+    generator = PseudoRandomGenerator(11)
+    parts = [generator.next_states(n) for n in (5, 1, LANES + 3, 0, 40)]
+
+    np.testing.assert_array_equal(np.concatenate(parts), scalar_states(11, 5 + 1 + LANES + 3 + 40))
+    # Пакетная генерация сдвигает состояние так же, как скалярная
+    assert generator.next() == scalar_states(11, 5 + 1 + LANES + 3 + 40 + 1)[-1]
+
+
+@pytest.mark.parametrize('steps', [0, 1, 2, 7, 1000, 123457])
+def test_jump_equals_repeated_steps(steps):
+    generator = PseudoRandomGenerator(3)
+    A, C = generator.jump(steps)
+
+    x = 12345
+    expected = x
+    for _ in range(steps):
+        expected = (generator.a * expected + generator.c) % generator.m
+    assert (A * x + C) % generator.m == expected
+
+
+def test_advance_and_seek():
+    states = scalar_states(5, 3000)
+
+    generator = PseudoRandomGenerator(5)
+    generator.advance(1234)
+    assert generator.next() == states[1234]
+
+    generator.seek(2999)
+    assert generator.next() == states[2999]
+    generator.seek(0)
+    assert generator.next() == states[0]
+
+    with pytest.raises(ValueError):
+        generator.seek(-1)
+
+
+def test_non_power_of_two_modulus_uses_uint64_path():
+    generator = PseudoRandomGenerator(9)
+    generator.m = 2 ** 31 - 1
+    reference = PseudoRandomGenerator(9)
+    reference.m = generator.m
+
+    np.testing.assert_array_equal(generator.next_states(LANES + 5), [reference.next() for _ in range(LANES + 5)])
+
+
+def test_gamma_matches_next_byte_and_round_trips():
+    cipher = GammaCipher(42)
+    reference = PseudoRandomGenerator(42)
+    text = "Шифр гаммирования: XOR с гаммой LCG" * 50
+
+    ciphertext, gamma = cipher.encrypt(text)
+
+    assert gamma.tolist() == [reference.next_byte() for _ in range(len(gamma))]
+    assert GammaCipher(42).decrypt(ciphertext, gamma) == text
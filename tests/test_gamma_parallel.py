@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+pytest.importorskip('numpy')
+
+import gamma
+from gamma import GammaCipher
+
+DATA = os.urandom(50_000)
+
+
+@pytest.fixture
+def small_ranges(monkeypatch):
+    # Несколько процессов и на небольших данных
+    monkeypatch.setattr(gamma, 'PARALLEL_MIN_SIZE', 4096)
+
+
+def test_crypt_range_is_seekable():
+    whole = GammaCipher(3).crypt_range(DATA)
+    for offset in (0, 1, 4095, 4096, 33_333):
+        assert GammaCipher(3).crypt_range(DATA[offset:offset + 1000], offset) == whole[offset:offset + 1000]
+
+
+@pytest.mark.parametrize('processes', [1, 2, 3])
+def test_parallel_matches_serial(small_ranges, processes):
+    expected = GammaCipher(3).crypt_range(DATA[100:], 100)
+    assert GammaCipher(3).crypt_parallel(DATA[100:], processes, offset=100) == expected
+
+
+def test_parallel_file_round_trip(small_ranges, tmp_path):
+    source, encrypted, decrypted = (str(tmp_path / name) for name in ('plain', 'enc', 'dec'))
+    with open(source, 'wb') as f:
+        f.write(DATA)
+
+    assert GammaCipher(3).crypt_file_parallel(source, encrypted, processes=3, chunk_size=1000) == len(DATA)
+    GammaCipher(3).crypt_file_parallel(encrypted, decrypted, processes=2)
+
+    with open(encrypted, 'rb') as f:
+        assert f.read() == GammaCipher(3).crypt_range(DATA)
+    with open(decrypted, 'rb') as f:
+        assert f.read() == DATA
+
+
+def test_small_inputs_skip_the_pool(monkeypatch, tmp_path):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("пул процессов не нужен")
+    monkeypatch.setattr(gamma, 'ProcessPoolExecutor', no_pool)
+
+    cipher = GammaCipher(3)
+    assert cipher.crypt_parallel(b'', 4) == b''
+    assert cipher.crypt_parallel(DATA, 4, offset=7) == cipher.crypt_range(DATA, 7)
+
+    source, destination = str(tmp_path / 'plain'), str(tmp_path / 'enc')
+    with open(source, 'wb') as f:
+        f.write(DATA)
+    assert cipher.crypt_file_parallel(source, destination, processes=4) == len(DATA)
+    with open(destination, 'rb') as f:
+        assert f.read() == cipher.crypt_range(DATA)
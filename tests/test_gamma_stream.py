@@ -0,0 +1,63 @@
+import io
+import os
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from gamma import GammaCipher
+
+DATA = os.urandom(10_000)
+
+
+def reference(seed, data):
+    return GammaCipher(seed).crypt_range(data)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096, 1 << 20])
+def test_stream_matches_whole_buffer_and_round_trips(chunk_size):
+    encrypted = io.BytesIO()
+    assert GammaCipher(5).crypt_stream(io.BytesIO(DATA), encrypted, chunk_size) == len(DATA)
+    assert encrypted.getvalue() == reference(5, DATA)
+
+    decrypted = io.BytesIO()
+    GammaCipher(5).decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, chunk_size)
+    assert decrypted.getvalue() == DATA
+
+
+def test_stream_with_offset_and_length():
+    destination = io.BytesIO()
+    processed = GammaCipher(5).crypt_stream(io.BytesIO(DATA[3000:]), destination, 1000, offset=3000, length=2500)
+
+    assert processed == 2500
+    assert destination.getvalue() == reference(5, DATA)[3000:5500]
+
+
+def test_chunks_keep_the_keystream_position():
+    chunks = [DATA[:1], bytearray(DATA[1:4000]), DATA[4000:4000], DATA[4000:]]
+
+    out = list(GammaCipher(5).crypt_chunks(chunks))
+
+    assert b''.join(out) == reference(5, DATA)
+    # bytearray шифруется на месте
+    assert out[1] is chunks[1]
+
+
+def test_file_round_trip(tmp_path):
+    source, encrypted, decrypted = (str(tmp_path / name) for name in ('plain', 'enc', 'dec'))
+    with open(source, 'wb') as f:
+        f.write(DATA)
+
+    assert GammaCipher(9).crypt_file(source, encrypted, chunk_size=999) == len(DATA)
+    GammaCipher(9).crypt_file(encrypted, decrypted)
+
+    with open(encrypted, 'rb') as f:
+        assert f.read() == reference(9, DATA)
+    with open(decrypted, 'rb') as f:
+        assert f.read() == DATA
+
+
+def test_empty_input():
+    destination = io.BytesIO()
+    assert GammaCipher().crypt_stream(io.BytesIO(), destination) == 0
+    assert destination.getvalue() == b''
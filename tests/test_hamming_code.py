@@ -0,0 +1,87 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from hamming_code import CLEAN, CORRECTED, UNCORRECTABLE, HammingCode
+
+
+def all_words(l):
+    """Все 2^l информационных слов длины l (строки матрицы)"""
+    values = np.arange(2 ** l)
+    return ((values[:, np.newaxis] >> np.arange(l)) & 1).astype(np.uint8)
+
+
+@pytest.mark.parametrize('r, l', [(3, 4), (4, 11), (4, 7)])
+def test_encoded_blocks_have_zero_syndrome(r, l):
+    for extended in (False, True):
+        code = HammingCode(r, l, extended)
+        data = all_words(l)
+        blocks = code.encode_blocks(data)
+
+        assert blocks.shape == (len(data), code.length)
+        decoded, statuses, report = code.decode_blocks(blocks)
+        np.testing.assert_array_equal(decoded, data)
+        assert (statuses == CLEAN).all()
+        assert report == {'clean': len(data), 'corrected': 0, 'uncorrectable': 0}
+
+
+@pytest.mark.parametrize('extended', [False, True])
+def test_every_single_error_is_corrected(extended):
+    code = HammingCode(4, 11, extended)
+    data = all_words(11)[::7]
+    blocks = code.encode_blocks(data)
+
+    for position in range(code.length):
+        received = blocks.copy()
+        received[:, position] ^= 1
+        decoded, statuses, _ = code.decode_blocks(received)
+
+        np.testing.assert_array_equal(decoded, data)
+        assert (statuses == CORRECTED).all()
+
+
+def test_secded_detects_every_double_error():
+    code = HammingCode(3, 4, extended=True)
+    data = all_words(4)
+    blocks = code.encode_blocks(data)
+
+    for first, second in combinations(range(code.length), 2):
+        received = blocks.copy()
+        received[:, [first, second]] ^= 1
+        _, statuses, report = code.decode_blocks(received)
+
+        assert (statuses == UNCORRECTABLE).all()
+        assert report['uncorrectable'] == len(data)
+
+
+def test_status_tables():
+    plain = HammingCode(3, 4)
+    assert plain.get_status(0) == CLEAN
+    assert all(plain.get_status(s) == CORRECTED for s in range(1, 8))
+
+    secded = HammingCode(3, 4, extended=True)
+    assert secded.get_status(0) == CLEAN
+    # Старший бит синдрома - общая чётность: нечётное число ошибок исправимо
+    assert all(secded.get_status(8 | s) == CORRECTED for s in range(8))
+    assert all(secded.get_status(s) == UNCORRECTABLE for s in range(1, 8))
+
+
+def test_string_api_matches_block_api():
+    code = HammingCode(4, 11, extended=True)
+    word = '10110011101'
+    encoded = code.encode(word)
+
+    assert encoded == code._to_string(code.encode_blocks(code._to_array(word)[np.newaxis, :])[0])
+    assert code.calculate_syndrome(encoded) == 0
+
+    received = encoded[:5] + ('1' if encoded[5] == '0' else '0') + encoded[6:]
+    syndrome = code.calculate_syndrome(received)
+    assert code.get_status(syndrome) == CORRECTED
+    assert code.correct_error(received, syndrome) == encoded
+    assert code.decode(encoded) == word
+
+
+def test_parity_positions():
+    assert HammingCode(3, 4).get_parity_positions() == [1, 2, 4]
+    assert HammingCode(3, 4, extended=True).get_parity_positions() == [1, 2, 4, 8]
@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+
+def run_pr6(code, cwd):
+    """Выполняет code в отдельном интерпретаторе с окружением run.py pr6/main.py"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / 'pr6'), str(ROOT)]))
+    return subprocess.run([sys.executable, '-B', '-c', code], cwd=cwd, env=env,
+                          capture_output=True, text=True, check=True).stdout
+
+
+def test_import_does_not_load_plotting(tmp_path):
+    output = run_pr6("import sys, main; print('matplotlib' in sys.modules, 'numpy' in sys.modules)", tmp_path)
+    assert output.split() == ['False', 'False']
+
+
+def test_csv_output_skips_plotting(tmp_path):
+    (tmp_path / 'pr6').mkdir()
+    output = run_pr6(
+        "import sys, main\n"
+        "main.compare_algorithms(num_runs_per_setting=1, seed=1, results_path='run.json',"
+        " store_path=None, output='csv')\n"
+        "print('matplotlib' in sys.modules)",
+        tmp_path
+    )
+
+    assert output.split()[-1] == 'False'
+    records = json.loads((tmp_path / 'run.json').read_text(encoding='utf-8'))['records']
+    assert {record['param'] for record in records} == {'test_count', 'max_number', 'iterations'}
+    assert (tmp_path / 'run.csv').exists()
+    assert not (tmp_path / 'pr6' / 'prime_tests_parameter_dependency.png').exists()
+
+
+def test_png_output_saves_figure_without_window(pr6_main, tmp_path, monkeypatch):
+    pytest.importorskip('matplotlib')
+    import plots
+    import matplotlib.pyplot as plt
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'pr6').mkdir()
+    monkeypatch.setattr(plt, 'show', lambda *args, **kwargs: pytest.fail("окно не должно открываться"))
+    plots.use_headless_backend()
+
+    names = ['a', 'b']
+    series = {name: [1.0, 2.0] for name in names}
+    plots.plot_parameter_dependencies([1, 2], series, series, series, [1, 2], series, series, series,
+                                      [1, 2], series, series, series, names, show=False)
+    plt.close('all')
+
+    assert (tmp_path / 'pr6' / 'prime_tests_parameter_dependency.png').stat().st_size > 0
+
+
+def test_unknown_output_format(pr6_main):
+    with pytest.raises(ValueError):
+        pr6_main.compare_algorithms(output='svg')
@@ -0,0 +1,121 @@
+import io
+import os
+
+import pytest
+
+pytest.importorskip('cryptography')
+
+import hybrid
+from hybrid import CHUNK, HEADER, CustomKeyWrap, LibraryKeyWrap, decrypt_stream, encrypt_stream
+from rsa import RSAKeypair, get_backend
+
+CHUNK_SIZE = 1000
+
+
+@pytest.fixture(scope='module')
+def library_key():
+    crypto = get_backend('cryptography')
+    return crypto.rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(params=['custom', 'library'])
+def key_wrap(request, rsa_keypair, library_key):
+    if request.param == 'custom':
+        return CustomKeyWrap(rsa_keypair)
+    return LibraryKeyWrap(library_key)
+
+
+def encrypt(data, key_wrap, chunk_size=CHUNK_SIZE):
+    destination = io.BytesIO()
+    assert encrypt_stream(io.BytesIO(data), destination, key_wrap, chunk_size) == len(data)
+    return destination.getvalue()
+
+
+def decrypt(ciphertext, key_wrap):
+    destination = io.BytesIO()
+    total = decrypt_stream(io.BytesIO(ciphertext), destination, key_wrap)
+    assert total == len(destination.getvalue())
+    return destination.getvalue()
+
+
+def chunk_offsets(ciphertext):
+    """Смещения заголовков блоков в шифротексте"""
+    _, _, _, wrapped_size = HEADER.unpack_from(ciphertext)
+    offset = HEADER.size + wrapped_size + hybrid.NONCE_PREFIX_BYTES
+    offsets = []
+    while offset < len(ciphertext):
+        offsets.append(offset)
+        _, size = CHUNK.unpack_from(ciphertext, offset)
+        offset += CHUNK.size + size
+    return offsets
+
+
+@pytest.mark.parametrize('size', [0, 1, CHUNK_SIZE - 1, CHUNK_SIZE, CHUNK_SIZE + 1, 5 * CHUNK_SIZE + 7])
+def test_round_trip(key_wrap, size):
+    data = os.urandom(size)
+    assert decrypt(encrypt(data, key_wrap), key_wrap) == data
+
+
+def test_each_encryption_uses_a_fresh_key(key_wrap):
+    data = b'same data' * 100
+    assert encrypt(data, key_wrap) != encrypt(data, key_wrap)
+
+
+def test_flipped_byte_is_detected(key_wrap):
+    ciphertext = encrypt(os.urandom(3 * CHUNK_SIZE), key_wrap)
+    _, _, _, wrapped_size = HEADER.unpack_from(ciphertext)
+    # Байт шифротекста каждого блока, обёрнутого ключа и префикса nonce
+    positions = [offset + CHUNK.size + 10 for offset in chunk_offsets(ciphertext)]
+    positions += [HEADER.size + 3, HEADER.size + wrapped_size]
+
+    for position in positions:
+        damaged = bytearray(ciphertext)
+        damaged[position] ^= 1
+        with pytest.raises(ValueError):
+            decrypt(bytes(damaged), key_wrap)
+
+
+def test_reordered_chunks_are_detected(key_wrap):
+    ciphertext = encrypt(os.urandom(3 * CHUNK_SIZE), key_wrap)
+    first, second, third = chunk_offsets(ciphertext)
+    swapped = ciphertext[:first] + ciphertext[second:third] + ciphertext[first:second] + ciphertext[third:]
+
+    with pytest.raises(ValueError):
+        decrypt(swapped, key_wrap)
+
+
+def test_truncation_is_detected(key_wrap):
+    ciphertext = encrypt(os.urandom(3 * CHUNK_SIZE), key_wrap)
+    last = chunk_offsets(ciphertext)[-1]
+
+    for cut in (ciphertext[:last], ciphertext[:-1], ciphertext[:HEADER.size - 2]):
+        with pytest.raises(ValueError):
+            decrypt(cut, key_wrap)
+
+
+def test_wrong_scheme_and_missing_private_key(rsa_keypair, library_key):
+    ciphertext = encrypt(b'data', CustomKeyWrap(rsa_keypair))
+    with pytest.raises(ValueError):
+        decrypt(ciphertext, LibraryKeyWrap(library_key))
+
+    public_only = CustomKeyWrap(RSAKeypair(rsa_keypair.n, rsa_keypair.e, None))
+    with pytest.raises(ValueError):
+        decrypt(ciphertext, public_only)
+
+    ciphertext = encrypt(b'data', LibraryKeyWrap(public_key=library_key.public_key()))
+    with pytest.raises(ValueError):
+        decrypt(ciphertext, LibraryKeyWrap(public_key=library_key.public_key()))
+    assert decrypt(ciphertext, LibraryKeyWrap(library_key)) == b'data'
+
+
+def test_file_round_trip(tmp_path, rsa_keypair):
+    source, encrypted, decrypted = (str(tmp_path / name) for name in ('plain', 'enc', 'dec'))
+    data = os.urandom(100_000)
+    with open(source, 'wb') as f:
+        f.write(data)
+
+    key_wrap = CustomKeyWrap(rsa_keypair, 'montgomery')
+    assert hybrid.encrypt_file(source, encrypted, key_wrap, chunk_size=4096) == len(data)
+    assert hybrid.decrypt_file(encrypted, decrypted, key_wrap) == len(data)
+    with open(decrypted, 'rb') as f:
+        assert f.read() == data
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from error_simulator import ErrorSimulator
+from hamming_code import CORRECTED, HammingCode
+from interleaver import BlockInterleaver
+
+
+@pytest.mark.parametrize('depth, count', [(1, 5), (4, 8), (4, 10), (7, 3)])
+def test_round_trip(depth, count):
+    rng = np.random.default_rng(depth * 100 + count)
+    blocks = rng.integers(0, 2, size=(count, 15), dtype=np.uint8)
+    interleaver = BlockInterleaver(depth)
+
+    stream = interleaver.interleave(blocks)
+
+    assert stream.size == (count + -count % depth) * 15
+    np.testing.assert_array_equal(interleaver.deinterleave(stream, 15, count), blocks)
+
+
+def test_stream_is_read_by_columns():
+    blocks = np.array([[1, 1, 1], [0, 0, 0]], dtype=np.uint8)
+    np.testing.assert_array_equal(BlockInterleaver(2).interleave(blocks), [1, 0, 1, 0, 1, 0])
+
+
+def test_burst_up_to_depth_becomes_single_errors():
+    code = HammingCode(4, 11)
+    depth = 8
+    rng = np.random.default_rng(3)
+    data = rng.integers(0, 2, size=(32, 11), dtype=np.uint8)
+    interleaver = BlockInterleaver(depth)
+    stream = interleaver.interleave(code.encode_blocks(data))
+
+    for start in range(0, stream.size - depth, 37):
+        damaged = stream.copy()
+        damaged[start:start + depth] ^= 1
+        received = interleaver.deinterleave(damaged, code.length, len(data))
+
+        # Не больше одной ошибки на кодовое слово - все исправимы
+        assert ((received != code.encode_blocks(data)).sum(axis=1) <= 1).all()
+        decoded, statuses, _ = code.decode_blocks(received)
+        np.testing.assert_array_equal(decoded, data)
+        assert (statuses == CORRECTED).sum() == depth
+
+
+def test_make_bursts_flips_exact_positions():
+    stream = np.zeros(100, dtype=np.uint8)
+    damaged, starts = ErrorSimulator.make_bursts(stream, 3, 5, np.random.default_rng(0))
+
+    expected = np.zeros(100, dtype=np.uint8)
+    expected[np.unique((starts[:, np.newaxis] + np.arange(5)).ravel())] = 1
+    np.testing.assert_array_equal(damaged, expected)
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        BlockInterleaver(0)
+    with pytest.raises(ValueError):
+        BlockInterleaver(4).deinterleave(np.zeros(10, dtype=np.uint8), 3)
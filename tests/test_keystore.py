@@ -0,0 +1,100 @@
+import os
+import stat
+
+import pytest
+
+from keystore import KeyStore, dump_keypair, key_fingerprint, load_keypair
+from rsa import RSA, RSAKeypair
+
+
+@pytest.fixture
+def store(tmp_path):
+    return KeyStore(str(tmp_path / 'keys'), cache_size=2)
+
+
+def same_keys(a, b):
+    fields = ('n', 'e', 'd', 'p', 'q', 'dP', 'dQ', 'qInv')
+    return all(getattr(a, field) == getattr(b, field) for field in fields)
+
+
+def test_dump_and_load_round_trip(rsa_keypair):
+    restored = load_keypair(dump_keypair(rsa_keypair))
+    assert same_keys(restored, rsa_keypair)
+
+    public_only = RSAKeypair(rsa_keypair.n, rsa_keypair.e, rsa_keypair.d)
+    restored = load_keypair(dump_keypair(public_only))
+    assert same_keys(restored, public_only) and not restored.has_crt
+
+
+def test_truncated_or_foreign_data(rsa_keypair):
+    data = dump_keypair(rsa_keypair)
+    with pytest.raises(ValueError):
+        load_keypair(data[:len(data) // 2])
+    with pytest.raises(ValueError):
+        load_keypair(b'NOTAKEY!' + data[8:])
+
+
+def test_store_round_trip(store, rsa_keypair):
+    key_id = store.save(rsa_keypair)
+    assert key_id == key_fingerprint(rsa_keypair)
+    assert key_id in store and store.ids() == [key_id]
+
+    fresh = KeyStore(store.directory)
+    restored = fresh.load(key_id)
+    assert same_keys(restored, rsa_keypair)
+    assert fresh.load(key_id) is restored
+
+    c = RSA.encrypt(b'keystore', rsa_keypair.e, rsa_keypair.n)
+    assert RSA.decrypt_crt(c, restored, 'montgomery') == b'keystore'
+
+
+def test_key_file_is_private(store, rsa_keypair):
+    old_umask = os.umask(0o022)
+    try:
+        key_id = store.save(rsa_keypair, 'private')
+    finally:
+        os.umask(old_umask)
+    mode = stat.S_IMODE(os.stat(os.path.join(store.directory, key_id + '.key')).st_mode)
+    assert mode == 0o600
+
+
+def test_stale_temp_file_is_replaced(store, rsa_keypair):
+    stale = os.path.join(store.directory, 'key.key.tmp')
+    with open(stale, 'wb') as f:
+        f.write(b'garbage')
+
+    store.save(rsa_keypair, 'key')
+
+    assert not os.path.exists(stale)
+    assert same_keys(KeyStore(store.directory).load('key'), rsa_keypair)
+
+
+def test_cache_is_bounded(store, rsa_keypair):
+    for key_id in ('a', 'b', 'c'):
+        store.save(rsa_keypair, key_id)
+    assert list(store._cache) == ['b', 'c']
+
+
+def test_delete_and_missing_keys(store, rsa_keypair):
+    store.save(rsa_keypair, 'gone')
+    store.delete('gone')
+    assert 'gone' not in store
+    with pytest.raises(KeyError):
+        store.load('gone')
+    with pytest.raises(KeyError):
+        store.delete('gone')
+
+
+@pytest.mark.parametrize('key_id', ['../escape', '.hidden', 'a/b', ''])
+def test_invalid_key_ids(store, key_id):
+    with pytest.raises(ValueError):
+        store.load(key_id)
+
+
+def test_load_or_generate(store, monkeypatch, rsa_keypair):
+    monkeypatch.setattr(RSA, 'generate_keys', staticmethod(lambda bits, processes=None: rsa_keypair))
+    generated = store.load_or_generate('main', 512)
+    assert same_keys(generated, rsa_keypair)
+
+    monkeypatch.setattr(RSA, 'generate_keys', staticmethod(lambda bits, processes=None: pytest.fail("ключ уже есть")))
+    assert KeyStore(store.directory).load_or_generate('main', 512).n == rsa_keypair.n
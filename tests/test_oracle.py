@@ -0,0 +1,64 @@
+import bisect
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from oracle import BLOCK_BYTES, PrimeOracle
+from sieve import segmented_sieve
+
+LIMIT = 300_000
+PRIMES = list(segmented_sieve(LIMIT))
+PRIME_SET = set(PRIMES)
+
+
+@pytest.fixture(scope='module')
+def oracle(tmp_path_factory):
+    path = tmp_path_factory.mktemp('oracle') / 'primes.bin'
+    # Маленькие сегменты: границы сегментов и байтов не совпадают
+    with PrimeOracle.build(str(path), LIMIT, segment_size=1001) as oracle:
+        yield oracle
+
+
+def test_is_prime_matches_sieve(oracle):
+    assert [n for n in range(LIMIT + 1) if n in oracle] == PRIMES
+
+
+def test_prime_pi_matches_sieve(oracle):
+    # Все границы блоков префиксных сумм и их окрестности
+    block_numbers = 2 * 8 * BLOCK_BYTES
+    points = {n + delta for n in range(0, LIMIT, block_numbers) for delta in range(-17, 18)}
+    points |= set(range(0, 100)) | {LIMIT}
+    for n in sorted(p for p in points if 0 <= p <= LIMIT):
+        assert oracle.prime_pi(n) == bisect.bisect_right(PRIMES, n), n
+
+
+def test_prime_count(oracle):
+    assert oracle.prime_count(0, LIMIT + 1) == len(PRIMES)
+    assert oracle.prime_count(100, 200) == sum(1 for p in PRIMES if 100 <= p < 200)
+    assert oracle.prime_count(10, 10) == 0
+
+
+def test_numbers_above_limit_are_rejected(oracle):
+    with pytest.raises(ValueError):
+        oracle.is_prime(LIMIT + 1)
+    with pytest.raises(ValueError):
+        oracle.prime_pi(LIMIT + 1)
+
+
+def test_ensure_reuses_and_extends(tmp_path):
+    path = str(tmp_path / 'primes.bin')
+    with PrimeOracle.ensure(path, 1000) as oracle:
+        assert oracle.limit == 1000
+    with PrimeOracle.ensure(path, 500) as oracle:
+        assert oracle.limit == 1000
+    with PrimeOracle.ensure(path, 5000) as oracle:
+        assert oracle.limit == 5000
+        assert oracle.prime_pi(5000) == 669
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / 'not_oracle.bin'
+    path.write_bytes(b'\x00' * 64)
+    with pytest.raises(ValueError):
+        PrimeOracle(str(path))
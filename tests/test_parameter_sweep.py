@@ -0,0 +1,39 @@
+import pytest
+
+
+@pytest.fixture
+def sweep(pr6_main, tmp_path):
+    tests = [('Пробное деление', pr6_main.trial_division), ('Рабин-Миллер', pr6_main.miller_rabin_test)]
+
+    def run(processes, **kwargs):
+        return pr6_main.run_parameter_sweep(
+            'max_number', [50, 500], 20, 100, 5, tests, 1,
+            processes=processes, seed=7, oracle_path=str(tmp_path / 'oracle.bin'), **kwargs
+        )
+
+    return run
+
+
+def test_pool_gives_same_results_as_serial_run(sweep):
+    serial_accuracy, serial_time, _ = sweep(processes=None)
+    pool_accuracy, pool_time, _ = sweep(processes=2)
+
+    assert pool_accuracy == serial_accuracy
+    assert serial_accuracy['Пробное деление'] == [100.0, 100.0]
+    assert all(len(values) == 2 for values in pool_time.values())
+
+
+def test_records_follow_parameter_order(sweep):
+    records = []
+    sweep(processes=2, records=records)
+
+    assert [(record['algorithm'], record['value']) for record in records] == [
+        ('Пробное деление', 50), ('Рабин-Миллер', 50),
+        ('Пробное деление', 500), ('Рабин-Миллер', 500),
+    ]
+    assert all(record['param'] == 'max_number' and record['test_count'] == 20 for record in records)
+
+
+def test_unknown_parameter(pr6_main, tmp_path):
+    with pytest.raises(ValueError):
+        pr6_main.run_parameter_sweep('depth', [1], 10, 100, 5, [], 1, oracle_path=str(tmp_path / 'oracle.bin'))
@@ -0,0 +1,60 @@
+import csv
+import json
+
+import pytest
+
+from conftest import load_script
+
+
+@pytest.fixture(scope='module')
+def benchmark():
+    return load_script('pr6/benchmark.py', 'pr6_benchmark')
+
+
+def test_summarize(benchmark):
+    summary = benchmark.summarize([4_000_000, 1_000_000, 3_000_000, 2_000_000, 5_000_000])
+
+    assert summary['median_ms'] == 3.0
+    assert summary['q1_ms'] == 2.0
+    assert summary['q3_ms'] == 4.0
+    assert summary['iqr_ms'] == 2.0
+    assert summary['min_ms'] == 1.0
+
+
+def test_summarize_single_sample(benchmark):
+    summary = benchmark.summarize([1_500_000])
+    assert summary['median_ms'] == summary['q1_ms'] == summary['q3_ms'] == 1.5
+    assert summary['iqr_ms'] == 0
+
+
+def test_measure_runs_warmup_repeats_and_memory_pass(benchmark):
+    calls = []
+
+    summary = benchmark.measure(lambda x: calls.append(x) or len(calls), 'x', repeats=4, warmup=2)
+
+    # 2 прогревочных, 4 замера, 1 проход для памяти
+    assert len(calls) == 7
+    assert summary['results'] == [3, 4, 5, 6]
+    assert len(summary['samples_ns']) == 4
+    assert summary['memory_kb'] >= 0
+
+
+def test_measure_memory_sees_allocations(benchmark):
+    assert benchmark.measure_memory(lambda: bytearray(1 << 20)) >= 1024
+
+
+def test_save_results_and_csv(benchmark, tmp_path):
+    records = [{'algorithm': 'a', 'median_ms': 1.0, 'samples_ns': [1]}, {'algorithm': 'b', 'accuracy': 99.0}]
+
+    benchmark.save_results(str(tmp_path / 'run.json'), records, seed=42)
+    benchmark.save_csv(str(tmp_path / 'run.csv'), records)
+
+    saved = json.loads((tmp_path / 'run.json').read_text(encoding='utf-8'))
+    assert saved['records'] == records
+    assert saved['params'] == {'seed': 42}
+    assert {'timestamp', 'python', 'cpu_count'} <= saved['machine'].keys()
+
+    with open(tmp_path / 'run.csv', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == ['algorithm', 'median_ms', 'accuracy']
+    assert [row['algorithm'] for row in rows] == ['a', 'b']
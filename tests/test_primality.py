@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from common.primality import (
+    DETERMINISTIC_BASES, SMALL_PRIME_LIMIT, decompose, deterministic_bases, is_prime,
+    strong_probable_prime, trial_division_check,
+)
+from sieve import segmented_sieve
+
+LIMIT = 200_000
+PRIMES = set(segmented_sieve(LIMIT))
+
+# Сильные псевдопростые: каждое проходит все основания предыдущего набора DETERMINISTIC_BASES
+STRONG_PSEUDOPRIMES = [2047, 1373653, 25326001, 3215031751, 2152302898747,
+                       3474749660383, 341550071728321, 3825123056546413051]
+
+LARGE_PRIMES = [2 ** 61 - 1, 2 ** 64 - 59, 2 ** 89 - 1, 2 ** 127 - 1]
+LARGE_COMPOSITES = [2 ** 67 - 1, (2 ** 61 - 1) * (2 ** 31 - 1), (2 ** 89 - 1) ** 2]
+
+
+def test_matches_sieve():
+    assert [n for n in range(LIMIT + 1) if is_prime(n)] == sorted(PRIMES)
+
+
+def test_trial_division_decides_small_numbers():
+    for n in range(SMALL_PRIME_LIMIT):
+        assert trial_division_check(n) == (n in PRIMES)
+    assert trial_division_check(997 * 991) is False
+    assert trial_division_check(1009 * 1013) is None
+
+
+@pytest.mark.parametrize('n', STRONG_PSEUDOPRIMES)
+def test_strong_pseudoprimes_are_rejected(n):
+    assert not is_prime(n)
+
+
+def test_pseudoprimes_fool_the_previous_base_set():
+    # Без полного набора оснований для своей границы каждое из чисел прошло бы проверку
+    for n, (_, bases) in zip(STRONG_PSEUDOPRIMES, DETERMINISTIC_BASES):
+        d, s = decompose(n)
+        assert all(strong_probable_prime(n, a, d, s) for a in bases)
+        assert len(deterministic_bases(n)) > len(bases)
+
+
+@pytest.mark.parametrize('n', LARGE_PRIMES)
+def test_large_primes(n):
+    assert is_prime(n, rng=random.Random(1))
+
+
+@pytest.mark.parametrize('n', LARGE_COMPOSITES)
+def test_large_composites(n):
+    assert not is_prime(n, rng=random.Random(1))
+
+
+def test_deterministic_bases_cover_64_bits():
+    assert deterministic_bases(2 ** 64 - 1) is not None
+    assert deterministic_bases(2 ** 64) is None
+
+
+def test_decompose():
+    for n in (3, 5, 17, 2047, 2 ** 64 - 59):
+        d, s = decompose(n)
+        assert d % 2 == 1 and d << s == n - 1
+
+
+def test_pr6_miller_rabin_runs_k_rounds(pr6_main, monkeypatch):
+    calls = []
+    monkeypatch.setattr(pr6_main, 'strong_probable_prime', lambda n, a, d, s: calls.append(a) or True)
+
+    assert pr6_main.miller_rabin_test(10007, 7)
+    assert len(calls) == 7
+    assert all(2 <= a <= 10005 for a in calls)
+
+
+def test_pr6_miller_rabin_agrees_with_is_prime(pr6_main):
+    random.seed(3)
+    assert all(pr6_main.miller_rabin_test(n, 10) == (n in PRIMES) for n in range(5000))
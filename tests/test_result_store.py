@@ -0,0 +1,87 @@
+from result_store import ResultStore, code_version
+
+
+def helper(n):
+    return n + 1
+
+
+def algorithm(n):
+    return helper(n) * 2
+
+
+def other_algorithm(n):
+    return n * 2
+
+
+KEY = ('Рабин-Миллер', 100, 1000, 10, '42', 3, 'abc')
+
+
+def test_round_trip_and_persistence(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    with ResultStore(path) as store:
+        assert store.get(KEY) is None
+        store.put(KEY, {'accuracy': 99.5, 'median_ms': 1.25})
+        assert len(store) == 1
+
+    with ResultStore(path) as store:
+        assert store.get(KEY) == {'accuracy': 99.5, 'median_ms': 1.25}
+        store.put(KEY, {'accuracy': 100.0})
+        assert len(store) == 1
+        assert store.get(KEY) == {'accuracy': 100.0}
+        assert store.get(KEY[:-1] + ('other version',)) is None
+
+
+def test_code_version_follows_called_functions(monkeypatch):
+    version = code_version(algorithm)
+    assert version == code_version(algorithm)
+    assert version != code_version(other_algorithm)
+
+    # Правка вызываемой функции меняет версию вызывающей
+    monkeypatch.setitem(algorithm.__globals__, 'helper', other_algorithm)
+    assert code_version(algorithm) != version
+
+
+def test_sweep_reuses_cached_cells(pr6_main, tmp_path, monkeypatch):
+    tests = [('Пробное деление', pr6_main.trial_division), ('Рабин-Миллер', pr6_main.miller_rabin_test)]
+    oracle_path = str(tmp_path / 'oracle.bin')
+
+    def sweep(store, values):
+        return pr6_main.run_parameter_sweep('max_number', values, 20, 100, 5, tests, 1,
+                                            seed=7, store=store, oracle_path=oracle_path)
+
+    with ResultStore(str(tmp_path / 'results.sqlite')) as store:
+        first = sweep(store, [50, 500])
+        assert len(store) == 4
+
+        # Все ячейки - из хранилища, замеры не запускаются
+        def not_expected(*args):
+            raise AssertionError("ячейка должна браться из хранилища")
+        monkeypatch.setattr(pr6_main, 'run_benchmark_cell', not_expected)
+        assert sweep(store, [50, 500]) == first
+
+        monkeypatch.undo()
+        # Новое значение параметра досчитывает только свои ячейки
+        accuracy, _, _ = sweep(store, [50, 500, 5000])
+        assert len(store) == 6
+        assert accuracy['Пробное деление'] == first[0]['Пробное деление'] + [100.0]
+
+
+def test_sweep_without_seed_does_not_cache(pr6_main, tmp_path):
+    tests = [('Пробное деление', pr6_main.trial_division)]
+    with ResultStore(str(tmp_path / 'results.sqlite')) as store:
+        pr6_main.run_parameter_sweep('max_number', [50], 10, 100, 5, tests, 1,
+                                     store=store, oracle_path=str(tmp_path / 'oracle.bin'))
+        assert len(store) == 0
+
+
+def test_sweep_records_carry_current_parameters(pr6_main, tmp_path):
+    tests = [('Пробное деление', pr6_main.trial_division)]
+    records = []
+    with ResultStore(str(tmp_path / 'results.sqlite')) as store:
+        pr6_main.run_parameter_sweep('iterations', [3, 9], 10, 100, 5, tests, 1, seed=7,
+                                     records=records, store=store,
+                                     oracle_path=str(tmp_path / 'oracle.bin'))
+        # Детерминированный тест считается один раз, вторая ячейка - повтор первой
+        assert len(store) == 1
+    assert [record['iterations'] for record in records] == [3, 9]
+    assert all(record['test_count'] == 10 and record['max_number'] == 100 for record in records)
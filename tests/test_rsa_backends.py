@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import rsa
+from conftest import ROOT
+from rsa import BackendUnavailable, backend_available, get_backend, register_backend
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    for name in ('_BACKEND_LOADERS', '_backends', '_backend_errors'):
+        monkeypatch.setattr(rsa, name, dict(getattr(rsa, name)))
+
+
+def test_loader_runs_once():
+    calls = []
+    register_backend('fake', lambda: calls.append(1) or SimpleNamespace(value=42))
+
+    assert not calls
+    assert get_backend('fake').value == 42
+    assert get_backend('fake') is get_backend('fake')
+    assert len(calls) == 1
+
+
+def test_import_error_is_remembered():
+    calls = []
+
+    def missing():
+        calls.append(1)
+        raise ImportError("No module named 'fake_library'")
+
+    register_backend('missing', missing)
+
+    for _ in range(3):
+        with pytest.raises(BackendUnavailable, match='fake_library'):
+            get_backend('missing')
+    assert not backend_available('missing')
+    assert len(calls) == 1
+    # BackendUnavailable - ImportError, прежние except ImportError продолжают работать
+    assert issubclass(BackendUnavailable, ImportError)
+
+
+def test_reregistering_resets_state():
+    def not_installed():
+        raise ImportError("not yet")
+
+    register_backend('flaky', not_installed)
+    assert not backend_available('flaky')
+
+    register_backend('flaky', lambda: SimpleNamespace(ok=True))
+    assert get_backend('flaky').ok
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_backend('openssl-3')
+
+
+def test_cryptography_available_flag():
+    assert rsa.CRYPTOGRAPHY_AVAILABLE == backend_available('cryptography')
+    with pytest.raises(AttributeError):
+        rsa.NO_SUCH_ATTRIBUTE
+
+
+def test_import_does_not_load_heavy_modules():
+    code = ("import sys, rsa; "
+            "print(*(name in sys.modules for name in "
+            "('cryptography', 'multiprocessing', 'concurrent.futures')))")
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    output = subprocess.run([sys.executable, '-B', '-c', code], cwd=ROOT / 'pr11-12', env=env,
+                            capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ['False', 'False', 'False']
+
+
+def test_cryptography_backend_contents():
+    pytest.importorskip('cryptography')
+    crypto = get_backend('cryptography')
+    for name in ('rsa', 'rsa_padding', 'hashes', 'default_backend', 'AESGCM', 'InvalidTag', 'version'):
+        assert hasattr(crypto, name)
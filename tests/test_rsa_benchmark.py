@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from conftest import load_script
+from rsa import EXPONENTIATION_METHODS, backend_available
+
+
+@pytest.fixture(scope='module')
+def benchmark():
+    return load_script('pr11-12/benchmark.py', 'rsa_benchmark')
+
+
+def test_latency_stats(benchmark):
+    stats = benchmark.latency_stats([i * 1_000_000 for i in range(1, 101)])
+
+    assert stats['samples'] == 100
+    assert stats['min_ms'] == 1.0 and stats['max_ms'] == 100.0
+    assert stats['mean_ms'] == pytest.approx(50.5)
+    assert stats['ops_per_sec'] == pytest.approx(1e3 / 50.5)
+    assert stats['p50_ms'] <= stats['p90_ms'] <= stats['p99_ms'] <= stats['max_ms']
+    assert stats['p50_ms'] == pytest.approx(50.5)
+
+
+def test_latency_stats_single_sample(benchmark):
+    stats = benchmark.latency_stats([2_000_000])
+    assert stats['p50_ms'] == stats['p99_ms'] == 2.0
+
+
+def test_sample_ns_counts_repeats(benchmark):
+    calls = []
+    samples = benchmark.sample_ns(lambda: calls.append(1), repeats=4)
+    assert len(samples) == 4 and len(calls) == 5
+
+
+def test_suite_report(benchmark, tmp_path):
+    output = tmp_path / 'suite.json'
+    key_sizes = [256, 1024]
+
+    records = benchmark.benchmark_suite(key_sizes, repeats=2, output=str(output))
+
+    report = json.loads(output.read_text(encoding='utf-8'))
+    assert report['records'] == records
+    assert report['params']['key_sizes'] == key_sizes
+
+    custom = {(r['key_bits'], r['operation'], r['variant']) for r in records if r['backend'] == 'custom'}
+    for key_bits in key_sizes:
+        assert {(key_bits, 'keygen', 'serial'), (key_bits, 'keygen', 'parallel')} <= custom
+        for method in EXPONENTIATION_METHODS:
+            assert {(key_bits, 'encrypt', method), (key_bits, 'decrypt', method),
+                    (key_bits, 'decrypt', f'crt+{method}')} <= custom
+
+    library = {(r['key_bits'], r['operation']) for r in records if r['backend'] == 'cryptography'}
+    skipped = {row['key_bits'] for row in report['skipped']}
+    if backend_available('cryptography'):
+        # Библиотека не создаёт ключи короче 1024 бит
+        assert library == {(1024, 'keygen'), (1024, 'encrypt'), (1024, 'decrypt')}
+        assert skipped == {256}
+    else:
+        assert not library and skipped == set(key_sizes)
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from rsa import LENGTH_PREFIX_BYTES, RSA, PrimeGenerator, XorShiftStarPRNG
+
+
+@pytest.fixture(scope='module')
+def other_keypair():
+    prng = XorShiftStarPRNG(77)
+    return RSA.keypair_from_primes(*(PrimeGenerator.generate_probable_prime(prng, 512) for _ in range(2)))
+
+
+@pytest.mark.parametrize('length', [0, 1, 127 - LENGTH_PREFIX_BYTES, 127 - LENGTH_PREFIX_BYTES + 1, 127, 1000])
+def test_round_trip(rsa_keypair, length):
+    message = os.urandom(length)
+    plain_bytes, cipher_bytes = RSA.block_sizes(rsa_keypair.n)
+
+    ciphertext = RSA.encrypt_blocks(message, rsa_keypair.e, rsa_keypair.n)
+
+    assert len(ciphertext) == -(-(length + LENGTH_PREFIX_BYTES) // plain_bytes) * cipher_bytes
+    assert RSA.decrypt_blocks(ciphertext, rsa_keypair) == message
+
+
+@pytest.mark.parametrize('method', ['binary', 'window', 'montgomery', 'builtin'])
+def test_leading_and_trailing_zeros_survive(rsa_keypair, method):
+    message = b'\x00' * 200 + b'data' + b'\x00' * 200
+    ciphertext = RSA.encrypt_blocks(message, rsa_keypair.e, rsa_keypair.n, method)
+    assert RSA.decrypt_blocks(ciphertext, rsa_keypair, method) == message
+
+
+def test_tampered_block_raises_value_error(rsa_keypair):
+    ciphertext = bytearray(RSA.encrypt_blocks(b'secret' * 50, rsa_keypair.e, rsa_keypair.n))
+    _, cipher_bytes = RSA.block_sizes(rsa_keypair.n)
+
+    # Порча любого блока: расшифрованное число (при этом ключе и сообщении)
+    # не помещается в plain_bytes - ValueError вместо OverflowError
+    for block in range(len(ciphertext) // cipher_bytes):
+        damaged = bytearray(ciphertext)
+        damaged[block * cipher_bytes + 5] ^= 0x40
+        with pytest.raises(ValueError):
+            RSA.decrypt_blocks(bytes(damaged), rsa_keypair)
+
+
+def test_block_not_below_modulus_raises_value_error(rsa_keypair):
+    _, cipher_bytes = RSA.block_sizes(rsa_keypair.n)
+    with pytest.raises(ValueError):
+        RSA.decrypt_blocks(b'\xff' * cipher_bytes, rsa_keypair)
+    with pytest.raises(ValueError):
+        RSA.decrypt_blocks(rsa_keypair.n.to_bytes(cipher_bytes, 'big'), rsa_keypair)
+
+
+def test_wrong_key_raises_value_error(rsa_keypair, other_keypair):
+    ciphertext = RSA.encrypt_blocks(b'for someone else', other_keypair.e, other_keypair.n)
+    with pytest.raises(ValueError):
+        RSA.decrypt_blocks(ciphertext, rsa_keypair)
+
+
+def test_truncated_ciphertext(rsa_keypair):
+    ciphertext = RSA.encrypt_blocks(b'x' * 500, rsa_keypair.e, rsa_keypair.n)
+    _, cipher_bytes = RSA.block_sizes(rsa_keypair.n)
+
+    with pytest.raises(ValueError):
+        RSA.decrypt_blocks(ciphertext[:-1], rsa_keypair)
+    with pytest.raises(ValueError):
+        RSA.decrypt_blocks(ciphertext[:cipher_bytes], rsa_keypair)
+
+
+def test_scheme_is_deterministic(rsa_keypair):
+    # Без дополнения одинаковые сообщения дают одинаковый шифротекст
+    message = b'same message'
+    assert RSA.encrypt_blocks(message, rsa_keypair.e, rsa_keypair.n) == \
+        RSA.encrypt_blocks(message, rsa_keypair.e, rsa_keypair.n)
+
+
+def test_many_messages_keep_order(rsa_keypair):
+    messages = [os.urandom(size) for size in (0, 5, 300, 17, 1000, 1)]
+
+    ciphertexts = RSA.encrypt_many(messages, rsa_keypair.e, rsa_keypair.n, processes=2)
+
+    assert ciphertexts == [RSA.encrypt_blocks(m, rsa_keypair.e, rsa_keypair.n) for m in messages]
+    assert RSA.decrypt_many(ciphertexts, rsa_keypair, processes=2) == messages
+
+
+def test_modulus_too_small():
+    with pytest.raises(ValueError):
+        RSA.block_sizes(255)
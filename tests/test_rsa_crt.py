@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from rsa import EXPONENTIATION_METHODS, RSA, RSAKeypair
+
+
+def test_keypair_parameters(rsa_keypair):
+    k = rsa_keypair
+    assert k.n == k.p * k.q
+    assert k.e * k.d % ((k.p - 1) * (k.q - 1)) == 1
+    assert k.dP == k.d % (k.p - 1) and k.dQ == k.d % (k.q - 1)
+    assert k.qInv * k.q % k.p == 1
+    assert k.has_crt
+
+
+@pytest.mark.parametrize('method', EXPONENTIATION_METHODS)
+def test_crt_decryption_matches_pow(rsa_keypair, method):
+    k = rsa_keypair
+    rng = random.Random(method)
+    # Граничные значения: 0, 1, кратные p и q, n - 1
+    messages = [0, 1, 2, k.p, k.q, 5 * k.q, k.n - 1] + [rng.randrange(k.n) for _ in range(10)]
+
+    for m in messages:
+        c = pow(m, k.e, k.n)
+        assert RSA._decrypt_int(c, k, method) == pow(c, k.d, k.n) == m
+
+
+def test_decrypt_crt_round_trip(rsa_keypair):
+    k = rsa_keypair
+    message = b'CRT: p, q, dP, dQ, qInv'
+    c = RSA.encrypt(message, k.e, k.n)
+
+    assert RSA.decrypt_crt(c, k) == RSA.decrypt(c, k.d, k.n) == message
+
+
+def test_from_crt_keeps_parameters(rsa_keypair):
+    k = rsa_keypair
+    restored = RSAKeypair.from_crt(k.n, k.e, k.d, k.p, k.q, k.dP, k.dQ, k.qInv)
+
+    assert (restored.dP, restored.dQ, restored.qInv) == (k.dP, k.dQ, k.qInv)
+    c = pow(12345, k.e, k.n)
+    assert RSA._decrypt_int(c, restored) == 12345
+
+
+def test_without_primes_falls_back_to_d(rsa_keypair):
+    k = rsa_keypair
+    public_only = RSAKeypair(k.n, k.e, k.d)
+    assert not public_only.has_crt
+    assert RSA._decrypt_int(pow(777, k.e, k.n), public_only) == 777
+
+
+def test_message_must_be_smaller_than_modulus(rsa_keypair):
+    with pytest.raises(ValueError):
+        RSA.encrypt(b'\xff' * 129, rsa_keypair.e, rsa_keypair.n)
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from rsa import EXPONENTIATION_METHODS, MAX_WINDOW, WINDOW_SIZES, ModularExponentiation, MontgomeryContext
+
+rng = random.Random(42)
+CASES = [
+    (0, 0, 7), (5, 0, 7), (0, 5, 7), (3, 1, 7), (2, 10, 1), (7, 3, 2), (10, 20, 16),
+    (rng.getrandbits(64), rng.getrandbits(64), rng.getrandbits(64) | 1),
+    (rng.getrandbits(512), rng.getrandbits(512), rng.getrandbits(512)),
+    (rng.getrandbits(1024), 65537, rng.getrandbits(1024) | 1),
+    (rng.getrandbits(2048), rng.getrandbits(2048), rng.getrandbits(2048) | 1),
+]
+
+
+@pytest.mark.parametrize('method', EXPONENTIATION_METHODS)
+@pytest.mark.parametrize('base, exponent, modulus', CASES)
+def test_methods_match_pow(method, base, exponent, modulus):
+    assert ModularExponentiation.select(method)(base, exponent, modulus) == pow(base, exponent, modulus)
+
+
+@pytest.mark.parametrize('bits', [1, 2, 24, 25, 80, 81, 240, 672, 673, 4096])
+def test_sliding_window_every_width(bits):
+    modulus = random.Random(bits).getrandbits(256) | 1
+    exponent = random.Random(-bits).getrandbits(bits) | 1 << (bits - 1)
+    assert ModularExponentiation.mod_pow_window(3, exponent, modulus) == pow(3, exponent, modulus)
+
+
+def test_window_size_table():
+    for max_bits, width in WINDOW_SIZES:
+        assert ModularExponentiation.window_size(max_bits) == width
+    assert ModularExponentiation.window_size(WINDOW_SIZES[-1][0] + 1) == MAX_WINDOW
+
+
+def test_montgomery_context():
+    modulus = random.Random(1).getrandbits(521) | 1
+    context = MontgomeryContext(modulus)
+    r = 1 << context.r_bits
+
+    assert modulus * context.n_prime % r == r - 1
+    assert context.r2 == r * r % modulus
+
+    a, b = 123456789 ** 5 % modulus, 987654321 ** 7 % modulus
+    product = context.multiply(context.to_montgomery(a), context.to_montgomery(b))
+    assert context.from_montgomery(product) == a * b % modulus
+    assert context.pow(a, 65537) == pow(a, 65537, modulus)
+
+
+def test_montgomery_cache():
+    modulus = (1 << 127) - 1
+    context = MontgomeryContext.for_modulus(modulus)
+    assert MontgomeryContext.for_modulus(modulus) is context
+
+
+@pytest.mark.parametrize('modulus', [0, 1, 2, 10])
+def test_montgomery_rejects_even_or_small_modulus(modulus):
+    with pytest.raises(ValueError):
+        MontgomeryContext(modulus)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        ModularExponentiation.select('fft')
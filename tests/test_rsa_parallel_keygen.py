@@ -0,0 +1,35 @@
+from common.primality import is_prime
+from rsa import PUBLIC_EXPONENT, RSA
+
+
+def check_keypair(keypair, bits):
+    assert keypair.p != keypair.q
+    assert is_prime(keypair.p) and is_prime(keypair.q)
+    assert keypair.p.bit_length() == keypair.q.bit_length() == bits
+    assert (keypair.p - 1) % PUBLIC_EXPONENT and (keypair.q - 1) % PUBLIC_EXPONENT
+    m = 0x1234567
+    assert pow(pow(m, keypair.e, keypair.n), keypair.d, keypair.n) == m
+
+
+def test_parallel_prime_search():
+    p, q = RSA.generate_primes_parallel(128, processes=2, seed=7)
+
+    assert p != q
+    assert is_prime(p) and is_prime(q)
+    assert p.bit_length() == q.bit_length() == 128
+    check_keypair(RSA.keypair_from_primes(p, q), 128)
+
+
+def test_generate_keys_in_processes():
+    check_keypair(RSA.generate_keys(128, processes=2), 128)
+
+
+def test_batch_generation_is_reproducible():
+    first = RSA.generate_keys_batch(96, 3, processes=2, seed=11)
+    second = RSA.generate_keys_batch(96, 3, processes=2, seed=11)
+
+    assert len(first) == 3
+    assert [k.n for k in first] == [k.n for k in second]
+    assert len({k.n for k in first}) == 3
+    for keypair in first:
+        check_keypair(keypair, 96)
@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+from common.primality import is_prime
+import rsa
+from rsa import INCREMENTAL_MIN_BITS, PrimeGenerator, XorShiftStarPRNG
+
+
+def next_prime(n, limit):
+    while n < limit and not is_prime(n):
+        n += 2
+    return n if n < limit else None
+
+
+@pytest.mark.parametrize('bits', [8, INCREMENTAL_MIN_BITS - 1, INCREMENTAL_MIN_BITS, 64, 256, 1024])
+def test_prime_has_exact_bit_length(bits):
+    p = PrimeGenerator.generate_probable_prime(XorShiftStarPRNG(bits), bits)
+    assert p.bit_length() == bits
+    assert is_prime(p)
+
+
+@pytest.mark.parametrize('seed', range(1, 21))
+def test_sieve_returns_first_prime_after_start(seed):
+    bits = 48
+    # Тот же генератор даёт ту же случайную точку старта, что и в поиске
+    base = XorShiftStarPRNG(seed).read_big_int(bits) | 1
+    expected = next_prime(base, 1 << bits)
+
+    p = PrimeGenerator.generate_probable_prime(XorShiftStarPRNG(seed), bits)
+
+    if expected is not None:
+        # Решето не пропускает простых: найдено ближайшее к старту
+        assert p == expected
+    else:
+        assert is_prime(p) and p.bit_length() == bits
+
+
+@pytest.mark.parametrize('window', [1, 3, 16])
+def test_small_windows_give_the_same_prime(monkeypatch, window):
+    # Поиск проходит много окон: остатки при сдвиге окна должны обновляться верно
+    monkeypatch.setattr(rsa, 'SIEVE_WINDOW', window)
+    for seed in range(1, 11):
+        base = XorShiftStarPRNG(seed).read_big_int(40) | 1
+        p = PrimeGenerator.generate_probable_prime(XorShiftStarPRNG(seed), 40)
+        assert p == next_prime(base, 1 << 40)
+
+
+def test_stop_event_interrupts_search():
+    stop = threading.Event()
+    stop.set()
+    assert PrimeGenerator.generate_probable_prime(XorShiftStarPRNG(1), 512, stop) is None
+    assert PrimeGenerator.generate_probable_prime(XorShiftStarPRNG(1), 8, stop) is None
@@ -0,0 +1,37 @@
+import pytest
+
+from sieve import count_primes, segmented_sieve, small_primes
+
+
+def reference_primes(limit):
+    """Простые до limit включительно пробным делением"""
+    return [n for n in range(2, limit + 1) if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+
+
+REFERENCE = reference_primes(5000)
+
+
+@pytest.mark.parametrize('limit', [0, 1, 2, 3, 4, 9, 25, 49, 97, 100, 1000, 4999, 5000])
+def test_segmented_sieve_matches_reference(limit):
+    expected = [p for p in REFERENCE if p <= limit]
+    assert list(segmented_sieve(limit)) == expected
+    assert count_primes(limit) == len(expected)
+
+
+@pytest.mark.parametrize('segment_size', [1, 2, 3, 7, 64, 1000])
+def test_segment_size_does_not_change_result(segment_size):
+    assert list(segmented_sieve(5000, segment_size)) == REFERENCE
+    assert count_primes(5000, segment_size) == len(REFERENCE)
+
+
+def test_parallel_sieve_keeps_order():
+    assert list(segmented_sieve(5000, segment_size=64, processes=2)) == REFERENCE
+
+
+def test_small_primes_are_odd():
+    assert small_primes(2) == []
+    assert small_primes(50) == [p for p in REFERENCE if 2 < p <= 50]
+
+
+def test_known_prime_count():
+    assert count_primes(10 ** 6) == 78498
@@ -0,0 +1,146 @@
+import random
+import threading
+
+import pytest
+
+from upload_benchmark import FakeUploadEndpoint
+from uploader import BACKOFF_BASE, BACKOFF_MAX, UploadEngine, UploadTask, backoff_delay
+
+
+class PermanentError(Exception):
+    pass
+
+
+class ScriptedUpload:
+    """Загрузка, которая бросает ошибки из failures по очереди, затем отвечает успехом"""
+
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.public_ids = []
+
+    def __call__(self, image_name, img_type, path, public_id=None):
+        self.public_ids.append(public_id)
+        if self.failures:
+            raise self.failures.pop(0)
+        return {'public_id': public_id}
+
+
+def make_tasks(count):
+    return [UploadTask(f"./images/{i}.jpg", f"image{i}", "Icon", f"image{i}_Icon") for i in range(count)]
+
+
+def make_engine(upload, **kwargs):
+    delays = []
+    engine = UploadEngine(upload, sleep=delays.append, rng=random.Random(1), **kwargs)
+    return engine, delays
+
+
+def test_transient_errors_are_retried_until_success():
+    upload = ScriptedUpload(ConnectionError("reset"), TimeoutError("timeout"))
+    engine, delays = make_engine(upload, concurrency=1, max_attempts=4)
+    (task,) = make_tasks(1)
+
+    result = engine.upload_one(task)
+
+    assert result.ok
+    assert result.attempts == 3
+    assert result.response == {'public_id': task.public_id}
+    assert len(delays) == 2
+    # Каждая попытка - с тем же public_id
+    assert upload.public_ids == [task.public_id] * 3
+
+
+def test_gives_up_after_max_attempts():
+    upload = ScriptedUpload(*(ConnectionError(str(i)) for i in range(10)))
+    engine, delays = make_engine(upload, concurrency=1, max_attempts=3)
+
+    result = engine.upload_one(make_tasks(1)[0])
+
+    assert not result.ok
+    assert result.attempts == 3
+    assert isinstance(result.error, ConnectionError)
+    assert len(upload.public_ids) == 3
+    # После последней попытки не ждём
+    assert len(delays) == 2
+
+
+def test_permanent_errors_are_not_retried():
+    upload = ScriptedUpload(PermanentError("bad request"))
+    engine, delays = make_engine(upload, concurrency=1, max_attempts=4)
+
+    result = engine.upload_one(make_tasks(1)[0])
+
+    assert not result.ok
+    assert result.attempts == 1
+    assert isinstance(result.error, PermanentError)
+    assert delays == []
+
+
+def test_custom_transient_errors():
+    upload = ScriptedUpload(PermanentError("rate limited"))
+    engine, _ = make_engine(upload, concurrency=1, transient_errors=(PermanentError,))
+
+    result = engine.upload_one(make_tasks(1)[0])
+
+    assert result.ok
+    assert result.attempts == 2
+
+
+def test_results_keep_task_order_under_concurrency():
+    endpoint = FakeUploadEndpoint(latency=0.005, failure_rate=0.3, seed=7)
+    engine, _ = make_engine(endpoint, concurrency=8, max_attempts=20)
+    tasks = make_tasks(60)
+
+    results = engine.upload_all(tasks)
+
+    assert [result.task for result in results] == tasks
+    assert all(result.ok for result in results)
+    assert [result.response['public_id'] for result in results] == [task.public_id for task in tasks]
+    assert endpoint.calls == sum(result.attempts for result in results)
+    assert 1 < endpoint.max_active <= 8
+
+
+def test_concurrency_limit_is_respected():
+    active, peak = 0, 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def upload(image_name, img_type, path, public_id=None):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+            if active == 3:
+                release.set()
+        release.wait(1)
+        with lock:
+            active -= 1
+
+    engine, _ = make_engine(upload, concurrency=3)
+    engine.upload_all(make_tasks(12))
+
+    assert peak == 3
+
+
+@pytest.mark.parametrize('attempt', range(8))
+def test_backoff_delay_stays_within_full_jitter_bounds(attempt):
+    rng = random.Random(attempt)
+    bound = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+
+    delays = [backoff_delay(attempt, rng=rng) for _ in range(500)]
+
+    assert all(0 <= delay <= bound for delay in delays)
+    # Разброс на весь интервал, а не около верхней границы
+    assert min(delays) < bound * 0.1
+    assert max(delays) > bound * 0.9
+
+
+def test_backoff_delay_is_capped():
+    assert backoff_delay(30, base=1.0, cap=2.0, rng=random.Random(0)) <= 2.0
+
+
+def test_invalid_engine_parameters():
+    with pytest.raises(ValueError):
+        UploadEngine(ScriptedUpload(), concurrency=0)
+    with pytest.raises(ValueError):
+        UploadEngine(ScriptedUpload(), max_attempts=0)
@@ -0,0 +1,57 @@
+import struct
+
+import pytest
+
+from rsa import MASK64, XORSHIFT_MULTIPLIER, XorShiftStarPRNG
+
+
+def reference_words(seed, count):
+    """XorShift* по определению: сдвиги 12, 25, 27 и умножение выхода"""
+    x = seed
+    words = []
+    for _ in range(count):
+        x ^= x >> 12
+        x ^= (x << 25) & MASK64
+        x ^= x >> 27
+        words.append(x * XORSHIFT_MULTIPLIER & MASK64)
+    return words
+
+
+def test_single_and_batch_outputs_match_reference():
+    prng = XorShiftStarPRNG(12345)
+    assert [prng.next_xorshift_star() for _ in range(3)] == reference_words(12345, 3)
+    assert prng.next_words(100) == reference_words(12345, 103)[3:]
+
+
+def test_zero_and_wide_seeds():
+    assert XorShiftStarPRNG(0).state == 1
+    assert XorShiftStarPRNG(1 << 64 | 5).state == 5
+
+
+def test_read_bytes_uses_whole_words_little_endian():
+    words = reference_words(99, 3)
+    assert XorShiftStarPRNG(99).read_bytes(20) == struct.pack('<3Q', *words)[:20]
+
+
+def test_fill_writes_the_same_bytes():
+    buffer = bytearray(13)
+    XorShiftStarPRNG(5).fill(buffer)
+    assert bytes(buffer) == XorShiftStarPRNG(5).read_bytes(13)
+
+
+@pytest.mark.parametrize('bits', [1, 7, 8, 9, 63, 64, 65, 512, 1023])
+def test_read_big_int_has_exact_bit_length(bits):
+    prng = XorShiftStarPRNG(bits)
+    assert all(prng.read_big_int(bits).bit_length() == bits for _ in range(20))
+
+
+def test_read_big_int_uses_one_word_per_eight_bytes():
+    prng = XorShiftStarPRNG(3)
+    prng.read_big_int(1024)
+    reference = XorShiftStarPRNG(3)
+    reference.next_words(16)
+    assert prng.state == reference.state
+
+
+def test_read_big_int_zero_bits():
+    assert XorShiftStarPRNG(3).read_big_int(0) == 0